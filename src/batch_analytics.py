@@ -0,0 +1,292 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+import catalog
+from rewards import REWARD_DISPLAY_ORDER
+
+
+# **********************************************************************
+# Aggregate statistics over many exported progress files.
+
+# Usage:
+#   python batch_analytics.py progress_dir/ -o report.json
+#   python batch_analytics.py a.json b.json -j 8
+
+# Progress files are written by "stats_cli.py --export". The catalog is
+# read once, handed to each worker process when the pool starts, and the
+# progress files are then streamed through the pool. Workers only send
+# back a few small values per file, so the parent process can keep up
+# with any number of workers.
+# **********************************************************************
+
+# catalog used by the worker processes, assigned in init_worker()
+worker_catalog = None
+
+
+def init_worker(leveled_data, list_data):
+    """Stores the catalog in a worker process so that it is only sent
+    once per worker instead of once per file.
+    """
+    global worker_catalog
+    worker_catalog = (leveled_data, list_data)
+
+
+def analyze_file(file):
+    """Computes the statistics of a single progress file.
+
+    Runs inside a worker process.
+
+    Ret:
+        (tuple): (file, error, completed, planned, stats). completed and
+            planned are bytes with a 1 for every completed/planned level,
+            in catalog order. stats contains the completed points,
+            achievements per category and rewards. If the file can't be
+            read, error is a message and the other values are None.
+    """
+    leveled_data, list_data = worker_catalog
+    try:
+        progress = catalog.load_progress(file)
+        completed = bytearray()
+        planned = bytearray()
+        # same bookkeeping as catalog.compute_stats(), done in the same pass
+        stat_dict = catalog.new_stat_dict()
+        for (title, level, category, points, reward_amount, reward,
+             is_planned, is_completed) in catalog.iter_achievements(
+                leveled_data, list_data, progress):
+            completed.append(1 if is_completed == 1 else 0)
+            planned.append(1 if is_planned == 1 and is_completed != 1 else 0)
+            catalog.add_achievement_stats(stat_dict, category, points,
+                                          reward_amount, reward, is_planned,
+                                          is_completed)
+        catalog.add_milestone_stats(stat_dict)
+    except (OSError, ValueError, TypeError, AttributeError) as error:
+        return file, f"{type(error).__name__}: {error}", None, None, None
+
+    # only send back what the report needs
+    stats = {
+        "completed_points": stat_dict["completed_points"],
+        "categories": {
+            category: (stat_dict[category + "_completed_achievements"],
+                       stat_dict[category + "_completed_points"])
+            for category in catalog.CATEGORIES
+        },
+        "rewards": {
+            reward: stat_dict["completed_" + reward]
+            for reward in catalog.REWARD_TYPES
+        }
+    }
+    return file, None, bytes(completed), bytes(planned), stats
+
+
+def iter_progress_files(paths):
+    """Yields every progress file in paths. Directories are searched for
+    .json files without reading the whole listing into memory.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".json"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def percentile(values, fraction):
+    """Returns the value at the given fraction of sorted values."""
+    if not values:
+        return 0
+    index = min(int(fraction * len(values)), len(values) - 1)
+    return values[index]
+
+
+class BatchReport():
+    """Accumulates the results of analyze_file() into an aggregate report.
+
+    Args:
+        leveled_data (dict): leveled achievements as read by load_catalog()
+        list_data (dict): list achievements as read by load_catalog()
+    """
+
+    def __init__(self, leveled_data, list_data):
+        # (title, level, category) of every level, in catalog order
+        self.entries = []
+        # maps category to it's possible achievements and points
+        self.possible = {category: [0, 0] for category in catalog.CATEGORIES}
+        # roman numerals of each leveled achievement's levels
+        rom_nums = {
+            achievement["title"]: [lvl["rom_num"]
+                                   for lvl in achievement["levels"]]
+            for achievement in leveled_data["leveled_achievements"]
+        }
+        for (title, level, category, points, reward_amount, reward,
+             is_planned, is_completed) in catalog.iter_achievements(
+                leveled_data, list_data):
+            # list achievements don't have a level
+            rom_num = None if level is None else rom_nums[title][level]
+            self.entries.append((title, rom_num, category))
+            self.possible[category][0] += 1
+            self.possible[category][1] += points
+
+        self.files = 0
+        self.errors = []
+        self.completed_counts = [0] * len(self.entries)
+        self.planned_counts = [0] * len(self.entries)
+        self.category_totals = {
+            category: [0, 0] for category in catalog.CATEGORIES
+        }
+        self.reward_values = {reward: [] for reward in catalog.REWARD_TYPES}
+        self.milestone_counts = {
+            milestone: 0 for milestone in catalog.MILESTONE_POINTS
+        }
+
+    def add(self, result):
+        """Adds a single result returned by analyze_file()."""
+        file, error, completed, planned, stats = result
+        if error is not None:
+            self.errors.append({"file": file, "error": error})
+            return
+        self.files += 1
+
+        completed_counts = self.completed_counts
+        for index, value in enumerate(completed):
+            if value:
+                completed_counts[index] += 1
+        planned_counts = self.planned_counts
+        for index, value in enumerate(planned):
+            if value:
+                planned_counts[index] += 1
+
+        for category, (achievements, points) in stats["categories"].items():
+            self.category_totals[category][0] += achievements
+            self.category_totals[category][1] += points
+        for reward, amount in stats["rewards"].items():
+            self.reward_values[reward].append(amount)
+        milestone = catalog.reached_milestone(stats["completed_points"])
+        self.milestone_counts[milestone] += 1
+
+    def report(self):
+        """Returns the aggregate report as a dictionary that can be written
+        as json. Rates are fractions between 0 and 1.
+        """
+        files = self.files or 1
+
+        achievements = []
+        for (title, rom_num, category), completed, planned in zip(
+                self.entries, self.completed_counts, self.planned_counts):
+            achievements.append({
+                "title": title, "level": rom_num, "category": category,
+                "completion_rate": completed / files,
+                "planned_rate": planned / files
+            })
+
+        categories = {}
+        for category in catalog.CATEGORIES:
+            possible_achievements, possible_points = self.possible[category]
+            completed_achievements, completed_points = \
+                self.category_totals[category]
+            categories[category] = {
+                "achievement_completion_rate":
+                    completed_achievements
+                    / ((possible_achievements or 1) * files),
+                "points_completion_rate":
+                    completed_points / ((possible_points or 1) * files)
+            }
+
+        rewards = {}
+        for reward in REWARD_DISPLAY_ORDER:
+            values = sorted(self.reward_values[reward])
+            rewards[reward] = {
+                "total": sum(values),
+                "mean": sum(values) / files,
+                "min": values[0] if values else 0,
+                "p25": percentile(values, 0.25),
+                "median": percentile(values, 0.5),
+                "p75": percentile(values, 0.75),
+                "max": values[-1] if values else 0
+            }
+
+        return {
+            "files": self.files,
+            "errors": self.errors,
+            "achievements": achievements,
+            "categories": categories,
+            "rewards": rewards,
+            # number of players whose highest reached milestone is the key
+            "milestones": {
+                str(milestone): count
+                for milestone, count in self.milestone_counts.items()
+            }
+        }
+
+
+def run_batch(paths, leveled_data, list_data, processes=None,
+              chunksize=64):
+    """Analyzes every progress file in paths and returns a BatchReport.
+
+    Args:
+        paths (list of strings): progress files or directories of them
+        leveled_data (dict): leveled achievements as read by load_catalog()
+        list_data (dict): list achievements as read by load_catalog()
+        processes (int): number of worker processes. Defaults to the
+            number of CPUs. If 1, files are analyzed in this process.
+        chunksize (int): number of files sent to a worker at a time
+    """
+    batch_report = BatchReport(leveled_data, list_data)
+    files = iter_progress_files(paths)
+
+    if processes == 1:
+        init_worker(leveled_data, list_data)
+        for file in files:
+            batch_report.add(analyze_file(file))
+        return batch_report
+
+    with multiprocessing.Pool(processes, initializer=init_worker,
+                              initargs=(leveled_data, list_data)) as pool:
+        # results are added as soon as they arrive, in any order
+        for result in pool.imap_unordered(analyze_file, files,
+                                          chunksize=chunksize):
+            batch_report.add(result)
+    return batch_report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Aggregate achievement statistics over many exported "
+                    "progress files."
+    )
+    parser.add_argument("paths", nargs="+",
+                        help="progress files or directories of them")
+    parser.add_argument("--leveled", default=catalog.LEVELED_FILE,
+                        help="path to leveled_achievements.json")
+    parser.add_argument("--list", default=catalog.LIST_FILE,
+                        help="path to list_achievements.json")
+    parser.add_argument("-j", "--processes", type=int, default=None,
+                        help="number of worker processes (default: CPUs)")
+    parser.add_argument("--chunksize", type=int, default=64,
+                        help="files sent to a worker at a time")
+    parser.add_argument("-o", "--output",
+                        help="write the report to this file instead of "
+                             "printing it")
+    args = parser.parse_args(argv)
+
+    leveled_data, list_data = catalog.load_catalog(args.leveled, args.list)
+    batch_report = run_batch(args.paths, leveled_data, list_data,
+                             args.processes, args.chunksize)
+    report = batch_report.report()
+
+    if args.output:
+        with open(args.output, 'w') as json_file:
+            json.dump(report, json_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
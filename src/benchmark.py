@@ -0,0 +1,347 @@
+import argparse
+import random
+import sys
+import time
+
+import catalog
+from model import LeveledAttributes, LeveledAchievement, ListAchievement
+from search import INDEX_CHUNK_SIZE, SearchIndex, searchable_text, tokenize
+
+
+# **********************************************************************
+# Benchmarks of the GUI over a long session.
+
+# Usage:
+#   python benchmark.py rows               5000 random checkbox changes
+#   python benchmark.py rows -n 20000      more changes
+#   python benchmark.py rows --seed 3      a different sequence of changes
+#   python benchmark.py search             search a catalog 100x the size
+#   python benchmark.py search --copies 500
+#   python benchmark.py build              fill scrollable frames
+#   python benchmark.py scroll             scroll a long frame repeatedly
+
+# rows: checks and unchecks random achievements (with the occasional undo
+# and redo) like a user would during a long session, and prints how many
+# Tk widgets exist every few hundred changes. Rows are updated in place,
+# so the count should stay flat instead of growing with every change.
+# Before that, prints how long building every row took and how many
+# widgets and canvas items the achievement rows account for, to compare
+# against other versions of the rows. The GUI is created but never
+# shown, and nothing is saved to the json files.
+
+# search: indexes the catalog repeated many times, a chunk at a time like
+# the GUI does, then types every prefix of words from the catalog into
+# the search. Prints the slowest chunk and search, which should stay well
+# under a frame (16 ms). Doesn't need a display.
+
+# build: fills ScrollableFrames with more and more rows of labels, like an
+# info frame, with and without ScrollableFrame.batch(), and prints the
+# time per row at each size. Building is linear in the number of rows if
+# the time per row stays flat as the number of rows grows.
+
+# scroll: sends bursts of mouse wheel events to a ScrollableFrame holding
+# a long list, down and back up, and prints the time between frames of
+# the scroll animation. Scrolling keeps a steady pace if the frame times
+# stay close to FRAME_MS however many events arrive at once.
+# **********************************************************************
+
+
+def count_widgets(widget):
+    """Returns the number of widgets below widget, including itself."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def count_rows(app):
+    """Returns the number of achievement rows, the widgets inside the
+    category frames and the canvas items on their canvases.
+    """
+    achievements = app.frames["AchievementsFrame"]
+    widgets = items = 0
+    for category_frame in achievements.categories.values():
+        widgets += count_widgets(category_frame.scrolled_frame)
+        items += len(category_frame.canvas.find_all())
+    return len(achievements.rows), widgets, items
+
+
+def random_action(app, rand):
+    """Applies one random checkbox change, undo or redo to the app."""
+    roll = rand.random()
+    if roll < 0.05:
+        app.undo()
+        return
+    if roll < 0.1:
+        app.redo()
+        return
+
+    # any level can be checked from the info frame, not only the shown one
+    achievement = rand.choice(app.achievement_list)
+    if roll < 0.55:
+        achievement.set_completed(0 if achievement.is_completed else 1)
+    else:
+        achievement.set_planned(0 if achievement.is_planned else 1)
+
+
+def bench_rows(app, actions, report_every, seed):
+    """Runs the rows benchmark, see the top of this file.
+
+    Ret:
+        (list of tuples): (actions done, widget count) for every report
+    """
+    rand = random.Random(seed)
+    # let the frames finish loading before counting
+    app.update_idletasks()
+    counts = [(0, count_widgets(app))]
+    print("{:>8} {:>8}".format("actions", "widgets"))
+    print("{:>8} {:>8}".format(*counts[-1]))
+
+    start = time.perf_counter()
+    for i in range(1, actions + 1):
+        random_action(app, rand)
+        # rows are updated in an idle callback, as they would be between
+        # two clicks
+        app.update_idletasks()
+        if i % report_every == 0:
+            counts.append((i, count_widgets(app)))
+            print("{:>8} {:>8}".format(*counts[-1]))
+    elapsed = time.perf_counter() - start
+
+    widgets = [count for _, count in counts]
+    print("{:.2f} ms per action, widgets min {} max {}".format(
+        1000 * elapsed / max(actions, 1), min(widgets), max(widgets)))
+    return counts
+
+
+def catalog_units(copies):
+    """Returns every achievement of the catalog, repeated copies times, as
+    LeveledAttributes and ListAchievements.
+    """
+    leveled_data, list_data = catalog.load_catalog()
+    units = []
+    list_index = 0
+    for _ in range(copies):
+        for achievement in leveled_data['leveled_achievements']:
+            shared_attrs = LeveledAttributes(
+                achievement['category'], achievement['title'],
+                achievement['description'], achievement['info'],
+                achievement['overall_completed'])
+            for lvl in achievement['levels']:
+                shared_attrs.add_level(LeveledAchievement(
+                    lvl['rom_num'], 0, 0, lvl['num_tasks'],
+                    int(lvl['points']), int(lvl['reward_amount']),
+                    lvl['reward'], list_index, shared_attrs))
+                list_index += 1
+            units.append(shared_attrs)
+        for achievement in list_data['list_achievements']:
+            units.append(ListAchievement(
+                achievement['category'], achievement['title'],
+                achievement['description'], achievement['task_list'], 0, 0,
+                int(achievement['points']),
+                int(achievement['reward_amount']), achievement['reward'],
+                list_index, achievement['info']))
+            list_index += 1
+    return units
+
+
+def bench_search(copies, seed):
+    """Runs the search benchmark, see the top of this file.
+
+    Ret:
+        (tuple of floats): (slowest chunk, slowest search) in ms
+    """
+    units = catalog_units(copies)
+    index = SearchIndex()
+    chunk_times = []
+    for start in range(0, len(units), INDEX_CHUNK_SIZE):
+        chunk_start = time.perf_counter()
+        index.add(units[start:start + INDEX_CHUNK_SIZE])
+        chunk_times.append(time.perf_counter() - chunk_start)
+
+    # queries of one to three words from the catalog, typed one
+    # character at a time
+    rand = random.Random(seed)
+    words = sorted({word for unit in units[:len(units) // copies]
+                    for text in searchable_text(unit)
+                    for word in tokenize(text)})
+    search_times = []
+    for _ in range(200):
+        query = " ".join(rand.sample(words, rand.randint(1, 3)))
+        for end in range(1, len(query) + 1):
+            search_start = time.perf_counter()
+            index.search(query[:end])
+            search_times.append(time.perf_counter() - search_start)
+
+    slowest_chunk = 1000 * max(chunk_times)
+    slowest_search = 1000 * max(search_times)
+    print("{} achievements, {} words".format(len(units), len(index.words)))
+    print("index: {:.0f} ms total, slowest chunk {:.2f} ms".format(
+        1000 * sum(chunk_times), slowest_chunk))
+    print("search: {} queries, mean {:.3f} ms, slowest {:.2f} ms".format(
+        len(search_times), 1000 * sum(search_times) / len(search_times),
+        slowest_search))
+    return slowest_chunk, slowest_search
+
+
+def fill_frame(root, rows, batched):
+    """Fills a new ScrollableFrame with rows of labels and waits for Tk to
+    lay them out.
+
+    Ret:
+        (float): seconds taken
+    """
+    import tkinter as tk
+    from scrollable_frame import ScrollableFrame
+
+    start = time.perf_counter()
+    sbf = ScrollableFrame(root, height=500, width=702, bg='#121111')
+    sbf.pack()
+
+    def add_rows():
+        for row in range(rows):
+            for column in range(4):
+                label = tk.Label(sbf.scrolled_frame, text=f"{row}.{column}")
+                label.grid(row=row, column=column)
+            # geometry is computed as rows are added, as it is when a Tk
+            # callback builds a frame over several idle callbacks
+            if row % 25 == 0:
+                root.update_idletasks()
+
+    if batched:
+        with sbf.batch():
+            add_rows()
+    else:
+        add_rows()
+    root.update_idletasks()
+    elapsed = time.perf_counter() - start
+    sbf.destroy()
+    return elapsed
+
+
+def bench_build(sizes):
+    """Runs the build benchmark, see the top of this file.
+
+    Ret:
+        (list of tuples): (rows, unbatched seconds, batched seconds)
+    """
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    results = []
+    print("{:>6} {:>14} {:>14}".format("rows", "us/row", "batched us/row"))
+    try:
+        for rows in sizes:
+            unbatched = fill_frame(root, rows, False)
+            batched = fill_frame(root, rows, True)
+            results.append((rows, unbatched, batched))
+            print("{:>6} {:>14.1f} {:>14.1f}".format(
+                rows, 1e6 * unbatched / rows, 1e6 * batched / rows))
+    finally:
+        root.destroy()
+    return results
+
+
+def bench_scroll(bursts):
+    """Runs the scroll benchmark, see the top of this file.
+
+    Ret:
+        (list of floats): milliseconds between every two frames
+    """
+    import tkinter as tk
+    from scrollable_frame import FRAME_MS, ScrollableFrame
+
+    root = tk.Tk()
+    root.withdraw()
+    sbf = ScrollableFrame(root, height=500, width=702, bg='#121111')
+    sbf.pack()
+    with sbf.batch() as frame:
+        for row in range(2000):
+            tk.Label(frame, text=f"row {row}").grid(row=row, column=0)
+    root.update()
+
+    # time of every frame drawn
+    frame_times = []
+    scroll_frame = sbf.scroll_frame
+
+    def timed_scroll_frame():
+        frame_times.append(time.perf_counter())
+        scroll_frame()
+    sbf.scroll_frame = timed_scroll_frame
+
+    class WheelEvent():
+        """A mouse wheel event as sent by Windows."""
+        num = None
+
+        def __init__(self, delta):
+            self.delta = delta
+
+    try:
+        for burst in range(bursts):
+            # ten notches at once, alternating down and up
+            delta = -120 if burst % 2 == 0 else 120
+            for _ in range(10):
+                sbf.on_mousewheel(WheelEvent(delta))
+            while sbf.scroll_job is not None:
+                root.update()
+    finally:
+        root.destroy()
+
+    gaps = [1000 * (b - a) for a, b in zip(frame_times, frame_times[1:])]
+    # gaps between two bursts aren't frame times
+    gaps = [gap for gap in gaps if gap < 10 * FRAME_MS]
+    gaps.sort()
+    print("{} frames, median {:.1f} ms, 95th percentile {:.1f} ms, "
+          "slowest {:.1f} ms (target {} ms)".format(
+              len(frame_times), gaps[len(gaps) // 2],
+              gaps[int(len(gaps) * 0.95)], gaps[-1], FRAME_MS))
+    return gaps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the achievement tracker GUI."
+    )
+    parser.add_argument("benchmark",
+                        choices=("rows", "search", "build", "scroll"),
+                        help="benchmark to run")
+    parser.add_argument("-n", "--actions", type=int, default=5000,
+                        help="number of checkbox changes")
+    parser.add_argument("--every", type=int, default=500,
+                        help="print the widget count every EVERY changes")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random changes")
+    parser.add_argument("--copies", type=int, default=100,
+                        help="times the catalog is repeated for search")
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "search":
+        bench_search(args.copies, args.seed)
+        return 0
+    if args.benchmark == "build":
+        bench_build((100, 200, 400, 800, 1600))
+        return 0
+    if args.benchmark == "scroll":
+        bench_scroll(50)
+        return 0
+
+    # imported here so --help works without a display
+    from main import AppController
+    app = AppController()
+    app.withdraw()
+    try:
+        # rows are normally built a slice at a time after the window opens
+        start = time.perf_counter()
+        app.finish_loading()
+        app.update_idletasks()
+        elapsed = time.perf_counter() - start
+        rows, widgets, items = count_rows(app)
+        print("built {} rows in {:.0f} ms: {} widgets and {} canvas items "
+              "in the category frames".format(
+                  rows, 1000 * elapsed, widgets, items))
+        bench_rows(app, args.actions, args.every, args.seed)
+    finally:
+        app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+import bisect
+import json
+import os
+
+# Reward types are defined in rewards.py, the reward statistics are
+# created from them here
+from rewards import REWARD_TYPES, get_reward_type
+
+
+# **********************************************************************
+# Achievement catalog and statistics that don't depend on Tk or PIL.
+
+# Everything in here can be imported without creating a window, so it is
+# shared between the GUI (OverviewFrame) and the headless tools such as
+# stats_cli.py.
+# **********************************************************************
+
+# Folder containing this file and the achievement json files
+SRC_PATH = os.path.dirname(os.path.abspath(__file__))
+LEVELED_FILE = os.path.join(SRC_PATH, "leveled_achievements.json")
+LIST_FILE = os.path.join(SRC_PATH, "list_achievements.json")
+
+# Achievement categories in the order they are displayed
+CATEGORIES = ("GM", "matches", "honor", "progress", "items", "social",
+              "general")
+
+# Every amount of points an achievement (or level) can be worth
+POINT_VALUES = (5, 10, 15, 20, 30, 40, 50, 60)
+
+# Titles shown for each category in the overview
+CATEGORY_TITLES = {
+    "GM": "GM", "matches": "Matches", "honor": "Honor",
+    "progress": "Progress", "items": "Items", "social": "Social",
+    "general": "General"
+}
+
+# Achievement point milestones. Maps the amount of points needed to a
+# tuple of (reward_amount, reward).
+MILESTONES = {
+    "0": (0, "bp"), "50": (300, "bp"), "100": (30, "silver"),
+    "250": (50, "silver"), "500": (2, "premium-crate"),
+    "800": (3, "premium-crate"),
+    "1200": (4, "premium-crate"),
+    "1600": (5, "premium-crate"),
+    "2000": (1, "mechanic_shirt_outfit"),
+    "2400": (1, "high_society_hat_outfit"),
+    "2800": (5, "premium-crate"), "3200": (5, "premium-crate"),
+    "3600": (5, "premium-crate"),
+    "4000": (1, "plague_carrier_outfit"),
+    "4500": (5, "premium-crate"), "5000": (5, "premium-crate"),
+    "5500": (5, "premium-crate")
+}
+
+# milestone point values in ascending order
+MILESTONE_POINTS = tuple(sorted(int(key) for key in MILESTONES))
+# once this many points are completed there are no milestones left
+FINAL_MILESTONE = MILESTONE_POINTS[-1]
+
+
+def new_stat_dict():
+    """Returns a dictionary with every statistic set to 0.
+
+    Keys are built the same way they are used throughout the program,
+    ie. "completed_points", "GM_planned_achievements" or "possible_bp".
+    """
+    stat_dict = {}
+    # statistics related to points and achievements
+    for adj in ("completed_", "planned_", "possible_"):
+        for noun in ("points", "achievements"):
+            for category in CATEGORIES:
+                stat_dict[category + "_" + adj + noun] = 0
+            # overall points and achievements
+            stat_dict[adj + noun] = 0
+
+    # reward statistics
+    for adj in ("completed_", "planned_", "possible_"):
+        for reward in REWARD_TYPES:
+            stat_dict[adj + reward] = 0
+
+    return stat_dict
+
+
+def get_milestones(points):
+    """Returns the prev and next milestones based on the amount of
+    completed achievement points.
+
+    Args:
+        points (int): total completed achievement points
+
+    Ret:
+        milestones (tuple of ints): (last_milestone, next_milestone)
+    """
+    prev_milestone = MILESTONE_POINTS[0]
+    for milestone in MILESTONE_POINTS[1:]:
+        if points < milestone:
+            return (prev_milestone, milestone)
+        prev_milestone = milestone
+    # every milestone has been reached
+    return (MILESTONE_POINTS[-2], MILESTONE_POINTS[-1])
+
+
+def reached_milestone(points):
+    """Returns the highest milestone reached with the given amount of
+    completed points.
+    """
+    index = bisect.bisect_right(MILESTONE_POINTS, points) - 1
+    return MILESTONE_POINTS[max(index, 0)]
+
+
+def load_catalog(leveled_file=LEVELED_FILE, list_file=LIST_FILE):
+    """Reads in the leveled and list achievement json files.
+
+    Args:
+        leveled_file (string): path to leveled_achievements.json
+        list_file (string): path to list_achievements.json
+
+    Ret:
+        (tuple of dicts): (leveled_data, list_data), exactly as stored
+            in the json files.
+    """
+    with open(leveled_file, 'r') as json_file:
+        leveled_data = json.load(json_file)
+    with open(list_file, 'r') as json_file:
+        list_data = json.load(json_file)
+    return leveled_data, list_data
+
+
+def load_progress(file):
+    """Reads in a progress file written by export_progress().
+
+    A progress file only contains the planned and completed checkbox values
+    for each achievement, stored under the achievement title:
+
+        {"leveled_achievements": {"Evil Survivor": [[0, 1], [1, 0], ...]},
+         "list_achievements": {"Unique Destiny": [0, 0], ...}}
+
+    Each pair is [is_planned, is_completed]. Leveled achievements have one
+    pair per level, starting at level I.
+    """
+    with open(file, 'r') as json_file:
+        return json.load(json_file)
+
+
+def export_progress(leveled_data, list_data):
+    """Returns the planned and completed values of the catalog in the
+    format read by load_progress().
+    """
+    progress = {"leveled_achievements": {}, "list_achievements": {}}
+    for achievement in leveled_data["leveled_achievements"]:
+        progress["leveled_achievements"][achievement["title"]] = [
+            [int(lvl["is_planned"]), int(lvl["is_completed"])]
+            for lvl in achievement["levels"]
+        ]
+    for achievement in list_data["list_achievements"]:
+        progress["list_achievements"][achievement["title"]] = [
+            int(achievement["is_planned"]), int(achievement["is_completed"])
+        ]
+    return progress
+
+
+def iter_achievements(leveled_data, list_data, progress=None):
+    """Yields every level of every achievement in catalog order.
+
+    If a progress dict is passed in, the planned and completed values are
+    read from it instead of the catalog. Achievements missing from the
+    progress are treated as neither planned nor completed.
+
+    Yields:
+        (tuple): (title, level, category, points, reward_amount, reward,
+            is_planned, is_completed). level is the index of the level for
+            leveled achievements and None for list achievements.
+    """
+    if progress is not None:
+        leveled_progress = progress.get("leveled_achievements", {})
+        list_progress = progress.get("list_achievements", {})
+
+    for achievement in leveled_data["leveled_achievements"]:
+        title = achievement["title"]
+        category = achievement["category"]
+        if progress is not None:
+            levels_progress = leveled_progress.get(title, ())
+        for level, lvl in enumerate(achievement["levels"]):
+            if progress is None:
+                is_planned = int(lvl["is_planned"])
+                is_completed = int(lvl["is_completed"])
+            elif level < len(levels_progress):
+                is_planned, is_completed = levels_progress[level]
+            else:
+                is_planned, is_completed = 0, 0
+            yield (title, level, category, int(lvl["points"]),
+                   int(lvl["reward_amount"]), lvl["reward"],
+                   is_planned, is_completed)
+
+    for achievement in list_data["list_achievements"]:
+        title = achievement["title"]
+        if progress is None:
+            is_planned = int(achievement["is_planned"])
+            is_completed = int(achievement["is_completed"])
+        else:
+            is_planned, is_completed = list_progress.get(title, (0, 0))
+        yield (title, None, achievement["category"],
+               int(achievement["points"]), int(achievement["reward_amount"]),
+               achievement["reward"], is_planned, is_completed)
+
+
+def add_achievement_stats(stat_dict, category, points, reward_amount,
+                          reward, is_planned, is_completed):
+    """Adds a single achievement (or level) to stat_dict. This is the same
+    bookkeeping AppController does when reading in achievements.
+    """
+    reward_type = get_reward_type(reward)
+    if is_completed == 1:
+        states = (("possible_", reward_type.possible_key),
+                  ("completed_", reward_type.completed_key))
+    elif is_planned == 1:
+        states = (("possible_", reward_type.possible_key),
+                  ("planned_", reward_type.planned_key))
+    else:
+        states = (("possible_", reward_type.possible_key),)
+    for adj, reward_key in states:
+        stat_dict[adj + "achievements"] += 1
+        stat_dict[adj + "points"] += points
+        stat_dict[category + "_" + adj + "achievements"] += 1
+        stat_dict[category + "_" + adj + "points"] += points
+        stat_dict[reward_key] += reward_amount
+
+
+def add_milestone_stats(stat_dict):
+    """Adds milestone rewards to stat_dict. All milestone rewards count
+    towards the possible rewards, and every milestone reached with the
+    completed points counts towards the completed rewards.
+    """
+    points = stat_dict["completed_points"]
+    for key, (amount, reward) in MILESTONES.items():
+        reward_type = get_reward_type(reward)
+        stat_dict[reward_type.possible_key] += amount
+        if 0 < int(key) <= points:
+            stat_dict[reward_type.completed_key] += amount
+
+
+def compute_stats(leveled_data, list_data, progress=None):
+    """Computes every statistic displayed in the overview.
+
+    Args:
+        leveled_data (dict): leveled achievements as read by load_catalog()
+        list_data (dict): list achievements as read by load_catalog()
+        progress (dict): optional progress as read by load_progress()
+
+    Ret:
+        stat_dict (dict): statistics with the same keys as
+            OverviewFrame.stat_dict
+    """
+    stat_dict = new_stat_dict()
+    for (title, level, category, points, reward_amount, reward,
+         is_planned, is_completed) in iter_achievements(
+            leveled_data, list_data, progress):
+        add_achievement_stats(stat_dict, category, points, reward_amount,
+                              reward, is_planned, is_completed)
+    add_milestone_stats(stat_dict)
+    return stat_dict
+
+
+def next_milestone_info(stat_dict):
+    """Returns the next milestone to be reached.
+
+    Ret:
+        (tuple): (points, reward_amount, reward), or None if all milestones
+            have been completed
+    """
+    points = stat_dict["completed_points"]
+    if points >= FINAL_MILESTONE:
+        return None
+    next_milestone = get_milestones(points)[1]
+    amount, reward = MILESTONES[str(next_milestone)]
+    return next_milestone, amount, reward
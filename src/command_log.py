@@ -0,0 +1,140 @@
+import collections
+import contextlib
+
+
+# **********************************************************************
+# Undo/redo log of the changes made to achievement checkboxes.
+
+# Every user action (checking a box along with the levels it cascades
+# to, or a bulk action) is stored as a single Change. A Change only
+# holds the achievements whose checkboxes changed, so undoing or redoing
+# it never needs to run the cascade logic again:
+#   indices: position of each changed achievement in achievement_list
+#   old, new: the state of each achievement before and after, as bytes
+#   stat_delta: amount each statistic changed by, without milestones
+# A state is PLANNED and/or COMPLETED or'ed together.
+# **********************************************************************
+
+# Bits of an achievement state
+PLANNED = 1
+COMPLETED = 2
+
+# Number of actions that can be undone
+MAX_UNDO = 500
+
+
+def make_state(is_planned, is_completed):
+    """Returns the state of an achievement with the given checkbox
+    values.
+    """
+    return (PLANNED if is_planned else 0) | (COMPLETED if is_completed else 0)
+
+
+class Change(collections.namedtuple(
+        "Change", ("indices", "old", "new", "stat_delta"))):
+    """A change to the checkboxes of one or more achievements. See the top
+    of this file.
+    """
+
+    __slots__ = ()
+
+    def inverted(self):
+        """Returns the change that undoes this change."""
+        return Change(
+            self.indices, self.new, self.old,
+            {stat: -amount for stat, amount in self.stat_delta.items()}
+        )
+
+
+def merge_changes(changes):
+    """Combines changes made one after the other into a single change.
+
+    Ret:
+        (Change): the combined change, or None if the changes cancel out
+    """
+    # maps each index to [old, new]
+    states = {}
+    stat_delta = {}
+    for change in changes:
+        for index, old, new in zip(change.indices, change.old, change.new):
+            if index in states:
+                states[index][1] = new
+            else:
+                states[index] = [old, new]
+        for stat, amount in change.stat_delta.items():
+            stat_delta[stat] = stat_delta.get(stat, 0) + amount
+
+    indices = [index for index, (old, new) in states.items() if old != new]
+    if not indices:
+        return None
+    return Change(
+        tuple(indices),
+        bytes(states[index][0] for index in indices),
+        bytes(states[index][1] for index in indices),
+        {stat: amount for stat, amount in stat_delta.items() if amount}
+    )
+
+
+class CommandLog():
+    """Keeps the changes that can be undone and redone.
+
+    Args:
+        max_size (int): number of changes kept for undoing. The oldest
+            change is dropped once there are more.
+    """
+
+    def __init__(self, max_size=MAX_UNDO):
+        self.undo_stack = collections.deque(maxlen=max_size)
+        self.redo_stack = []
+        # changes recorded inside batch(), merged when it ends
+        self.batch_changes = []
+        self.batch_depth = 0
+
+    def record(self, change):
+        """Records a change made by the user. Anything that was undone can
+        no longer be redone.
+        """
+        if self.batch_depth:
+            self.batch_changes.append(change)
+            return
+        self.undo_stack.append(change)
+        self.redo_stack.clear()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Every change recorded inside the with block is recorded as a
+        single change, so that it is undone in one step.
+        """
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                change = merge_changes(self.batch_changes)
+                self.batch_changes = []
+                if change is not None:
+                    self.record(change)
+
+    def undo(self):
+        """Returns the change that undoes the last change, or None if there
+        is nothing to undo.
+        """
+        if not self.undo_stack:
+            return None
+        change = self.undo_stack.pop()
+        self.redo_stack.append(change)
+        return change.inverted()
+
+    def redo(self):
+        """Returns the last undone change, or None if there is nothing to
+        redo.
+        """
+        if not self.redo_stack:
+            return None
+        change = self.redo_stack.pop()
+        self.undo_stack.append(change)
+        return change
+
+    def __len__(self):
+        return len(self.undo_stack)
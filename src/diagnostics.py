@@ -0,0 +1,183 @@
+import collections
+import gc
+import os
+import sys
+
+
+# **********************************************************************
+# Reports where the memory of the running app goes.
+
+# Counts the Tk photo images that are alive and the bytes of their
+# pixels, the Tk widgets of every frame and category, the Tcl variables
+# behind IntVars and StringVars, and the Python objects of the model and
+# row classes. Widgets that aren't managed by any geometry manager, ie.
+# left behind by grid_forget() or place_forget(), are counted separately.
+
+# The report is off in the running app unless the PUBGM_DIAGNOSTICS
+# environment variable is set:
+#   PUBGM_DIAGNOSTICS=1 python main.py
+# It's then written to stderr whenever F11 is pressed. The report of a
+# freshly loaded app is printed with:
+#   python diagnostics.py
+# **********************************************************************
+
+# Environment variable that turns the F11 report on
+DIAGNOSTICS_ENV = "PUBGM_DIAGNOSTICS"
+
+# Classes whose live instances are counted
+MODEL_CLASSES = ("LeveledAttributes", "LeveledAchievement",
+                 "ListAchievement", "AchievementRow", "ScrollableFrame",
+                 "SortedView", "Change")
+
+# Tk keeps 4 bytes per pixel of a photo image
+PIXEL_BYTES = 4
+
+# Tkinter names the Tcl variable of every IntVar, StringVar etc. like this
+TK_VARIABLE_PREFIX = "PY_VAR"
+
+
+def diagnostics_enabled(environ=os.environ):
+    """Returns True if the report was turned on with DIAGNOSTICS_ENV."""
+    return environ.get(DIAGNOSTICS_ENV, "") not in ("", "0")
+
+
+def image_stats(app, groups):
+    """Counts the photo images alive in Tk and the bytes of their pixels.
+
+    Args:
+        app (Tk): the app
+        groups (dict): maps a description to the PhotoImages used for it.
+            Images in no group are counted as "other".
+
+    Ret:
+        (OrderedDict): maps each group to [images, bytes]
+    """
+    owners = {}
+    for group, images in groups.items():
+        for image in images:
+            owners[str(image)] = group
+
+    stats = collections.OrderedDict(
+        (group, [0, 0]) for group in list(groups) + ["other"])
+    for name in app.tk.splitlist(app.tk.call("image", "names")):
+        name = str(name)
+        if app.tk.call("image", "type", name) != "photo":
+            continue
+        width = int(app.tk.call("image", "width", name))
+        height = int(app.tk.call("image", "height", name))
+        group = owners.get(name, "other")
+        stats[group][0] += 1
+        stats[group][1] += width * height * PIXEL_BYTES
+    return stats
+
+
+def widget_stats(widget):
+    """Counts a widget and every widget inside it.
+
+    Ret:
+        (tuple of ints): (widgets, unmanaged). Unmanaged widgets aren't
+            shown by pack, grid or place, ie. hidden info frames or
+            widgets left behind by grid_forget(). Widgets inside an
+            unmanaged widget are only counted in widgets.
+    """
+    widgets = 0
+    unmanaged = 0
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        widgets += 1
+        # windows are never managed
+        if (not current.winfo_manager()
+                and current.winfo_toplevel() is not current):
+            unmanaged += 1
+        stack.extend(current.winfo_children())
+    return widgets, unmanaged
+
+
+def tk_variable_count(app):
+    """Returns the number of Tcl variables created for IntVars,
+    StringVars and other Tkinter variables that are alive.
+    """
+    return sum(1 for name in app.tk.splitlist(app.tk.call("info", "globals"))
+               if str(name).startswith(TK_VARIABLE_PREFIX))
+
+
+def object_counts(class_names=MODEL_CLASSES):
+    """Returns the number of live Python objects of each class, by class
+    name.
+    """
+    counts = collections.OrderedDict((name, 0) for name in class_names)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in counts:
+            counts[name] += 1
+    return counts
+
+
+def memory_report(app):
+    """Returns the memory report of a running app as text.
+
+    Args:
+        app (AppController): the app
+    """
+    lines = ["Photo images             count     KiB"]
+    total_images = total_bytes = 0
+    for group, (count, size) in image_stats(app, app.image_groups()).items():
+        lines.append(f"  {group:<20}{count:>9}{size / 1024:>8.0f}")
+        total_images += count
+        total_bytes += size
+    lines.append(f"  {'total':<20}{total_images:>9}"
+                 f"{total_bytes / 1024:>8.0f}")
+
+    lines.append("Widgets                widgets  unmanaged")
+    for page_name, frame in app.frames.items():
+        widgets, unmanaged = widget_stats(frame)
+        lines.append(f"  {page_name:<20}{widgets:>9}{unmanaged:>11}")
+    achievements = app.frames.get("AchievementsFrame")
+    if achievements is not None:
+        # rows are drawn as canvas items rather than widgets
+        for category, category_frame in achievements.categories.items():
+            widgets, unmanaged = widget_stats(category_frame)
+            items = len(category_frame.canvas.find_all())
+            lines.append(f"    {category:<18}{widgets:>9}{unmanaged:>11}"
+                         f"  {items} canvas items")
+        for unit, (info_frame, _) in achievements.info_frames.items():
+            widgets, unmanaged = widget_stats(info_frame)
+            lines.append(f"    info: {unit.title[:12]:<12}{widgets:>9}"
+                         f"{unmanaged:>11}")
+    widgets, unmanaged = widget_stats(app)
+    lines.append(f"  {'total':<20}{widgets:>9}{unmanaged:>11}")
+
+    lines.append(f"Tk variables             {tk_variable_count(app):>5}")
+
+    lines.append("Python objects")
+    for name, count in object_counts().items():
+        lines.append(f"  {name:<20}{count:>9}")
+    return "\n".join(lines)
+
+
+def write_memory_report(app, stream=sys.stderr):
+    """Writes the memory report of a running app to the diagnostics
+    output, stderr unless another stream is given.
+    """
+    stream.write(memory_report(app) + "\n")
+    stream.flush()
+
+
+def main():
+    """Prints the memory report of the app once everything is loaded."""
+    # imported here so that this module can be imported by main.py
+    from main import AppController
+    app = AppController()
+    app.withdraw()
+    try:
+        app.finish_loading()
+        app.update_idletasks()
+        print(memory_report(app))
+    finally:
+        app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
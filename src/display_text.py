@@ -0,0 +1,85 @@
+import collections
+import functools
+import textwrap
+
+
+# **********************************************************************
+# Text shown for each achievement, formatted and wrapped once.
+
+# Every achievement builds it's DisplayText when it's loaded, so drawing a
+# row or an info frame never formats or wraps text again. Wrapping is
+# cached by (text, width) as well, so text shared between achievements,
+# such as the info of every level of a leveled achievement, is only
+# wrapped once.
+# **********************************************************************
+
+# Line widths in characters
+# description in an achievement's row
+ROW_DESC_WIDTH = 72
+# description of a level in a leveled info frame
+LEVEL_DESC_WIDTH = 42
+# each task in a list info frame
+TASK_WIDTH = 84
+# info at the bottom of every info frame
+INFO_WIDTH = 99
+
+# Text of an achievement or level:
+#   title: title, followed by the roman numeral for levels
+#   desc: description with the number of tasks filled in, not wrapped
+#   row_desc: desc wrapped for the achievement's row
+#   panel_desc: desc wrapped for a level in the info frame, "" for list
+#       achievements
+#   tasks: each task wrapped for the info frame, empty for levels
+#   info: info wrapped for the info frame
+DisplayText = collections.namedtuple(
+    "DisplayText",
+    ("title", "desc", "row_desc", "panel_desc", "tasks", "info")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def wrap(text, width):
+    """Returns text wrapped to lines of at most width characters."""
+    return textwrap.fill(text, width=width)
+
+
+def wrap_task(task):
+    """Returns a task wrapped as a bullet point, with every line after the
+    first indented under the dash.
+    """
+    return wrap("- " + task, TASK_WIDTH).replace("\n", "\n   ")
+
+
+def leveled_text(level):
+    """Returns the DisplayText of a level of a leveled achievement.
+
+    Args:
+        level (LeveledAchievement): the level
+    """
+    attrs = level.shared_attrs
+    # input number of tasks needed in level into description string
+    desc = attrs.desc.format(num_tasks=level.num_tasks)
+    return DisplayText(
+        title=attrs.title + " " + level.level_rom_num,
+        desc=desc,
+        row_desc=wrap(desc, ROW_DESC_WIDTH),
+        panel_desc=wrap(desc, LEVEL_DESC_WIDTH),
+        tasks=(),
+        info=wrap(attrs.info, INFO_WIDTH)
+    )
+
+
+def list_text(achievement):
+    """Returns the DisplayText of a list achievement.
+
+    Args:
+        achievement (ListAchievement): the achievement
+    """
+    return DisplayText(
+        title=achievement.title,
+        desc=achievement.desc,
+        row_desc=wrap(achievement.desc, ROW_DESC_WIDTH),
+        panel_desc="",
+        tasks=tuple(wrap_task(task) for task in achievement.task_list),
+        info=wrap(achievement.info, INFO_WIDTH)
+    )
@@ -0,0 +1,77 @@
+# **********************************************************************
+# Event bus between the achievement model and the frames displaying it.
+
+# The model publishes an event for every change, and doesn't need to know
+# what is displaying it. Subscribers are either called right away, for
+# bookkeeping that must always be up to date such as statistics, or
+# deferred. Deferred subscribers are called once per flush with every
+# payload published since the last flush, so that many changes made at
+# once (ie. a bulk action) only update the display once. The GUI flushes
+# in a Tk idle callback.
+# **********************************************************************
+
+
+class EventBus():
+    """Delivers published events to subscribers.
+
+    Args:
+        schedule (function): called with flush() when deferred events are
+            waiting, ie. Tk's after_idle. If None, deferred subscribers are
+            called right away.
+    """
+
+    def __init__(self, schedule=None):
+        self.schedule = schedule
+        # maps each event to the callbacks called right away
+        self.subscribers = {}
+        # maps each event to the callbacks called on the next flush
+        self.deferred_subscribers = {}
+        # maps each deferred callback to the payloads waiting for it
+        self.pending = {}
+        self.flush_scheduled = False
+
+    def subscribe(self, event, callback, deferred=False):
+        """Calls callback whenever event is published.
+
+        Args:
+            event (string): name of the event
+            callback (function): called with the payload, or with a list
+                of every payload since the last flush if deferred
+            deferred (bool): True to wait for the next flush
+        """
+        if deferred:
+            subscribers = self.deferred_subscribers
+        else:
+            subscribers = self.subscribers
+        subscribers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event, callback):
+        """Stops calling callback when event is published."""
+        for subscribers in (self.subscribers, self.deferred_subscribers):
+            if callback in subscribers.get(event, ()):
+                subscribers[event].remove(callback)
+        self.pending.pop(callback, None)
+
+    def publish(self, event, payload=None):
+        """Publishes an event to every subscriber."""
+        for callback in self.subscribers.get(event, ()):
+            callback(payload)
+
+        deferred = self.deferred_subscribers.get(event)
+        if not deferred:
+            return
+        for callback in deferred:
+            self.pending.setdefault(callback, []).append(payload)
+        if self.schedule is None:
+            self.flush()
+        elif not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.schedule(self.flush)
+
+    def flush(self):
+        """Calls every deferred subscriber that has payloads waiting."""
+        self.flush_scheduled = False
+        pending = self.pending
+        self.pending = {}
+        for callback, payloads in pending.items():
+            callback(payloads)
@@ -0,0 +1,222 @@
+import bisect
+import json
+import os
+import time
+
+
+# **********************************************************************
+# Stores a time series of the statistics, one snapshot per save.
+
+# The history file is a json lines file that is only ever appended to.
+# Most lines only hold the statistics that changed since the previous
+# save:
+#   {"t": 1603900000, "d": {"completed_points": 25, ...}}
+# and every CHECKPOINT_INTERVAL saves a line holds every statistic:
+#   {"t": 1603900000, "c": {"completed_points": 1250, ...}}
+# Finding the statistics at any time only needs a binary search for the
+# save before it and replaying at most CHECKPOINT_INTERVAL deltas from
+# the checkpoint before that.
+
+# A line that can't be read, ie. cut off by a crash, breaks the chain of
+# deltas after it. Deltas are skipped until the next checkpoint, and the
+# first save after such a line is always a checkpoint.
+# **********************************************************************
+
+# Maximum number of deltas written between two checkpoints
+CHECKPOINT_INTERVAL = 20
+
+# Seconds in a day and a week, used for queries
+DAY = 24 * 60 * 60
+WEEK = 7 * DAY
+
+
+class HistoryStore():
+    """Reads and appends to a history file.
+
+    Args:
+        file (string): path to the history file. It is created on the
+            first append if it doesn't exist.
+        checkpoint_interval (int): maximum number of deltas between two
+            checkpoints
+    """
+
+    def __init__(self, file, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.file = file
+        self.checkpoint_interval = checkpoint_interval
+
+        # time of every record, in the order they were saved
+        self.times = []
+        # data of every record, either every stat or only the changed ones
+        self.records = []
+        # indices of the records that are checkpoints
+        self.checkpoints = []
+
+        # statistics of the last record, used to compute the next delta
+        self.last_state = None
+        # True if the next save has to be a checkpoint, since the deltas
+        # since the last checkpoint can't all be read back
+        self.needs_checkpoint = False
+
+        self.load()
+
+    def load(self):
+        """Reads in the history file. Lines that can't be read, such as a
+        line cut off by a crash, are skipped along with the deltas after
+        them up to the next checkpoint.
+        """
+        if not os.path.exists(self.file):
+            return
+        with open(self.file, 'r') as history_file:
+            for line in history_file:
+                try:
+                    record = json.loads(line)
+                    timestamp = record["t"]
+                    if "c" in record:
+                        self.add_record(timestamp, record["c"], True)
+                        self.needs_checkpoint = False
+                    elif self.checkpoints and not self.needs_checkpoint:
+                        self.add_record(timestamp, record["d"], False)
+                except (ValueError, KeyError, TypeError):
+                    # the deltas after this line would be applied to the
+                    # wrong statistics
+                    self.needs_checkpoint = True
+        if self.records:
+            self.last_state = self.state_at_index(len(self.records) - 1)
+
+    def add_record(self, timestamp, data, is_checkpoint):
+        """Adds a record to the in-memory history."""
+        # saves are expected in time order, but a clock change shouldn't
+        # break the binary searches
+        if self.times and timestamp < self.times[-1]:
+            timestamp = self.times[-1]
+        if is_checkpoint:
+            self.checkpoints.append(len(self.records))
+        self.times.append(timestamp)
+        self.records.append(data)
+
+    def append(self, stat_dict, timestamp=None):
+        """Appends a snapshot of stat_dict to the history.
+
+        Args:
+            stat_dict (dict): statistics as kept by OverviewFrame
+            timestamp (int): seconds since the epoch, defaults to now
+
+        Ret:
+            (bool): False if nothing changed since the last snapshot, in
+                which case nothing is written
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        state = dict(stat_dict)
+
+        # a line cut off by a crash is ended first, so that this line
+        # isn't written onto the end of it
+        prefix = ""
+        if not self.ends_with_newline():
+            prefix = "\n"
+            self.needs_checkpoint = True
+
+        is_checkpoint = (
+            self.last_state is None
+            or self.needs_checkpoint
+            or len(self.records) - self.checkpoints[-1]
+            > self.checkpoint_interval
+        )
+        if is_checkpoint:
+            data = state
+            line = {"t": timestamp, "c": data}
+        else:
+            data = {
+                key: value - self.last_state.get(key, 0)
+                for key, value in state.items()
+                if value != self.last_state.get(key, 0)
+            }
+            if not data:
+                return False
+            line = {"t": timestamp, "d": data}
+
+        with open(self.file, 'a') as history_file:
+            history_file.write(prefix)
+            history_file.write(json.dumps(line, separators=(",", ":")))
+            history_file.write("\n")
+
+        self.add_record(timestamp, data, is_checkpoint)
+        self.last_state = state
+        self.needs_checkpoint = False
+        return True
+
+    def ends_with_newline(self):
+        """Returns False if the history file's last line is cut off, True
+        if it's complete or the file is empty or doesn't exist.
+        """
+        try:
+            with open(self.file, 'rb') as history_file:
+                history_file.seek(0, os.SEEK_END)
+                if history_file.tell() == 0:
+                    return True
+                history_file.seek(-1, os.SEEK_END)
+                return history_file.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def state_at_index(self, index):
+        """Returns the statistics as they were saved in record index."""
+        checkpoint = self.checkpoints[
+            bisect.bisect_right(self.checkpoints, index) - 1]
+        state = dict(self.records[checkpoint])
+        for delta in self.records[checkpoint + 1:index + 1]:
+            for key, value in delta.items():
+                state[key] = state.get(key, 0) + value
+        return state
+
+    def state_at(self, timestamp):
+        """Returns the statistics as they were at the given time, or None
+        if nothing had been saved yet.
+        """
+        index = bisect.bisect_right(self.times, timestamp) - 1
+        if index < 0:
+            return None
+        return self.state_at_index(index)
+
+    def value_at(self, timestamp, key):
+        """Returns a single statistic at the given time. Before the first
+        save the first saved value is used, since it isn't known when
+        anything before that was completed.
+        """
+        if not self.records:
+            return 0
+        state = self.state_at(timestamp)
+        if state is None:
+            state = self.records[0]
+        return state.get(key, 0)
+
+    def gained_since(self, timestamp, key="completed_achievements",
+                     now=None):
+        """Returns how much a statistic increased between timestamp and now,
+        ie. achievements completed since a date.
+        """
+        if now is None:
+            now = int(time.time())
+        return self.value_at(now, key) - self.value_at(timestamp, key)
+
+    def gained_per_period(self, periods, period=WEEK, key="completed_points",
+                          now=None):
+        """Returns how much a statistic increased in each of the last
+        periods, ie. points per week.
+
+        Ret:
+            (list of tuples): (period_start, gained) for each period, oldest
+                first
+        """
+        if now is None:
+            now = int(time.time())
+        starts = [now - (periods - i) * period for i in range(periods)]
+        values = [self.value_at(start, key) for start in starts]
+        values.append(self.value_at(now, key))
+        return [
+            (start, values[i + 1] - values[i])
+            for i, start in enumerate(starts)
+        ]
+
+    def __len__(self):
+        return len(self.records)
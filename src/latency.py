@@ -0,0 +1,116 @@
+import collections
+import os
+import time
+
+
+# **********************************************************************
+# Opt-in tracing of how long user interactions take.
+
+# Each interaction (a button press, a checkbox, a category switch,
+# opening an info frame) is timestamped when it starts, and again when
+# Tk next goes idle after redrawing, see AppController.trace(). The
+# latencies are kept in a ring buffer, so tracing a long session uses a
+# fixed amount of memory, and summarized per interaction on demand.
+
+# Tracing is off unless the PUBGM_TRACE environment variable is set:
+#   PUBGM_TRACE=1 python main.py
+# The summary is printed on exit and whenever F12 is pressed.
+# **********************************************************************
+
+# Environment variable that turns tracing on
+TRACE_ENV = "PUBGM_TRACE"
+
+# Number of latencies kept, the oldest are dropped first
+TRACE_BUFFER_SIZE = 2000
+
+# Percentiles shown in the summary
+PERCENTILES = (50, 90, 99)
+
+# A traced interaction.
+#   action (string): what the user did, ie. "main_menu.overview"
+#   started (float): time.perf_counter() when it started
+#   ms (float): milliseconds until Tk went idle
+Sample = collections.namedtuple("Sample", ("action", "started", "ms"))
+
+
+def tracing_enabled(environ=os.environ):
+    """Returns True if tracing was turned on with TRACE_ENV."""
+    return environ.get(TRACE_ENV, "") not in ("", "0")
+
+
+def percentile(values, p):
+    """Returns the p-th percentile of sorted values, using the nearest
+    rank. values must not be empty.
+    """
+    rank = -(-p * len(values) // 100)
+    return values[max(rank, 1) - 1]
+
+
+class LatencyTrace():
+    """Records the latency of interactions in a ring buffer.
+
+    Args:
+        size (int): number of latencies kept
+        clock (function): returns the current time in seconds
+    """
+
+    def __init__(self, size=TRACE_BUFFER_SIZE, clock=time.perf_counter):
+        self.samples = collections.deque(maxlen=size)
+        self.clock = clock
+
+    def start(self, action):
+        """Returns a token for an interaction that is starting, to be
+        passed to finish().
+        """
+        return action, self.clock()
+
+    def finish(self, token):
+        """Records the latency of an interaction started with start().
+
+        Ret:
+            (Sample): the recorded sample
+        """
+        action, started = token
+        sample = Sample(action, started,
+                        1000 * (self.clock() - started))
+        self.samples.append(sample)
+        return sample
+
+    def summary(self):
+        """Returns the latencies of every interaction in the buffer.
+
+        Ret:
+            (dict): maps each action to a dict with it's "count", each
+                percentile in PERCENTILES ("p50", ...) and "max", in
+                milliseconds. Slowest actions (by their highest
+                percentile) first.
+        """
+        by_action = {}
+        for sample in self.samples:
+            by_action.setdefault(sample.action, []).append(sample.ms)
+
+        summary = {}
+        for action, latencies in by_action.items():
+            latencies.sort()
+            stats = {"count": len(latencies)}
+            for p in PERCENTILES:
+                stats[f"p{p}"] = percentile(latencies, p)
+            stats["max"] = latencies[-1]
+            summary[action] = stats
+        slowest = f"p{PERCENTILES[-1]}"
+        return dict(sorted(summary.items(),
+                           key=lambda item: -item[1][slowest]))
+
+    def format_summary(self):
+        """Returns the summary as a table that can be printed."""
+        columns = ["count"] + [f"p{p}" for p in PERCENTILES] + ["max"]
+        lines = ["{:<40}".format("action (ms)")
+                 + "".join(f"{column:>9}" for column in columns)]
+        for action, stats in self.summary().items():
+            line = f"{action:<40}{stats['count']:>9}"
+            line += "".join(f"{stats[column]:>9.1f}"
+                            for column in columns[1:])
+            lines.append(line)
+        if len(lines) == 1:
+            lines.append("no interactions traced")
+        return "\n".join(lines)
@@ -0,0 +1,176 @@
+import collections
+
+
+# **********************************************************************
+# Layouts of the buttons drawn onto the background of each frame.
+
+# Each button's sprite, position and action are defined once here. The
+# background images (with every button, and with one button turned red)
+# and the hit-test grid that finds the button under a click are both
+# generated from these specs, see compose_layout() in main.py. Moving a
+# button only means changing it's position here.
+
+# Everything in here can be imported without creating a window.
+# **********************************************************************
+
+# Desired sizes for the button images
+BUTTON_SIZE = 277, 45
+# Desired sizes for the category buttons in AchievementsFrame
+CATEGORY_BUTTON_SIZE = 277, 30
+
+# The background images are wider than the window and are shown centred,
+# so a point on the window is this many pixels left of the same point on
+# the background image. Positions in the specs are on the image.
+IMAGE_OFFSET = 75
+
+# Size in pixels of a cell of the hit-test grid
+HIT_CELL_SIZE = 16
+
+# A button drawn onto a background.
+#   name (string): unique within it's layout
+#   sprite (string): file name in images/buttons without ".png". The red
+#       version shown while it's pressed is sprite + "_red".
+#   position (tuple): (x, y) of the top left corner on the background
+#   size (tuple): the sprite is shrunk to fit in this size
+#   action (string): what clicking it does, handled by the frame
+#   arg: passed to the frame along with action, ie. the page to show
+Button = collections.namedtuple(
+    "Button", ("name", "sprite", "position", "size", "action", "arg"))
+
+# An image drawn onto a background that can't be clicked.
+#   path (tuple): folders and file name in images
+#   position (tuple): (x, y) of the top left corner on the background
+#   size (tuple): the image is shrunk to fit in this size, or None
+Decoration = collections.namedtuple(
+    "Decoration", ("path", "position", "size"))
+
+# The background of a frame.
+#   background (string): file name in images
+#   decorations (tuple of Decorations)
+#   buttons (tuple of Buttons)
+Layout = collections.namedtuple(
+    "Layout", ("background", "decorations", "buttons"))
+
+# A layout once it's images have been composited.
+#   background: the background with every button
+#   pressed (dict): maps each button's name to the background with that
+#       button turned red
+#   hit_grid (HitGrid): finds the button under a click
+ComposedLayout = collections.namedtuple(
+    "ComposedLayout", ("background", "pressed", "hit_grid"))
+
+MAIN_MENU_LAYOUT = Layout(
+    background="background.png",
+    decorations=(
+        Decoration(("buttons", "program_title.png"), (150, 40), None),
+    ),
+    buttons=(
+        Button("overview", "overview", (150, 240), BUTTON_SIZE,
+               "show_page", "OverviewFrame"),
+        Button("achievements", "achievements", (150, 340), BUTTON_SIZE,
+               "show_achievements", "uncompleted"),
+        Button("completed", "completed", (150, 440), BUTTON_SIZE,
+               "show_achievements", "completed"),
+        Button("save", "save", (1200, 40), BUTTON_SIZE, "save", None),
+        Button("exit", "exit", (1300, 40), BUTTON_SIZE, "exit", None),
+    ),
+)
+
+OVERVIEW_LAYOUT = Layout(
+    background="background_blurred.png",
+    decorations=(),
+    buttons=(
+        Button("back", "back", (150, 40), BUTTON_SIZE,
+               "show_page", "MainMenuFrame"),
+    ),
+)
+
+ACHIEVEMENTS_LAYOUT = Layout(
+    background="background_blurred.png",
+    decorations=(
+        # text at bottom right of category frame
+        Decoration(("click_on_achievement_txt.png",), (760, 565),
+                   (200, 30)),
+    ),
+    buttons=(
+        Button("back", "back", (150, 40), BUTTON_SIZE,
+               "show_page", "MainMenuFrame"),
+        Button("save", "save", (1200, 40), BUTTON_SIZE, "save", None),
+        # category buttons are named after their category
+        Button("GM", "glorious_moments", (980, 90), CATEGORY_BUTTON_SIZE,
+               "show_category", "GM"),
+        Button("matches", "matches", (980, 155), CATEGORY_BUTTON_SIZE,
+               "show_category", "matches"),
+        Button("honor", "honor", (980, 225), CATEGORY_BUTTON_SIZE,
+               "show_category", "honor"),
+        Button("progress", "progress", (980, 295), CATEGORY_BUTTON_SIZE,
+               "show_category", "progress"),
+        Button("items", "items", (980, 365), CATEGORY_BUTTON_SIZE,
+               "show_category", "items"),
+        Button("social", "social", (980, 435), CATEGORY_BUTTON_SIZE,
+               "show_category", "social"),
+        Button("general", "general", (980, 505), CATEGORY_BUTTON_SIZE,
+               "show_category", "general"),
+    ),
+)
+
+
+def button_box(button, sprite_size):
+    """Returns the area a button covers on the window.
+
+    Args:
+        button (Button): the button
+        sprite_size (tuple): (width, height) of the sprite once shrunk
+
+    Ret:
+        (tuple): (left, top, right, bottom), inclusive
+    """
+    x, y = button.position
+    width, height = sprite_size
+    left = x - IMAGE_OFFSET
+    return left, y, left + width - 1, y + height - 1
+
+
+class HitGrid():
+    """Finds the button under a point with a single lookup.
+
+    The window is divided into square cells of HIT_CELL_SIZE pixels. Each
+    cell stores the buttons that overlap it, which is rarely more than
+    one, so finding a button only checks the buttons of one cell.
+
+    Args:
+        boxes (list of tuples): (button, box) for every button, see
+            button_box()
+        width (int): width of the window in pixels
+        height (int): height of the window in pixels
+    """
+
+    def __init__(self, boxes, width, height, cell_size=HIT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.columns = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.cells = [()] * (self.columns * self.rows)
+
+        for button, box in boxes:
+            left, top, right, bottom = box
+            # parts of a button outside the window can't be clicked
+            first_col = max(left // cell_size, 0)
+            last_col = min(right // cell_size, self.columns - 1)
+            first_row = max(top // cell_size, 0)
+            last_row = min(bottom // cell_size, self.rows - 1)
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    index = row * self.columns + col
+                    self.cells[index] += ((button, box),)
+
+    def find(self, x, y):
+        """Returns the button under a point on the window, or None."""
+        col = x // self.cell_size
+        row = y // self.cell_size
+        if not (0 <= col < self.columns and 0 <= row < self.rows):
+            return None
+        for button, (left, top, right, bottom) in \
+                self.cells[row * self.columns + col]:
+            if left <= x <= right and top <= y <= bottom:
+                return button
+        return None
@@ -3,11 +3,33 @@ import pathlib
 import tkinter as tk
 from tkinter import font
 from PIL import Image, ImageTk
-import copy
+import collections
+import concurrent.futures
 import json
-import textwrap
-
-from scrollable_frame import ScrollableFrame
+import time
+
+from catalog import (CATEGORIES, CATEGORY_TITLES, POINT_VALUES,
+                     MILESTONES, MILESTONE_POINTS, FINAL_MILESTONE,
+                     new_stat_dict, get_milestones, reached_milestone)
+from command_log import CommandLog
+from diagnostics import diagnostics_enabled, write_memory_report
+from events import EventBus
+from history import HistoryStore, DAY, WEEK
+from latency import LatencyTrace, tracing_enabled
+from layout import (ACHIEVEMENTS_LAYOUT, MAIN_MENU_LAYOUT, OVERVIEW_LAYOUT,
+                    IMAGE_OFFSET, ComposedLayout, HitGrid, button_box)
+from model import (ACHIEVEMENTS_CHANGED, BULK_ACTIONS, Achievement,
+                   LeveledAttributes, LeveledAchievement, ListAchievement,
+                   apply_change, bulk_action, get_unit)
+from rewards import (REWARD_DISPLAY_ORDER, get_reward_type,
+                     registry as reward_registry)
+from reward_index import (MilestoneSource, RewardIndex, source_status,
+                          source_title)
+from milestone_planner import PlanItem, leveled_chain, plan_milestone
+from overview_panel import PanelRenderer, panel_enabled, panel_snapshot
+from scrollable_frame import ScrollableFrame, ScrollDispatcher
+from search import INDEX_CHUNK_SIZE, SearchIndex
+from sort_filter import SORT_ORDERS, STATUSES, SortedView, ViewFilter
 
 
 # **********************************************************************
@@ -27,18 +49,102 @@ from scrollable_frame import ScrollableFrame
 # (C) 2020 Jasper Nelligan
 # **********************************************************************
 
-# Desired sizes for the button images
-BUTTON_SIZE = 277, 45
-
 # Used to create size of window
 WINDOW_H = 625
 # My PC width - window edge
 WINDOW_W = 1366 - 16
 
+# Size in pixels of an achievement's row in a category frame
+ROW_HEIGHT = 66
+ROW_WIDTH = 690
+
+# Number of info frames kept in each AchievementsFrame. Exited info frames
+# are hidden instead of destroyed, so that opening the same achievement
+# again doesn't rebuild every widget. The least recently opened one is
+# destroyed once there are more.
+INFO_FRAME_CACHE_SIZE = 16
+
+# The statistics in OverviewFrame can be rendered into a single image on
+# a worker thread instead of being drawn as canvas items. Off unless
+# turned on with an environment variable, see overview_panel.py.
+RENDER_OVERVIEW_PANEL = panel_enabled()
+# Number of rendered statistics panels kept, by the statistics they show
+PANEL_CACHE_SIZE = 8
+# Milliseconds between checks of whether a panel has been rendered
+PANEL_POLL_MS = 15
+
+# Milliseconds of loading done per callback while the window is open.
+# The catalog is loaded and rows are built in slices of about this long,
+# so the main menu is drawn right away and stays responsive.
+LOAD_SLICE_MS = 12
+
 path = str(pathlib.Path(__file__).parent.parent.absolute())
 APP_PATH = path.replace("\\", "\\\\") + "\\\\"
 
 
+def is_typing(event):
+    """Returns True if a key event was sent to a text entry, ie. the
+    search, whose own key bindings take precedence over the window's.
+    """
+    return event is not None and isinstance(event.widget, tk.Entry)
+
+
+def compose_layout(layout):
+    """Composites the background of a layout with each of it's buttons,
+    and one copy of it for each button with that button turned red.
+
+    When a user clicks a button, the intended effect is for the button to
+    turn red and then back to yellow upon release. To simulate this, each
+    button has an associated image where only that button is red, which
+    is shown while the button is pressed. They are all composited now to
+    allow for quicker access when clicking.
+
+    Args:
+        layout (Layout): see layout.py
+
+    Ret:
+        (ComposedLayout): the images and the hit-test grid of the layout
+    """
+    path = APP_PATH + "images\\\\"
+    background = Image.open(path + layout.background)
+
+    # paste decorations and buttons onto background
+    # third argument is a mask that allows button
+    # backgrounds to be transparent
+    for decoration in layout.decorations:
+        img = Image.open(path + "\\\\".join(decoration.path))
+        if decoration.size is not None:
+            img.thumbnail(decoration.size, Image.BICUBIC)
+        background.paste(img, decoration.position, img)
+
+    red_sprites = {}
+    boxes = []
+    for button in layout.buttons:
+        img = Image.open(path + "buttons\\\\" + button.sprite + ".png")
+        img.thumbnail(button.size, Image.BICUBIC)
+        background.paste(img, button.position, img)
+        boxes.append((button, button_box(button, img.size)))
+        # Red buttons will be used to indicate when the user
+        # has clicked a button.
+        red_img = Image.open(
+            path + "buttons\\\\" + button.sprite + "_red.png")
+        red_img.thumbnail(button.size, Image.BICUBIC)
+        red_sprites[button.name] = red_img
+
+    # Create copies of background image so button images
+    # aren't pasted over the same image
+    pressed = {}
+    for button in layout.buttons:
+        clicked = background.copy()
+        red_img = red_sprites[button.name]
+        clicked.paste(red_img, button.position, red_img)
+        pressed[button.name] = ImageTk.PhotoImage(clicked)
+
+    # Convert the Image object into a TkPhoto object
+    return ComposedLayout(ImageTk.PhotoImage(background), pressed,
+                          HitGrid(boxes, WINDOW_W, WINDOW_H))
+
+
 class AppController(tk.Tk):
     def __init__(self):
         """This class is a way for different frames to communicate with each
@@ -96,303 +202,439 @@ class AppController(tk.Tk):
         # the new checkbutton values of the achievements in the dictionary.
         self.write_achievements = {}
 
-        # Initialize the reward images used for each achievement
+        # Statistics are recorded in the history every time the user saves
+        self.history = HistoryStore(APP_PATH + "src\\\\progress_history.jsonl")
+
+        # Every change the user makes to the checkboxes is recorded so that
+        # it can be undone with Ctrl+Z and redone with Ctrl+Y
+        self.command_log = CommandLog()
+        # True while an undone or redone change is being applied, so that it
+        # isn't recorded again
+        self.replaying = False
+        self.bind('<Control-z>', self.undo)
+        self.bind('<Control-y>', self.redo)
+        self.bind('<Control-Z>', self.redo)
+
+        # Opt-in latency tracing of interactions, see latency.py. None
+        # while tracing is off.
+        self.latency = LatencyTrace() if tracing_enabled() else None
+        # True while an interaction is being traced. Interactions started
+        # inside it, ie. the category shown by a button, are part of it.
+        self.tracing = False
+        if self.latency is not None:
+            self.bind_all('<F12>', lambda event: self.print_latency())
+        # Opt-in report of where memory goes, see diagnostics.py
+        if diagnostics_enabled():
+            self.bind_all('<F11>',
+                          lambda event: write_memory_report(self))
+
+        # The achievement model publishes every change on the event bus.
+        # Frames subscribe to it and update their display once per idle
+        # callback, no matter how many changes were made.
+        self.bus = EventBus(schedule=self.after_idle)
         Achievement.static_init(achievement_list=self.achievement_list,
-                                controller=self,
+                                bus=self.bus,
                                 write_achievements=self.write_achievements)
+        # statistics and the command log are updated right away
+        self.bus.subscribe(ACHIEVEMENTS_CHANGED, self.on_achievements_changed)
+
+        # Mouse wheel events go to the ScrollableFrame under the pointer,
+        # or to the one of the current page if there is none
+        ScrollDispatcher.get(self).get_active = self.active_scrollable
+
+        # name of the frame that is currently raised
+        self.current_page = None
 
         # Initializing all frames
 
         # All frames will be stored in a dictionary for quick access
         self.frames = {}
 
-        for F in (MainMenuFrame, OverviewFrame):
-            page_name = F.__name__
-            # Create an instance of each frame
-            frame = F(parent=container, controller=self)
-            # Input frame into dictionary
-            self.frames[page_name] = frame
+        # Only the main menu is created before the window opens. The other
+        # frames, the achievements and their rows are loaded a slice at a
+        # time by run_loader(), so the window opens just as fast no matter
+        # how big the catalog is.
+        self.container = container
+        self.add_frame("MainMenuFrame", MainMenuFrame(parent=container,
+                                                      controller=self))
+
+        # True once every achievement has been read and the statistics are
+        # complete
+        self.catalog_loaded = False
+        # Achievements whose rows haven't been built yet, by category.
+        # LeveledAttributes for leveled achievements and ListAchievement
+        # for list achievements.
+        self.pending_rows = {category: collections.deque()
+                             for category in CATEGORIES}
+        # rows of this category are built before the others, since it's
+        # the one shown in AchievementsFrame
+        self.row_priority = "GM"
+        # (steps done, total steps), total is None until the catalog is read
+        self.load_progress = (0, None)
+        # page the user asked for before it was loaded, shown once it is
+        self.requested_page = None
+        # status filter AchievementsFrame is shown with, see STATUSES
+        self.achievements_status = "uncompleted"
+
+        # Finds every achievement and milestone that awards a reward, used
+        # when a reward is clicked in the Overview. Created once the
+        # catalog is loaded.
+        self.reward_index = None
+        # The search index is built a few achievements per callback once
+        # the catalog is loaded, see search.py
+        self.search_index = SearchIndex()
+
+        self.loader = self.load_steps()
+        # id of the scheduled run_loader() call, cancelled if everything
+        # is loaded at once by finish_loading()
+        self.load_job = self.after_idle(self.run_loader)
 
-            # Put all of the pages in the same location;
-            # the one on the top of the stacking order
-            # will be the one that is visible.
-            frame.grid(row=0, column=0, sticky="nsew")
+        # Start by showing the Main Menu
+        self.show_frame("MainMenuFrame")
+
+    def add_frame(self, page_name, frame):
+        """Stores a frame under it's page name and places it where all
+        frames are stacked.
+        """
+        # Input frame into dictionary
+        self.frames[page_name] = frame
+
+        # Put all of the pages in the same location;
+        # the one on the top of the stacking order
+        # will be the one that is visible.
+        frame.grid(row=0, column=0, sticky="nsew")
+        # the new frame is stacked on top, keep the current page shown
+        if self.current_page is not None:
+            self.frames[self.current_page].tkraise()
+
+    def load_steps(self):
+        """Creates the frames, reads the catalog and builds every row, one
+        small step at a time. Yields after each step, see run_loader().
+        """
+        self.add_frame("OverviewFrame", OverviewFrame(
+            parent=self.container, controller=self))
+        yield
 
-        # In the case of AchievementsFrame, initialize two frames:
-        # one for completed achievements, the other for uncompleted
+        # Initialize the reward images used for each achievement
+        AchievementImages.init_images()
+        yield
 
         # Initialize static variables
-
         AchievementsFrame.static_init(
-            parent=container, controller=self,
+            parent=self.container, controller=self,
             achievement_list=self.achievement_list,
             write_achievements=self.write_achievements
         )
-
-        for F in ("UncompletedAchievements", "CompletedAchievements"):
-            frame = AchievementsFrame()
-            self.frames[F] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        # A single AchievementsFrame shows every achievement. The
+        # "Achievements" and "Completed" buttons show it with a different
+        # status filter.
+        frame = AchievementsFrame()
+        frame.set_status(self.achievements_status)
+        self.add_frame("AchievementsFrame", frame)
+        yield
 
         # Initialize achievements from json file
-        self.init_leveled_achievements()
-        self.init_list_achievements()
+        self.read_achievement_data()
+        leveled = self.leveled_data['leveled_achievements']
+        listed = self.list_data['list_achievements']
+        # each achievement is read, then it's row is built
+        total = 3 + 2 * (len(leveled) + len(listed))
+        done = 3
+        self.load_progress = (done, total)
+        for achievement in leveled:
+            self.init_leveled_achievement(achievement)
+            done += 1
+            self.load_progress = (done, total)
+            yield
+        for achievement in listed:
+            self.init_list_achievement(achievement)
+            done += 1
+            self.load_progress = (done, total)
+            yield
+
+        self.reward_index = RewardIndex(self.achievement_list)
+        self.after_idle(self.build_search_index, [
+            get_unit(achievement) for achievement in self.achievement_list
+            if not isinstance(achievement, LeveledAchievement)
+            or achievement is achievement.shared_attrs.first_lvl
+        ])
+        self.catalog_loaded = True
+        yield
+
+        while self.build_next_row():
+            done += 1
+            self.load_progress = (done, total)
+            yield
+
+    def run_loader(self):
+        """Runs loading steps for about LOAD_SLICE_MS, then schedules the
+        next slice until everything is loaded. Shows the page the user
+        asked for as soon as it's loaded.
+        """
+        self.load_job = None
+        if self.loader is None:
+            # finished by finish_loading() in the meantime
+            return
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        finished = False
+        while time.perf_counter() < deadline:
+            if next(self.loader, StopIteration) is StopIteration:
+                finished = True
+                break
 
-        # Start by showing the Main Menu
-        self.show_frame("MainMenuFrame")
+        if finished:
+            self.loader = None
+            self.frames["MainMenuFrame"].show_progress(None)
+        else:
+            self.frames["MainMenuFrame"].show_progress(self.load_progress)
+            self.load_job = self.after(1, self.run_loader)
+
+        if (self.requested_page is not None
+                and self.is_loaded(self.requested_page)):
+            self.show_frame(self.requested_page)
+
+    def finish_loading(self):
+        """Runs every remaining loading step right away."""
+        if self.loader is None:
+            return
+        if self.load_job is not None:
+            self.after_cancel(self.load_job)
+            self.load_job = None
+        for _ in self.loader:
+            pass
+        self.loader = None
+        self.frames["MainMenuFrame"].show_progress(None)
+        if self.requested_page is not None:
+            self.show_frame(self.requested_page)
+
+    def is_loaded(self, page_name):
+        """Returns True if a page can be shown. AchievementsFrame can be
+        shown once every row of it's current category is built.
+        """
+        if page_name == "MainMenuFrame":
+            return True
+        if not self.catalog_loaded:
+            return False
+        if page_name == "AchievementsFrame":
+            category = self.frames[page_name].cur_category_name
+            return not self.pending_rows[category]
+        return True
+
+    def prioritize_category(self, category):
+        """Builds the rows of a category before the other categories' rows.
+        """
+        self.row_priority = category
 
-    def init_leveled_achievements(self):
-        """Reads in leveled achievement information from json file and
-        initiates each one. Achievement will be initiated in either
-        CompletedAchievements or UncompletedAchievements.
+    def build_next_row(self):
+        """Builds the row of the next achievement waiting for one, taking
+        achievements of row_priority first.
 
-        Each achievement is stored as an instance of LeveledAchievement.
-        Attributes such as category, title, desc, overall_completed, and
-        info will be stored in a seperate class LeveledAttributes, which
-        can be accessed by each level of each achievement. This is done
-        to save program memory. A reference to each achievement is stored
-        in a list which can be accessed by an index.
+        Ret:
+            (bool): False if every row has been built
         """
+        pending = self.pending_rows[self.row_priority]
+        if not pending:
+            pending = next((rows for rows in self.pending_rows.values()
+                            if rows), None)
+            if pending is None:
+                return False
+        unit = pending.popleft()
+        # Only one level of a leveled achievement is shown in it's row:
+        # the first level to not be completed, or the last level if every
+        # level is completed. Rows are built from the current state of the
+        # model, so changes made while loading are included.
+        if isinstance(unit, LeveledAttributes):
+            achievement = unit.shown_lvl
+        else:
+            achievement = unit
+        self.frames["AchievementsFrame"].init_achievement_frame(achievement)
+        return True
 
-        # Initiating leveled achievements
+    def read_achievement_data(self):
+        """Reads in the leveled and list achievement data from the json
+        files.
+        """
         file = APP_PATH + "src\\\\leveled_achievements.json"
         with open(file, 'r') as json_file:
             # read in achievement data into a dictionary.
             self.leveled_data = json.load(json_file)
-
-            for achievement in self.leveled_data['leveled_achievements']:
-                # read in attributes
-                category = achievement['category']
-                title = achievement['title']
-                desc = achievement['description']
-                overall_completed = achievement['overall_completed']
-                info = achievement['info']
-
-                # Reference to the first and last level of achievement.
-                # These are used for creating an instance of the
-                # LeveledAttributes class.
-                first_lvl = None
-                last_lvl = None
-                # To save RAM, category, title, desc, info,
-                # overall_completed, and a reference to the first and last
-                # levels are stored in a seperate class that all levels of
-                # the achievement can access. The first and last level
-                # references are assigned in the loop below.
-                shared_attrs = LeveledAttributes(category, title, desc,
-                                                 info, overall_completed,
-                                                 first_lvl, last_lvl)
-
-                # Set to true once the achievement has been initialized onto
-                # it's category frame. Only the highest level to not be
-                # completed will be initialized as a frame.
-                frame_initialized = False
-
-                for lvl in achievement['levels']:
-                    rom_num = lvl['rom_num']
-                    is_planned = int(lvl['is_planned'])
-                    is_completed = int(lvl['is_completed'])
-                    num_tasks = lvl['num_tasks']
-                    points = int(lvl['points'])
-                    reward_amount = int(lvl['reward_amount'])
-                    reward = lvl['reward']
-
-                    # update stats
-                    reward_type = reward.split("_")[-1]
-                    self.update_stat("possible_achievements", '+', 1)
-                    self.update_stat("possible_points", '+', points)
-                    self.update_stat(
-                        category + "_possible_achievements", '+', 1
-                    )
-                    self.update_stat(
-                        category + "_possible_points", '+', points
-                    )
-                    self.update_stat(
-                        "possible_" + reward_type, '+', reward_amount
-                    )
-
-                    if is_completed == 1:
-                        self.update_stat("completed_achievements", '+', 1)
-                        self.update_stat("completed_points", '+', points)
-                        self.update_stat(
-                            category + "_completed_achievements", '+', 1
-                        )
-                        self.update_stat(
-                            category + "_completed_points", '+', points
-                        )
-                        self.update_stat(
-                            "completed_" + reward_type, '+', reward_amount
-                        )
-                    elif is_planned == 1:
-                        self.update_stat("planned_achievements", '+', 1)
-                        self.update_stat("planned_points", '+', points)
-                        self.update_stat(
-                            category + "_planned_achievements", '+', 1
-                        )
-                        self.update_stat(
-                            category + "_planned_points", '+', points
-                        )
-                        self.update_stat(
-                            "planned_" + reward_type, '+', reward_amount
-                        )
-
-                    this_lvl = LeveledAchievement(
-                        rom_num, is_planned, is_completed, num_tasks, points,
-                        reward_amount, reward, self.list_index, shared_attrs
-                    )
-
-                    if (rom_num == "I"):
-                        shared_attrs.first_lvl = this_lvl
-                    if (lvl == achievement['levels'][-1]):
-                        shared_attrs.last_lvl = this_lvl
-
-                    # add level to achievement list
-                    self.achievement_list.append(this_lvl)
-                    self.list_index += 1
-
-                    # if achievement is completed, initiate last level frame
-                    # in CompletedAchievements
-                    if (overall_completed == "1"):
-                        # if last level has been initialized as a
-                        # LeveledAchievement
-                        if (lvl == achievement['levels'][-1]):
-                            self.frames["CompletedAchievements"]. \
-                                init_achievement_frame(this_lvl)
-                            break
-                        # else loop through until last lvl has been initialized
-                        else:
-                            continue
-                    # else initiate in UncompletedAchievements
-                    else:
-                        # Only the first level of the achievement to not be
-                        # completed will be shown in the category frame.
-                        # Therefore, if the level has been completed, skip to
-                        # the next level.
-                        if is_completed == 1:
-                            continue
-
-                        # if this is the next level to be completed, initialize
-                        # it as a frame in AchievementsFrame
-                        if not frame_initialized:
-                            self.frames["UncompletedAchievements"]. \
-                                init_achievement_frame(this_lvl)
-                            frame_initialized = True
-                        # else achievement level has not been completed yet,
-                        # and a lower level has already been initialized as
-                        # a frame
-                        else:
-                            continue
-
-    def init_list_achievements(self):
-        """Reads in list achievement information from json file and initiates
-        each one. Achievement will be initiated in either CompletedAchievements
-        or UncompletedAchievements.
-
-        Each achievement is stored as an instance of ListAchievement. A
-        reference to each achievement is stored in a list which can be
-        accessed by an index.
-        """
-
-        # Initiating list achievements
         file = APP_PATH + "src\\\\list_achievements.json"
         with open(file, 'r') as json_file:
             self.list_data = json.load(json_file)
 
-            for achievement in self.list_data['list_achievements']:
-                category = achievement['category']
-                title = achievement['title']
-                desc = achievement['description']
-                task_list = achievement['task_list']
-                is_planned = int(achievement['is_planned'])
-                is_completed = int(achievement['is_completed'])
-                points = int(achievement['points'])
-                reward_amount = int(achievement['reward_amount'])
-                reward = achievement['reward']
-                info = achievement['info']
-
-                # update stats
-                reward_type = reward.split("_")[-1]
-                self.update_stat("possible_achievements", '+', 1)
-                self.update_stat("possible_points", '+', points)
-                self.update_stat(category + "_possible_achievements", '+', 1)
-                self.update_stat(category + "_possible_points", '+', points)
-                self.update_stat("possible_" + reward_type, '+', reward_amount)
-
-                if is_completed == 1:
-                    self.update_stat("completed_achievements", '+', 1)
-                    self.update_stat("completed_points", '+', points)
-                    self.update_stat(
-                        category + "_completed_achievements", '+', 1
-                    )
-                    self.update_stat(
-                        category + "_completed_points", '+', points
-                    )
-                    self.update_stat(
-                        "completed_" + reward_type, '+', reward_amount
-                    )
-                elif is_planned == 1:
-                    self.update_stat("planned_achievements", '+', 1)
-                    self.update_stat("planned_points", '+', points)
-                    self.update_stat(
-                        category + "_planned_achievements", '+', 1
-                    )
-                    self.update_stat(
-                        category + "_planned_points", '+', points
-                    )
-                    self.update_stat(
-                        "planned_" + reward_type, '+', reward_amount
-                    )
-
-                # a Frame has not yet been initialized
-                frame = None
-                list_achievement = ListAchievement(
-                    category, title, desc, task_list, is_planned,
-                    is_completed, points, reward_amount, reward,
-                    self.list_index, info, frame
+    def init_leveled_achievement(self, achievement):
+        """Initiates a leveled achievement read from the json file. It's
+        row in AchievementsFrame is built later, see build_next_row().
+
+        Each achievement is stored as an instance of LeveledAchievement.
+        Attributes such as category, title, desc, overall_completed, and
+        info will be stored in a seperate class LeveledAttributes, which
+        can be accessed by each level of each achievement. This is done
+        to save program memory. A reference to each achievement is stored
+        in a list which can be accessed by an index.
+
+        Args:
+            achievement (dict): the achievement's data in leveled_data
+        """
+        # read in attributes
+        category = achievement['category']
+        title = achievement['title']
+        desc = achievement['description']
+        overall_completed = achievement['overall_completed']
+        info = achievement['info']
+
+        # To save RAM, category, title, desc, info,
+        # overall_completed, and the levels of the achievement are
+        # stored in a seperate class that all levels of the
+        # achievement can access. The levels are added in the
+        # loop below.
+        shared_attrs = LeveledAttributes(category, title, desc,
+                                         info, overall_completed)
+
+        for lvl in achievement['levels']:
+            rom_num = lvl['rom_num']
+            is_planned = int(lvl['is_planned'])
+            is_completed = int(lvl['is_completed'])
+            num_tasks = lvl['num_tasks']
+            points = int(lvl['points'])
+            reward_amount = int(lvl['reward_amount'])
+            reward = lvl['reward']
+
+            # update stats
+            # the reward is parsed once here, which also checks
+            # that it's reward type is known
+            reward_type = get_reward_type(reward)
+            self.update_stat("possible_achievements", '+', 1)
+            self.update_stat("possible_points", '+', points)
+            self.update_stat(
+                category + "_possible_achievements", '+', 1
+            )
+            self.update_stat(
+                category + "_possible_points", '+', points
+            )
+            self.update_stat(
+                reward_type.possible_key, '+', reward_amount
+            )
+
+            if is_completed == 1:
+                self.update_stat("completed_achievements", '+', 1)
+                self.update_stat("completed_points", '+', points)
+                self.update_stat(
+                    category + "_completed_achievements", '+', 1
+                )
+                self.update_stat(
+                    category + "_completed_points", '+', points
+                )
+                self.update_stat(
+                    reward_type.completed_key, '+', reward_amount
+                )
+            elif is_planned == 1:
+                self.update_stat("planned_achievements", '+', 1)
+                self.update_stat("planned_points", '+', points)
+                self.update_stat(
+                    category + "_planned_achievements", '+', 1
+                )
+                self.update_stat(
+                    category + "_planned_points", '+', points
+                )
+                self.update_stat(
+                    reward_type.planned_key, '+', reward_amount
                 )
 
-                # add achievement to list
-                self.achievement_list.append(list_achievement)
-                self.list_index += 1
+            this_lvl = LeveledAchievement(
+                rom_num, is_planned, is_completed, num_tasks, points,
+                reward_amount, reward, self.list_index, shared_attrs
+            )
 
-                # if achievement is completed,
-                # initiate frame in CompletedAchievements
-                if is_completed == 1:
-                    self.frames["CompletedAchievements"]. \
-                        init_achievement_frame(list_achievement)
-                # else initiate in AchievementsAchievements
-                else:
-                    self.frames["UncompletedAchievements"]. \
-                        init_achievement_frame(list_achievement)
+            shared_attrs.add_level(this_lvl)
+
+            # add level to achievement list
+            self.achievement_list.append(this_lvl)
+            self.list_index += 1
+
+        self.pending_rows[category].append(shared_attrs)
 
-    def complete_achievement(self, achievement):
-        """Initializes given achievement in CompletedAchievements.
+    def init_list_achievement(self, achievement):
+        """Initiates a list achievement read from the json file. It's row in
+        AchievementsFrame is built later, see build_next_row().
+
+        Each achievement is stored as an instance of ListAchievement. A
+        reference to each achievement is stored in a list which can be
+        accessed by an index.
 
-        For leveled achievements, the last level must be passed in.
+        Args:
+            achievement (dict): the achievement's data in list_data
         """
-        self.frames["CompletedAchievements"]. \
-            init_achievement_frame(achievement)
+        category = achievement['category']
+        title = achievement['title']
+        desc = achievement['description']
+        task_list = achievement['task_list']
+        is_planned = int(achievement['is_planned'])
+        is_completed = int(achievement['is_completed'])
+        points = int(achievement['points'])
+        reward_amount = int(achievement['reward_amount'])
+        reward = achievement['reward']
+        info = achievement['info']
+
+        # update stats
+        # the reward is parsed once here, which also checks
+        # that it's reward type is known
+        reward_type = get_reward_type(reward)
+        self.update_stat("possible_achievements", '+', 1)
+        self.update_stat("possible_points", '+', points)
+        self.update_stat(category + "_possible_achievements", '+', 1)
+        self.update_stat(category + "_possible_points", '+', points)
+        self.update_stat(reward_type.possible_key, '+', reward_amount)
+
+        if is_completed == 1:
+            self.update_stat("completed_achievements", '+', 1)
+            self.update_stat("completed_points", '+', points)
+            self.update_stat(
+                category + "_completed_achievements", '+', 1
+            )
+            self.update_stat(
+                category + "_completed_points", '+', points
+            )
+            self.update_stat(
+                reward_type.completed_key, '+', reward_amount
+            )
+        elif is_planned == 1:
+            self.update_stat("planned_achievements", '+', 1)
+            self.update_stat("planned_points", '+', points)
+            self.update_stat(
+                category + "_planned_achievements", '+', 1
+            )
+            self.update_stat(
+                category + "_planned_points", '+', points
+            )
+            self.update_stat(
+                reward_type.planned_key, '+', reward_amount
+            )
+
+        list_achievement = ListAchievement(
+            category, title, desc, task_list, is_planned,
+            is_completed, points, reward_amount, reward,
+            self.list_index, info
+        )
 
-    def update_achievement(self, achievement):
-        """Updates achievement frame in UncompletedAchievements.
+        # add achievement to list
+        self.achievement_list.append(list_achievement)
+        self.list_index += 1
 
-        This is called when the user completes one of the levels of the
-        achievement. The frame is reinitialized onto UncompletedAchievements
-        containing updated info about the next level, ie. creates frame with
-        new levels lvl_rom_num and num_tasks.
+        self.pending_rows[category].append(list_achievement)
 
-        This method can also be called in the unlikely event that the user
-        unchecks the completed checkbox after the achievement is marked as
-        completed. This method would move that achievement back onto
-        UncompletedAchievements. This works for list achievements as well.
+    def build_search_index(self, units, start=0):
+        """Adds the next INDEX_CHUNK_SIZE achievements to the search index
+        and schedules the rest.
 
         Args:
-            achievement (ListAchievement or LeveledAchievement):
-                reference to an achievement. If passing in a leveled
-                achievement, the next level to be completed must be
-                passed in.
+            units (list): every achievement, see SearchIndex.add()
+            start (int): index in units of the next achievement to add
         """
-        self.frames["UncompletedAchievements"].init_achievement_frame(
-            achievement)
+        end = start + INDEX_CHUNK_SIZE
+        self.search_index.add(units[start:end])
+        if end < len(units):
+            self.after(1, self.build_search_index, units, end)
 
     def update_stat(self, stat, operator, amount):
         """Calls update_stat in OverviewFrame.
@@ -406,57 +648,141 @@ class AppController(tk.Tk):
             self.frames["OverviewFrame"], stat, operator, amount
         )
 
+    def update_stats(self, stat_delta):
+        """Calls update_stats in OverviewFrame.
+
+        Args:
+            stat_delta (dict): maps stats to the amount they changed by
+        """
+        self.frames["OverviewFrame"].update_stats(stat_delta)
+
+    def bulk_update(self, units, action):
+        """Applies a bulk action to several achievements at once. The change
+        is published once, so statistics are updated once and each affected
+        category is rebuilt once.
+
+        Args:
+            units (list): LeveledAttributes for leveled achievements and
+                ListAchievement for list achievements
+            action (string): one of BULK_ACTIONS
+        """
+        bulk_action(units, action)
+
+    def on_achievements_changed(self, change):
+        """Records a change published by the achievement model and updates
+        the statistics.
+
+        Args:
+            change (Change): the change, see command_log.py
+        """
+        if not self.replaying:
+            self.command_log.record(change)
+        self.update_stats(change.stat_delta)
+
+    def undo(self, event=None):
+        """Undoes the last change made to the checkboxes. Ctrl+Z pressed
+        while typing in the search is left to the text being edited.
+        """
+        if is_typing(event):
+            return
+        change = self.command_log.undo()
+        if change is not None:
+            self.replay(change)
+
+    def redo(self, event=None):
+        """Redoes the last undone change, unless typing in the search."""
+        if is_typing(event):
+            return
+        change = self.command_log.redo()
+        if change is not None:
+            self.replay(change)
+
+    def replay(self, change):
+        """Applies an undone or redone change without recording it."""
+        self.replaying = True
+        try:
+            apply_change(change)
+        finally:
+            self.replaying = False
+
+    def get_milestone_chains(self):
+        """Returns the uncompleted levels of every achievement as chains
+        that can be passed to milestone_planner.plan_milestone(). The ref of
+        each PlanItem is the corresponding achievement instance.
+        """
+        chains = []
+        for achievement in self.achievement_list:
+            if isinstance(achievement, LeveledAchievement):
+                shared_attrs = achievement.shared_attrs
+                # each leveled achievement is added once, at it's first level
+                if achievement != shared_attrs.first_lvl:
+                    continue
+                levels = [
+                    (lvl.level_rom_num, lvl.num_tasks, lvl.points,
+                     lvl.is_completed, lvl)
+                    for lvl in shared_attrs.levels
+                ]
+                chain = leveled_chain(shared_attrs.title, levels)
+            elif achievement.is_completed == 1:
+                continue
+            else:
+                chain = [PlanItem(achievement.title, None, achievement.points,
+                                  len(achievement.task_list), achievement)]
+            if chain:
+                chains.append(chain)
+        return chains
+
+    def plan_achievements(self, items):
+        """Marks every given achievement as planned.
+
+        Args:
+            items (list of PlanItems): items of a Plan. Items are in chain
+                order, so each level is checked after the levels below it.
+        """
+        # the whole plan is undone in one step
+        with self.command_log.batch():
+            for item in items:
+                achievement = item.ref
+                if achievement.is_planned == 1:
+                    continue
+                achievement.set_planned(1)
+
     def save_achievement_data(self):
         """Saves achievement data to json file.
 
         Data saved includes planned and completed variable data.
         """
+        # nothing can have changed before the catalog is loaded, and the
+        # statistics recorded in the history would be incomplete
+        if not self.catalog_loaded:
+            return
 
         # save leveled achievements
         for achievement in self.leveled_data["leveled_achievements"]:
             # if the achievement is set to be saved
             if(self.write_achievements.__contains__(achievement["title"])):
-                try:
-                    # save leveled data by working up from Level I
-                    cur_lvl_index = self.write_achievements[
-                        achievement["title"]].list_index
-                    cur_lvl = self.achievement_list[cur_lvl_index]
-                    # level is the index of the achievement level in .json file
-                    level = 0
-                    # loop through all levels of achievement
-                    while (
-                        cur_lvl.shared_attrs ==
-                        self.write_achievements[achievement["title"]].
-                        shared_attrs
-                    ):
-                        achievement["levels"][level]["is_planned"] = \
-                            str(cur_lvl.planned_var.get())
-                        achievement["levels"][level]["is_completed"] = \
-                            str(cur_lvl.completed_var.get())
-                        level += 1
-                        cur_lvl_index += 1
-                        cur_lvl = self.achievement_list[cur_lvl_index]
-                    achievement["overall_completed"] = \
-                        str(self.write_achievements[achievement["title"]].
-                            shared_attrs.overall_completed)
-                # list may go out of bounds if at the end or beginning of list
-                # it may also reach a ListAchievement, which would throw
-                # an AttributeError
-                except (IndexError, AttributeError):
-                    pass
-
-                achievement["overall_completed"] = str(self.write_achievements[
-                    achievement["title"]].shared_attrs.overall_completed)
+                shared_attrs = self.write_achievements[
+                    achievement["title"]].shared_attrs
+                # save leveled data by working up from Level I. level is
+                # the index of the achievement level in .json file
+                for level, cur_lvl in enumerate(shared_attrs.levels):
+                    achievement["levels"][level]["is_planned"] = \
+                        str(cur_lvl.is_planned)
+                    achievement["levels"][level]["is_completed"] = \
+                        str(cur_lvl.is_completed)
+
+                achievement["overall_completed"] = \
+                    str(shared_attrs.overall_completed)
 
         # saving list achievement data
         for achievement in self.list_data["list_achievements"]:
             if(self.write_achievements.__contains__(achievement["title"])):
                 achievement["is_planned"] = \
                     str(self.write_achievements[achievement[
-                        "title"]].planned_var.get())
+                        "title"]].is_planned)
                 achievement["is_completed"] = \
                     str(self.write_achievements[achievement[
-                        "title"]].completed_var.get())
+                        "title"]].is_completed)
         # write data to file
         file = APP_PATH + "src\\\\leveled_achievements.json"
         with open(file, 'w') as json_file:
@@ -465,13 +791,115 @@ class AppController(tk.Tk):
         with open(file, 'w') as json_file:
             json.dump(self.list_data, json_file, indent=2)
 
+        # record a snapshot of the statistics in the history
+        self.history.append(self.frames["OverviewFrame"].stat_dict)
+
+    def active_scrollable(self):
+        """Returns the ScrollableFrame of the current page that wheel events
+        go to when the pointer isn't over one: the open info frame or the
+        current category of an AchievementsFrame, or the list of reward
+        sources in the Overview.
+        """
+        frame = self.frames.get(self.current_page)
+        if isinstance(frame, AchievementsFrame):
+            if frame.open_info is not None:
+                info_frame = frame.info_frames[frame.open_info][0]
+                if info_frame.winfo_ismapped():
+                    return info_frame
+            return frame.cur_category
+        if isinstance(frame, OverviewFrame):
+            return frame.reward_list
+        return None
+
+    def trace(self, action):
+        """Times an interaction from now until Tk next goes idle. Does
+        nothing unless tracing is on.
+
+        Args:
+            action (string): what the user did, ie. "main_menu.overview"
+        """
+        if self.latency is None or self.tracing:
+            return
+        self.tracing = True
+        self.after_idle(self.finish_trace, self.latency.start(action))
+
+    def finish_trace(self, token):
+        """Records the latency of an interaction started with trace()."""
+        # redraws scheduled by the other idle callbacks are done before
+        # the time is taken
+        self.update_idletasks()
+        self.tracing = False
+        self.latency.finish(token)
+
+    def print_latency(self):
+        """Prints the latency of every traced interaction."""
+        if self.latency is not None:
+            print(self.latency.format_summary())
+
+    def image_groups(self):
+        """Returns the photo images kept by the frames, by what they're
+        used for. Used by diagnostics.memory_report().
+
+        Ret:
+            (OrderedDict): maps each description to a list of PhotoImages
+        """
+        groups = collections.OrderedDict()
+        backgrounds = []
+        for layout in (
+            self.frames["MainMenuFrame"].layout,
+            getattr(self.frames.get("OverviewFrame"), "layout", None),
+            AchievementsFrame.layout
+        ):
+            if layout is not None:
+                backgrounds.append(layout.background)
+                backgrounds.extend(layout.pressed.values())
+        groups["backgrounds"] = backgrounds
+        groups["reward_images"] = list(
+            AchievementImages.reward_images.values())
+        groups["points_images"] = list(
+            AchievementImages.points_images.values())
+        overview = self.frames.get("OverviewFrame")
+        groups["reward_icons"] = (list(overview.reward_icons.values())
+                                  if overview is not None else [])
+        groups["overview_panels"] = (
+            [image for image, _ in overview.panel_cache.values()]
+            if overview is not None else [])
+        groups["exit_x"] = ([AchievementsFrame.exit_x]
+                            if AchievementsFrame.exit_x is not None else [])
+        return groups
+
+    def show_achievements(self, status):
+        """Shows AchievementsFrame with a status filter, starting at the
+        'GM' category.
+
+        Args:
+            status (string): one of STATUSES
+        """
+        self.achievements_status = status
+        frame = self.frames.get("AchievementsFrame")
+        # else the status is set when the frame is created
+        if frame is not None:
+            frame.set_status(status)
+            # fixes bug where starting frame couldn't be scrolled until
+            # a category button was clicked
+            frame.show_category("GM")
+        self.prioritize_category("GM")
+        self.show_frame("AchievementsFrame")
+
     def show_frame(self, page_name):
-        """Shows a frame for the given page name"""
+        """Shows a frame for the given page name. A page that is still
+        loading is shown by run_loader() once it's loaded.
+        """
+        if not self.is_loaded(page_name):
+            self.requested_page = page_name
+            return
+        self.requested_page = None
         if page_name == "OverviewFrame":
             # update display
             self.frames["OverviewFrame"].draw_canvas()
         frame = self.frames[page_name]
         frame.tkraise()
+        self.current_page = page_name
 
 
 class MainMenuFrame(tk.Frame):
@@ -516,187 +944,82 @@ class MainMenuFrame(tk.Frame):
         # frame forward when the user requests it.
         self.controller = controller
 
-        # assigned in init_image()
-        self.tk_background = None
-        self.tk_overview_clicked = None
-        self.tk_achievements_clicked = None
-        self.tk_completed_clicked = None
-        self.tk_credits_clicked = None
-        self.tk_save_clicked = None
-        self.tk_exit_clicked = None
-
-        # Initialize the frame with buttons/text
-        self.init_images()
+        # Background and buttons of this frame, see layout.py
+        self.layout = compose_layout(MAIN_MENU_LAYOUT)
 
         # Placing background image onto main menu frame
 
         # Use self as the parent since we are placing
         # this label onto the frame
-        self.main_menu_label = tk.Label(self, image=self.tk_background)
+        self.main_menu_label = tk.Label(self, image=self.layout.background)
         self.main_menu_label.place(height=WINDOW_H, width=WINDOW_W)
 
         # Adding functionality to buttons
         self.main_menu_label.bind('<Button-1>', self.on_click)
 
-    def init_images(self):
-        """Initializes the background image, text, and
-        buttons for this frame.
-        """
-
-        # Initializing background and button images
-        path = APP_PATH + "images\\\\buttons\\\\"
-        background_img = Image.open(APP_PATH + "images\\\\background.png")
-        program_title_img = Image.open(path + "program_title.png")
-        overview_btn_img = Image.open(path + "overview.png")
-        achievements_btn_img = Image.open(path + "achievements.png")
-        completed_btn_img = Image.open(path + "completed.png")
-        save_btn_img = Image.open(path + "save.png")
-        exit_btn_img = Image.open(path + "exit.png")
-        # Red buttons will be used to indicate when the user
-        # has clicked a button.
-        overview_red_btn_img = Image.open(path + "overview_red.png")
-        achievements_red_btn_img = Image.open(path + "achievements_red.png")
-        completed_red_btn_img = Image.open(path + "completed_red.png")
-        save_red_btn_img = Image.open(path + "save_red.png")
-        exit_red_btn_img = Image.open(path + "exit_red.png")
-
-        # Shrinking button images
-        for img in (
-            overview_btn_img, achievements_btn_img,
-            completed_btn_img, save_btn_img, exit_btn_img,
-            overview_red_btn_img, achievements_red_btn_img,
-            completed_red_btn_img, save_red_btn_img,
-            exit_red_btn_img
-        ):
-            img.thumbnail(BUTTON_SIZE, Image.BICUBIC)
-
-        # paste button images onto backgrond
-        # third argument is a mask that allows button
-        # backgrounds to be transparent
-        background_img.paste(program_title_img, (150, 40),
-                             program_title_img)
-        background_img.paste(overview_btn_img, (150, 240),
-                             overview_btn_img)
-        background_img.paste(achievements_btn_img, (150, 340),
-                             achievements_btn_img)
-        background_img.paste(completed_btn_img, (150, 440),
-                             completed_btn_img)
-        background_img.paste(save_btn_img, (1200, 40),
-                             save_btn_img)
-        background_img.paste(exit_btn_img, (1300, 40),
-                             exit_btn_img)
-
-        # Convert the Image object into a TkPhoto object
-
-        self.tk_background = ImageTk.PhotoImage(background_img)
-
-        # Placing red buttons over original buttons
-
-        # When a user clicks a button, the intended effect is for the
-        # button to turn red and then back to yellow upon release.
-        # To simulate this, each button has an assosciated
-        # image where only that button is red. Once the user clicks on
-        # the button, the corresponding image will be placed over the
-        # frame to give this illusion. The image is then removed to
-        # restore the button back to yellow. Red button images are
-        # pasted and stored now to allow for quicker access in on_click().
-
-        # Create copies of background image so button images
-        # aren't pasted over the same image
-        overview_clicked = copy.deepcopy(background_img)
-        achievements_clicked = copy.deepcopy(background_img)
-        completed_clicked = copy.deepcopy(background_img)
-        save_clicked = copy.deepcopy(background_img)
-        exit_clicked = copy.deepcopy(background_img)
-
-        # Pasting button images over original buttons
-        overview_clicked.paste(overview_red_btn_img,
-                               (150, 240),
-                               overview_red_btn_img)
-        self.tk_overview_clicked = ImageTk.PhotoImage(overview_clicked)
-        achievements_clicked.paste(achievements_red_btn_img,
-                                   (150, 340),
-                                   achievements_red_btn_img)
-        self.tk_achievements_clicked = ImageTk.PhotoImage(achievements_clicked)
-        completed_clicked.paste(completed_red_btn_img,
-                                (150, 440),
-                                completed_red_btn_img)
-        self.tk_completed_clicked = ImageTk.PhotoImage(completed_clicked)
-        save_clicked.paste(save_red_btn_img,
-                           (1200, 40),
-                           save_red_btn_img)
-        self.tk_save_clicked = ImageTk.PhotoImage(save_clicked)
-        exit_clicked.paste(exit_red_btn_img,
-                           (1300, 40),
-                           exit_red_btn_img)
-        self.tk_exit_clicked = ImageTk.PhotoImage(exit_clicked)
+        # Shows how much of the catalog has been loaded, see
+        # AppController.run_loader()
+        self.progress_label = tk.Label(
+            self, fg='#DEDF00', bg='#121111',
+            font=font.Font(family='Helvetica', size=12))
+        self.progress_label.place(x=75, y=560)
+        self.show_progress((0, None))
 
-    def on_click(self, event):
-        """Turns the clicked on button to red and carries out corresponding
-        action.
-        """
-        x = event.x
-        y = event.y
-
-        # if "Overview" was clicked
-        if 75 <= x <= 245 and 240 <= y <= 285:
-
-            # On button click, turn button to red
-            self.main_menu_label.configure(image=self.tk_overview_clicked)
-            # Go to overview frame and turn button back to yellow
-            self.main_menu_label.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    self.controller.show_frame("OverviewFrame"),
-                    self.main_menu_label.configure(image=self.tk_background),
-                    self.main_menu_label.unbind("<ButtonRelease-1>")
-                ]
-            )
+    def show_progress(self, progress):
+        """Shows the loading progress under the buttons.
 
-        # if "Achievements" was clicked
-        elif 75 <= x <= 305 and 340 <= y <= 385:
-            self.main_menu_label.configure(image=self.tk_achievements_clicked)
-            self.main_menu_label.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    self.controller.show_frame("UncompletedAchievements"),
-                    self.main_menu_label.configure(image=self.tk_background),
-                    self.main_menu_label.unbind("<ButtonRelease-1>")
-                ]
-            )
+        Args:
+            progress (tuple): (steps done, total steps), total is None
+                while it isn't known yet. None once loading is done.
+        """
+        if progress is None:
+            self.progress_label.place_forget()
+            return
+        done, total = progress
+        if total is None:
+            self.progress_label.configure(text="Loading achievements...")
+        else:
+            self.progress_label.configure(
+                text=f"Loading achievements... {100 * done // total}%")
 
-            # fixes bug where starting frame couldn't be scrolled until
-            # a category button was clicked
-            self.controller.frames["UncompletedAchievements"].show_category(
-                "GM")
-        # if "Completed" was clicked
-        elif 75 <= x <= 245 and 440 <= y <= 485:
-
-            self.main_menu_label.configure(image=self.tk_completed_clicked)
-            self.main_menu_label.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    self.controller.show_frame("CompletedAchievements"),
-                    self.main_menu_label.configure(image=self.tk_background),
-                    self.main_menu_label.unbind("<ButtonRelease-1>")
-                ]
-            )
+    def on_click(self, event):
+        """Turns the clicked on button to red and carries out it's action
+        once the mouse button is released.
+        """
+        button = self.layout.hit_grid.find(event.x, event.y)
+        if button is None:
+            return
+        action = "main_menu." + button.name
+        self.controller.trace(action)
+
+        # On button click, turn button to red
+        self.main_menu_label.configure(image=self.layout.pressed[button.name])
+        # Carry out the action and turn button back to yellow
+        self.main_menu_label.bind(
+            "<ButtonRelease-1>", lambda event: [
+                self.controller.trace(action + " release"),
+                self.main_menu_label.configure(image=self.layout.background),
+                self.main_menu_label.unbind("<ButtonRelease-1>"),
+                self.on_button(button)
+            ]
+        )
 
-            # fixes bug where starting frame couldn't be scrolled until
-            # a category button was clicked
-            self.controller.frames["CompletedAchievements"].show_category("GM")
-        # if "Save" was clicked
-        elif 1120 <= x <= 1200 and 40 <= y <= 85:
-
-            self.main_menu_label.configure(image=self.tk_save_clicked)
-            self.main_menu_label.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    self.controller.save_achievement_data(),
-                    self.main_menu_label.configure(image=self.tk_background)
-                ]
-            )
-        # if "Exit" is pressed
-        elif 1230 <= x <= 1290 and 40 <= y <= 85:
-            self.main_menu_label.configure(image=self.tk_exit_clicked)
-            self.main_menu_label.bind("<ButtonRelease-1>", lambda event:
-                                      root.destroy())
+    def on_button(self, button):
+        """Carries out the action of a clicked button.
+
+        Args:
+            button (Button): see MAIN_MENU_LAYOUT
+        """
+        if button.action == "show_page":
+            self.controller.show_frame(button.arg)
+        elif button.action == "show_achievements":
+            # "Achievements" and "Completed" show the same frame, with a
+            # different status filter
+            self.controller.show_achievements(button.arg)
+        elif button.action == "save":
+            self.controller.save_achievement_data()
+        elif button.action == "exit":
+            self.controller.destroy()
 
 
 class OverviewFrame(tk.Frame):
@@ -721,13 +1044,12 @@ class OverviewFrame(tk.Frame):
 
         self.controller = controller
 
-        # assigned in init_image()
-        self.tk_bg_img = None
-        self.tk_back_clicked = None
+        # Background and buttons of this frame, see layout.py
+        self.layout = compose_layout(OVERVIEW_LAYOUT)
         # for displaying stats related to rewards
         self.reward_icons = {}
 
-        # Initialize the background image with buttons/text
+        # Initialize the reward icons
         self.init_images()
 
         # OverviewFrame uses a canvas instead of a frame
@@ -735,71 +1057,63 @@ class OverviewFrame(tk.Frame):
                                          borderwidth=0, highlightthickness=0)
 
         # a dictionary of statistics
-        self.stat_dict = {}
-
-        # intitialize statistics related to points and achievements
         # References to statistics on the canvas are initialized in
         # draw_canvas()
-        for adj in ("completed_", "planned_", "possible_"):
-            for noun in ("points", "achievements"):
-                for category in ("GM_", "matches_", "honor_", "progress_",
-                                 "items_", "social_", "general_"):
-                    key = category + adj + noun
-                    self.stat_dict[key] = 0
-                # overall points and achievements
-                key = adj + noun
-                self.stat_dict[key] = 0
-
-        # initialize reward statistics
-
-        for adj in ("completed_", "planned_", "possible_"):
-            for reward in (
-                "bp", "silver", "ag", "supply-scrap", "supply-crate",
-                "classic-scrap", "classic-crate", "premium-scrap",
-                "premium-crate", "title", "outfit", "finish", "parachute",
-                "gear", "paint", "misc"
-            ):
-                key = adj + reward
-                self.stat_dict[key] = 0
+        self.stat_dict = {}
+        self.init_stats()
+
+        # Renders the statistics into one image on a worker thread, see
+        # overview_panel.py
+        self.panel_renderer = PanelRenderer(
+            (WINDOW_W, WINDOW_H),
+            APP_PATH + "images\\\\rewards\\\\icons\\\\",
+            APP_PATH + "images\\\\rewards\\\\"
+        )
+        self.render_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1)
+        # Maps PanelSnapshots to their (PhotoImage, HitGrid), least
+        # recently shown first
+        self.panel_cache = collections.OrderedDict()
+        # (snapshot, future) of the panel being rendered, or None
+        self.pending_panel = None
+        # Finds the clickable part of the shown panel image under a click.
+        # None while the statistics are drawn as canvas items.
+        self.panel_hits = None
 
         # initialize achievement milestones
-
-        self.milestones = {
-            "0": (0, "bp"), "50": (300, "bp"), "100": (30, "silver"),
-            "250": (50, "silver"), "500": (2, "premium-crate"),
-            "800": (3, "premium-crate"),
-            "1200": (4, "premium-crate"),
-            "1600": (5, "premium-crate"),
-            "2000": (1, "mechanic_shirt_outfit"),
-            "2400": (1, "high_society_hat_outfit"),
-            "2800": (5, "premium-crate"), "3200": (5, "premium-crate"),
-            "3600": (5, "premium-crate"),
-            "4000": (1, "plague_carrier_mask_outfit"),
-            "4500": (5, "premium-crate"), "5000": (5, "premium-crate"),
-            "5500": (5, "premium-crate")
-        }
+        self.milestones = MILESTONES
+        # Shown in place of the "Plan" button after planning the next
+        # milestone. Reset when leaving the frame.
+        self.plan_message = None
+        # True while the history view is shown instead of the statistics
+        self.show_history = False
+        # While the sources of a reward are shown instead of the
+        # statistics, the reward name or type code and whether it's a type
+        self.reward_view = None
+        # ScrollableFrame listing the sources of the reward, destroyed
+        # whenever the canvas is re-drawn
+        self.reward_list = None
 
         self.prev_milestone, self.next_milestone = self.get_milestones()
+        # highest milestone reached, it's reward and every reward below it
+        # count towards the completed rewards
+        self.reached_milestone = reached_milestone(
+            self.stat_dict["completed_points"])
+
+        # Maps each milestone to the RewardType of it's reward. Parsing
+        # the rewards here also checks that every milestone reward is known.
+        self.milestone_types = {
+            key: get_reward_type(reward)
+            for key, (amount, reward) in self.milestones.items()
+        }
 
         # update stats with milestones
         for key, (amount, reward) in self.milestones.items():
-            try:
-                self.stat_dict["possible_" + reward] += amount
-            # if outfit
-            except KeyError:
-                reward_type = reward.split("_")[-1]
-                self.stat_dict["possible_" + reward_type] += amount
-
-        for key, (amount, reward) in self.milestones.items():
-            if self.prev_milestone == 0:
-                break
-            try:
-                self.stat_dict["completed_" + reward] += amount
-            except KeyError:
-                reward_type = reward.split("_")[-1] + 's'
-                self.stat_dict["possible_" + reward_type] += amount
-            if (key == self.prev_milestone):
-                break
+            reward_type = self.milestone_types[key]
+            self.stat_dict[reward_type.possible_key] += amount
+            # milestones that have already been reached
+            if 0 < int(key) <= self.reached_milestone:
+                self.stat_dict[reward_type.completed_key] += amount
 
         self.overview_canvas.pack()
 
@@ -809,77 +1123,26 @@ class OverviewFrame(tk.Frame):
         # Adding functionality to back button
         self.overview_canvas.bind('<Button-1>', self.on_click)
 
-    def init_images(self):
-        """Initializes the background image, text, and
-        buttons for this frame. Similar code with further
-        explanation can be found in MainMenuFrame class.
-        """
-        path = APP_PATH + "images\\\\buttons\\\\"
-        bg_blur_img = Image.open(APP_PATH + "images\\\\background_blurred.png")
-        back_btn_img = Image.open(path + "back.png")
-
-        # Red buttons will be used to indicate when the user
-        # has clicked a button. These images are used in the
-        # change_button_to_red() method
-        back_red_btn_img = Image.open(path + "back_red.png")
-
-        # Shrinking button images
-        for img in (back_btn_img,
-                    back_red_btn_img):
-            img.thumbnail(BUTTON_SIZE, Image.BICUBIC)
-
-        # Paste button onto background image
-        bg_blur_img.paste(back_btn_img, (150, 40),
-                          back_btn_img)
-
-        # Convert the Image object into a TkPhoto object
-        self.tk_bg_img = ImageTk.PhotoImage(bg_blur_img)
-
-        # Placing red buttons over original buttons
-
-        # Create copies of background image so button images
-        # aren't pasted over the same image
-        back_clicked = copy.deepcopy(bg_blur_img)
-
-        # "Back" is clicked
-        back_clicked.paste(back_red_btn_img, (150, 40), back_red_btn_img)
-        self.tk_back_clicked = ImageTk.PhotoImage(back_clicked)
+        # re-draw the statistics when achievements change while they are
+        # displayed, ie. when undoing
+        self.controller.bus.subscribe(ACHIEVEMENTS_CHANGED,
+                                      self.on_achievements_changed,
+                                      deferred=True)
 
+    def init_images(self):
+        """Initializes the icon of each reward type."""
         path = APP_PATH + "images\\\\rewards\\\\icons\\\\"
-        for icon in ("bp", "silver", "ag", "supply-scrap", "supply-crate",
-                     "classic-scrap", "classic-crate", "premium-scrap",
-                     "premium-crate", "title", "outfit", "finish",
-                     "parachute", "gear", "paint", "misc"):
-            img = Image.open(path + icon + ".png")
+        for code, reward_type in reward_registry.items():
+            img = Image.open(path + reward_type.icon)
             img.thumbnail((45, 45), Image.BICUBIC)
             img = ImageTk.PhotoImage(img)
-            self.reward_icons[icon] = img
+            self.reward_icons[code] = img
 
     def init_stats(self):
         """Initializes all statistics into a dictionary."""
-        # intitialize statistics related to points and achievements
-        # References to statistics on the canvas are initialized in
-        # draw_canvas()
-        for adj in ("completed_", "planned_", "possible_"):
-            for noun in ("points", "achievements"):
-                for category in ("GM_", "matches_", "honor_", "progress_",
-                                 "items_", "social_", "general_"):
-                    key = category + adj + noun
-                    self.stat_dict[key] = 0
-                # overall points and achievements
-                key = adj + noun
-                self.stat_dict[key] = 0
-
-        # initialize reward statistics
-
-        for adj in ("completed_", "planned_", "possible_"):
-            for reward in (
-                "bp", "silver", "ag", "supply-scrap", "supply-crate",
-                "classic-scrap", "classic-crate", "premium-scrap",
-                "premium-crate", "title", "outfit", "finish", "gear", "misc"
-            ):
-                key = adj + reward
-                self.stat_dict[key] = 0
+        # statistics are shared with the headless tools, so their
+        # keys are defined in catalog.py
+        self.stat_dict = new_stat_dict()
 
     def draw_canvas(self):
         """Places statistics onto overview_canvas.
@@ -894,13 +1157,43 @@ class OverviewFrame(tk.Frame):
         size12_bold = font.Font(family='Helvetica', size=12, weight='bold')
         size10 = font.Font(family='Helvetica', size=10)
 
+        # the list of reward sources is placed over the canvas, so it isn't
+        # deleted with the canvas items
+        self.destroy_reward_list()
+
         # Place background onto canvas
         self.overview_canvas.pack()
 
         self.canvas_bg = self.overview_canvas.create_image(
-            (-75, 0), image=self.tk_bg_img, anchor='nw'
+            (-IMAGE_OFFSET, 0), image=self.layout.background, anchor='nw'
         )
 
+        # the statistics are a single image once they have been rendered
+        self.panel_hits = None
+        if (RENDER_OVERVIEW_PANEL and self.reward_view is None
+                and not self.show_history and self.draw_panel()):
+            return
+
+        # clicking "History" switches between statistics and their history
+        if self.show_history or self.reward_view is not None:
+            text = "Statistics"
+        else:
+            text = "History"
+        coord = (1335, 615)
+        self.overview_canvas.create_text(
+            coord, text=text, font=size14_bold, anchor='se',
+            fill="#DEDF00", tags="toggle_history"
+        )
+        self.overview_canvas.tag_bind("toggle_history", "<Button-1>",
+                                      self.toggle_history)
+
+        if self.reward_view is not None:
+            self.draw_reward_sources()
+            return
+        if self.show_history:
+            self.draw_history()
+            return
+
         # overall achievement stats
 
         completed_achievements = self.stat_dict["completed_achievements"]
@@ -952,7 +1245,7 @@ class OverviewFrame(tk.Frame):
 
         # next milestone
         points = self.stat_dict["completed_points"]
-        if points < 5500:
+        if points < FINAL_MILESTONE:
             next_milestone = self.milestones[str(self.next_milestone)]
             text = f"Next Milestone: {self.next_milestone} points     " \
                 + f"Reward:  {next_milestone[0]} x                "
@@ -962,8 +1255,31 @@ class OverviewFrame(tk.Frame):
                 anchor='center', fill="white"
             )
             coord = (855, 165)
-            img = Achievement.reward_images[next_milestone[1]]
-            self.overview_canvas.create_image(coord, image=img)
+            img = AchievementImages.reward_images[next_milestone[1]]
+            # clicking a reward shows every way to earn it
+            self.overview_canvas.create_image(coord, image=img,
+                                              tags="milestone_reward")
+            self.overview_canvas.tag_bind(
+                "milestone_reward", "<Button-1>",
+                lambda event, reward=next_milestone[1]:
+                    self.show_reward_sources(reward, False)
+            )
+
+            # clicking "Plan" marks the cheapest achievements to reach the
+            # next milestone as planned
+            if self.plan_message is None:
+                text = "Plan"
+                fill = "#DEDF00"
+            else:
+                text = self.plan_message
+                fill = "white"
+            coord = (905, 165)
+            self.overview_canvas.create_text(
+                coord, text=text, font=size13_bold, anchor='w',
+                fill=fill, tags="plan_milestone"
+            )
+            self.overview_canvas.tag_bind("plan_milestone", "<Button-1>",
+                                          self.plan_next_milestone)
         else:
             text = "All milestones completed"
             coord = (700, 165)
@@ -1003,9 +1319,8 @@ class OverviewFrame(tk.Frame):
 
         # category titles on left side
         y = 320-35
-        for category in ("GM", "Matches", "Honor", "Progress", "Items",
-                         "Social", "General"):
-            text = category
+        for category in CATEGORIES:
+            text = CATEGORY_TITLES[category]
             coord = (30, y)
             self.overview_canvas.create_text(coord, text=text, fill="white",
                                              font=size14_bold, anchor='nw')
@@ -1013,8 +1328,8 @@ class OverviewFrame(tk.Frame):
 
         # placing category points and achievements in table
         y = 295
-        for category in ("GM_", "matches_", "honor_", "progress_", "items_",
-                         "social_", "general_"):
+        for category in CATEGORIES:
+            category += "_"
             completed_achievements = self.stat_dict[
                 category + "completed_achievements"]
             planned_achievements = self.stat_dict[
@@ -1046,13 +1361,11 @@ class OverviewFrame(tk.Frame):
         y = 240
         count = 0
 
-        for reward in ("bp", "silver", "supply-scrap", "supply-crate",
-                       "classic-scrap", "classic-crate", "premium-scrap",
-                       "premium-crate", "ag", "title", "outfit", "finish",
-                       "parachute", "gear", "paint", "misc"):
-            completed = self.stat_dict["completed_" + reward]
-            planned = self.stat_dict["planned_" + reward]
-            possible = self.stat_dict["possible_" + reward]
+        for reward in REWARD_DISPLAY_ORDER:
+            reward_type = reward_registry[reward]
+            completed = self.stat_dict[reward_type.completed_key]
+            planned = self.stat_dict[reward_type.planned_key]
+            possible = self.stat_dict[reward_type.possible_key]
             # split rewards into two columns
             if count % 2 == 0:
                 x1 = 745-235
@@ -1083,15 +1396,14 @@ class OverviewFrame(tk.Frame):
 
             img = self.reward_icons[reward]
             coord = (x2, y+10)
-            self.overview_canvas.create_image(coord, image=img)
-
-            text = reward.replace("_", " ")
-            if text == "misc":
-                text = "miscellaneous"
-            elif text == "finish":
-                text = "weapon finishes"
-            elif text == "outfit":
-                text = "outfits"
+            tag = "reward_" + reward
+            self.overview_canvas.create_image(coord, image=img, tags=tag)
+            self.overview_canvas.tag_bind(
+                tag, "<Button-1>", lambda event, reward=reward:
+                    self.show_reward_sources(reward, True)
+            )
+
+            text = reward_type.label
             coord = (x2+35, y)
             self.overview_canvas.create_text((coord), text=text, fill="white",
                                              font=size12_bold, anchor='nw')
@@ -1102,11 +1414,307 @@ class OverviewFrame(tk.Frame):
             count += 1
 
         # description at bottom
-        text = "Values in brackets are what you plan to complete"
+        text = "Values in brackets are what you plan to complete. " \
+            + "Click a reward to see where to earn it"
         coord = (10, 605)
         self.overview_canvas.create_text(coord, text=text, fill="white",
                                          font=size10, anchor='nw')
 
+    def draw_panel(self):
+        """Places the rendered image of the current statistics onto
+        overview_canvas. If it hasn't been rendered yet, it's rendered on
+        the worker thread and the canvas is re-drawn once it's done.
+
+        Ret:
+            (bool): True if the image was placed, False if the statistics
+                need to be drawn as canvas items for now
+        """
+        snapshot = panel_snapshot(self.stat_dict, self.next_milestone,
+                                  self.plan_message)
+        cached = self.panel_cache.get(snapshot)
+        if cached is None:
+            self.render_panel(snapshot)
+            return False
+        self.panel_cache.move_to_end(snapshot)
+        image, self.panel_hits = cached
+        self.overview_canvas.create_image((0, 0), image=image, anchor='nw')
+        return True
+
+    def render_panel(self, snapshot):
+        """Starts rendering the statistics of a snapshot on the worker
+        thread. Only the latest snapshot is rendered.
+        """
+        if self.pending_panel is not None:
+            if self.pending_panel[0] == snapshot:
+                return
+            self.pending_panel[1].cancel()
+        else:
+            self.after(PANEL_POLL_MS, self.check_panel)
+        future = self.render_pool.submit(self.panel_renderer.render,
+                                         snapshot)
+        self.pending_panel = (snapshot, future)
+
+    def check_panel(self):
+        """Caches the panel being rendered once it's done, and re-draws
+        the canvas if it still shows the same statistics.
+        """
+        snapshot, future = self.pending_panel
+        if not future.done():
+            self.after(PANEL_POLL_MS, self.check_panel)
+            return
+        self.pending_panel = None
+
+        # PhotoImages can only be created on the Tk thread
+        image, hotspots = future.result()
+        self.panel_cache[snapshot] = (ImageTk.PhotoImage(image),
+                                      HitGrid(hotspots, WINDOW_W, WINDOW_H))
+        if len(self.panel_cache) > PANEL_CACHE_SIZE:
+            self.panel_cache.popitem(last=False)
+
+        if (self.controller.current_page == "OverviewFrame"
+                and self.panel_hits is None and self.reward_view is None
+                and not self.show_history
+                and snapshot == panel_snapshot(self.stat_dict,
+                                               self.next_milestone,
+                                               self.plan_message)):
+            self.overview_canvas.delete("all")
+            self.draw_canvas()
+
+    def on_panel_click(self, tag):
+        """Does what clicking a part of the panel image does, the same as
+        clicking the canvas item with that tag in draw_canvas().
+
+        Args:
+            tag (string): a tag of a hotspot, see PanelRenderer.render()
+        """
+        if tag == "toggle_history":
+            self.toggle_history()
+        elif tag == "plan_milestone":
+            self.plan_next_milestone()
+        elif tag == "milestone_reward":
+            reward = self.milestones[str(self.next_milestone)][1]
+            self.show_reward_sources(reward, False)
+        elif tag.startswith("reward_"):
+            self.show_reward_sources(tag[len("reward_"):], True)
+
+    def destroy(self):
+        """Stops the worker thread before destroying the frame."""
+        self.render_pool.shutdown(wait=False)
+        super().destroy()
+
+    def draw_history(self):
+        """Places the history of the statistics onto overview_canvas.
+
+        Shows the points completed in each of the last weeks as a bar chart,
+        along with how many achievements were completed recently. History
+        is recorded every time the user saves.
+        """
+        size20_bold = font.Font(family='Helvetica', size=20, weight='bold')
+        size14_bold = font.Font(family='Helvetica', size=14, weight='bold')
+        size12_bold = font.Font(family='Helvetica', size=12, weight='bold')
+
+        history = self.controller.history
+
+        text = "History"
+        coord = (685, 45)
+        self.overview_canvas.create_text(coord, text=text, font=size20_bold,
+                                         anchor='center', fill="white")
+
+        if len(history) == 0:
+            text = "No history yet. Your progress is recorded every " \
+                + "time you save."
+            coord = (685, 300)
+            self.overview_canvas.create_text(coord, text=text,
+                                             font=size14_bold,
+                                             anchor='center', fill="white")
+            return
+
+        # achievements completed recently
+        now = int(time.time())
+        y = 100
+        for days in (7, 30, 365):
+            gained = history.gained_since(now - days * DAY, now=now)
+            text = f"Achievements completed in the last {days} days: " \
+                + f"{gained}"
+            coord = (195, y)
+            self.overview_canvas.create_text(coord, text=text,
+                                             font=size14_bold, anchor='nw',
+                                             fill="white")
+            y += 30
+
+        text = f"Saves recorded: {len(history)}"
+        coord = (1150, 100)
+        self.overview_canvas.create_text(coord, text=text, font=size14_bold,
+                                         anchor='ne', fill="white")
+
+        # bar chart of points completed per week
+        text = "Points per Week"
+        coord = (685, 220)
+        self.overview_canvas.create_text(coord, text=text, font=size20_bold,
+                                         anchor='center', fill="white")
+
+        weeks = history.gained_per_period(12, WEEK, "completed_points", now)
+        most = max([gained for start, gained in weeks] + [1])
+        # chart area
+        left, right = 195, 1175
+        bottom, top = 560, 290
+        bar_width = (right - left) / len(weeks)
+        self.overview_canvas.create_line((left, bottom), (right, bottom),
+                                         fill="white")
+        for i, (start, gained) in enumerate(weeks):
+            x = left + i * bar_width
+            height = (bottom - top) * max(gained, 0) / most
+            self.overview_canvas.create_rectangle(
+                (x + 10, bottom - height), (x + bar_width - 10, bottom),
+                fill="#EA9513", outline=""
+            )
+            coord = (x + bar_width / 2, bottom - height - 5)
+            self.overview_canvas.create_text(coord, text=str(gained),
+                                             font=size12_bold, anchor='s',
+                                             fill="white")
+            text = time.strftime("%b %d", time.localtime(start))
+            coord = (x + bar_width / 2, bottom + 5)
+            self.overview_canvas.create_text(coord, text=text,
+                                             font=size12_bold, anchor='n',
+                                             fill="white")
+
+    def draw_reward_sources(self):
+        """Lists every achievement, level and milestone that awards the
+        reward in reward_view, along with whether it's been completed or
+        planned.
+        """
+        size20_bold = font.Font(family='Helvetica', size=20, weight='bold')
+
+        reward, is_type = self.reward_view
+        reward_index = self.controller.reward_index
+        if is_type:
+            label = reward_registry[reward].label
+            sources = reward_index.sources_of_type(reward)
+        else:
+            label = reward.replace("_", " ").replace("-", " ")
+            sources = reward_index.sources(reward)
+
+        text = f"Where to earn {label}"
+        coord = (685, 45)
+        self.overview_canvas.create_text(coord, text=text, font=size20_bold,
+                                         anchor='center', fill="white")
+
+        self.reward_list = ScrollableFrame(self, height=480, width=900,
+                                           bg='#121111')
+        self.reward_list.place(x=685, y=340, anchor='center')
+        # the scroll region is computed once, after every row is added
+        with self.reward_list.batch() as list_frame:
+            self.fill_reward_list(list_frame, sources)
+
+    def fill_reward_list(self, list_frame, sources):
+        """Adds a row to the list of reward sources for each source.
+
+        Args:
+            list_frame (Frame): the scrolled_frame of the list
+            sources (list): see RewardIndex.sources()
+        """
+        size12_bold = font.Font(family='Helvetica', size=12, weight='bold')
+        size12 = font.Font(family='Helvetica', size=12)
+
+        for column, text in enumerate(("Source", "Points", "Reward",
+                                       "Status")):
+            heading = tk.Label(list_frame, text=text, fg='#DEDF00',
+                               bg='#121111', font=size12_bold)
+            heading.grid(row=0, column=column, sticky='w', padx=10)
+
+        completed_points = self.stat_dict["completed_points"]
+        for row, source in enumerate(sources, start=1):
+            # a milestone's points are in it's title
+            if isinstance(source, MilestoneSource):
+                points = ""
+            else:
+                points = source.points
+            reward_text = f"{source.reward_amount} x " \
+                + source.reward.replace("_", " ")
+            for column, text in enumerate((
+                source_title(source), points, reward_text,
+                source_status(source, completed_points)
+            )):
+                cell = tk.Label(list_frame, text=text, fg='white',
+                                bg='#121111', font=size12)
+                cell.grid(row=row, column=column, sticky='w', padx=10)
+
+        if not sources:
+            text = "Nothing awards this reward"
+            empty = tk.Label(list_frame, text=text, fg='white', bg='#121111',
+                             font=size12)
+            empty.grid(row=1, column=0, sticky='w', padx=10)
+
+    def show_reward_sources(self, reward, is_type):
+        """Shows every source of a reward instead of the statistics.
+
+        Args:
+            reward (string): a reward name, or a reward type code
+            is_type (bool): True if reward is a reward type code
+        """
+        self.reward_view = (reward, is_type)
+        self.overview_canvas.delete("all")
+        self.draw_canvas()
+
+    def destroy_reward_list(self):
+        """Destroys the list of reward sources if it's shown."""
+        if self.reward_list is not None:
+            self.reward_list.destroy()
+            self.reward_list = None
+
+    def toggle_history(self, event=None):
+        """Switches between showing statistics and their history. Returns
+        to the statistics if the sources of a reward are shown.
+        """
+        if self.reward_view is not None:
+            self.reward_view = None
+        else:
+            self.show_history = not self.show_history
+        self.overview_canvas.delete("all")
+        self.draw_canvas()
+
+    def clear_canvas(self):
+        """Deletes everything on the canvas and resets the display to the
+        statistics view. Called when leaving the frame.
+        """
+        self.overview_canvas.delete("all")
+        self.destroy_reward_list()
+        self.plan_message = None
+        self.show_history = False
+        self.reward_view = None
+
+    def plan_next_milestone(self, event=None):
+        """Marks the cheapest set of uncompleted achievements that reaches
+        the next milestone as planned, where cost is the number of levels.
+        The display is re-drawn with a summary of what was planned.
+        """
+        if self.plan_message is not None:
+            return
+        points_needed = self.next_milestone \
+            - self.stat_dict["completed_points"]
+        plan = plan_milestone(self.controller.get_milestone_chains(),
+                              points_needed)
+        if plan is None:
+            self.plan_message = "Not enough points left"
+        else:
+            self.controller.plan_achievements(plan.items)
+            self.plan_message = f"Planned {len(plan.items)} " \
+                + f"(+{plan.points} points)"
+
+        self.overview_canvas.delete("all")
+        self.draw_canvas()
+
+    def on_achievements_changed(self, changes):
+        """Re-draws the canvas if this frame is being displayed. Called once
+        per idle callback after achievements have changed.
+
+        Args:
+            changes (list of Changes): every change since the last call
+        """
+        if self.controller.current_page == "OverviewFrame":
+            self.overview_canvas.delete("all")
+            self.draw_canvas()
+
     def update_stat(self, stat, operator, amount):
         """Adds or subtracts a value in stat_dict.
 
@@ -1121,20 +1729,45 @@ class OverviewFrame(tk.Frame):
         else:
             self.stat_dict[stat] -= amount
 
-        points = self.stat_dict["completed_points"]
-        if points >= self.next_milestone:
-            milestone = self.milestones[str(self.next_milestone)]
-            reward_type = milestone[1].split("_")[-1]
-            self.stat_dict["completed_" + reward_type] += milestone[0]
-            self.prev_milestone, self.next_milestone = self.get_milestones()
-        # if user has "uncompleted" some achievements
-        elif points < self.prev_milestone:
-            milestone = self.milestones[str(self.prev_milestone)]
-            reward_type = milestone[1].split("_")[-1]
-            self.stat_dict["completed_" + reward_type] -= milestone[0]
-            self.prev_milestone, self.next_milestone = self.get_milestones()
-        else:
-            pass
+        self.update_milestones()
+
+    def update_stats(self, stat_delta):
+        """Adds several values to stat_dict at once. Milestones are only
+        checked after every value has been added.
+
+        Args:
+            stat_delta (dict): maps stats to the amount they changed by.
+                Amounts are negative for stats that went down.
+        """
+        for stat, amount in stat_delta.items():
+            self.stat_dict[stat] += amount
+
+        self.update_milestones()
+
+    def update_milestones(self):
+        """Adds or removes the rewards of every milestone passed since the
+        last update. More than one milestone can be passed at once, ie. when
+        completing a whole category.
+        """
+        reached = reached_milestone(self.stat_dict["completed_points"])
+        if reached != self.reached_milestone:
+            # rewards are added when going up and removed when going down,
+            # the user may have "uncompleted" some achievements
+            if reached > self.reached_milestone:
+                sign = 1
+            else:
+                sign = -1
+            low = min(reached, self.reached_milestone)
+            high = max(reached, self.reached_milestone)
+            for milestone in MILESTONE_POINTS:
+                if low < milestone <= high:
+                    key = str(milestone)
+                    reward_type = self.milestone_types[key]
+                    self.stat_dict[reward_type.completed_key] += \
+                        sign * self.milestones[key][0]
+            self.reached_milestone = reached
+
+        self.prev_milestone, self.next_milestone = self.get_milestones()
 
     def get_milestones(self):
         """Returns the prev and next milestones based on users
@@ -1144,60 +1777,37 @@ class OverviewFrame(tk.Frame):
             milestones (tuple of ints): (last_milestone,next_milestone)
         """
 
-        points = self.stat_dict["completed_points"]
-        if points < 50:
-            return (0, 50)
-        elif points < 100:
-            return (50, 100)
-        elif points < 250:
-            return (100, 250)
-        elif points < 500:
-            return (250, 500)
-        elif points < 800:
-            return (500, 800)
-        elif points < 1200:
-            return (800, 1200)
-        elif points < 1600:
-            return (1200, 1600)
-        elif points < 2000:
-            return (1600, 2000)
-        elif points < 2400:
-            return (2000, 2400)
-        elif points < 2800:
-            return (2400, 2800)
-        elif points < 3200:
-            return (2800, 3200)
-        elif points < 3600:
-            return (3200, 3600)
-        elif points < 4000:
-            return (3600, 4000)
-        elif points < 4500:
-            return (4000, 4500)
-        elif points < 5000:
-            return (4500, 5000)
-        else:
-            return (5000, 5500)
+        return get_milestones(self.stat_dict["completed_points"])
 
     def on_click(self, event):
         """Turns the clicked on button to red and raises the corresponding
         frame.
         """
-        x = event.x
-        y = event.y
-        # if "Back" was clicked
-        if 75 <= x <= 150 and 40 <= y <= 85:
-            self.overview_canvas.itemconfig(
-                self.canvas_bg, image=self.tk_back_clicked)
-            # Go to Main Menu frame. Everything on the canvas is deleted
-            # and re-drawn upon entering OverviewFrame again.
-            self.overview_canvas.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    self.unbind("<ButtonRelease-1>"),
-                    self.controller.show_frame("MainMenuFrame"),
-                    self.overview_canvas.delete("all"),
-                    self.overview_canvas.unbind("<ButtonRelease-1>")
-                ]
-            )
+        button = self.layout.hit_grid.find(event.x, event.y)
+        if button is None:
+            # the statistics panel image is clicked in one place too
+            tag = (self.panel_hits.find(event.x, event.y)
+                   if self.panel_hits is not None else None)
+            if tag is not None:
+                self.controller.trace("overview." + tag)
+                self.on_panel_click(tag)
+            return
+        action = "overview." + button.name
+        self.controller.trace(action)
+        self.overview_canvas.itemconfig(
+            self.canvas_bg, image=self.layout.pressed[button.name])
+        # The only button is "Back". Go to Main Menu frame. Everything on
+        # the canvas is deleted and re-drawn upon entering OverviewFrame
+        # again.
+        self.overview_canvas.bind(
+            "<ButtonRelease-1>", lambda event: [
+                self.controller.trace(action + " release"),
+                self.unbind("<ButtonRelease-1>"),
+                self.controller.show_frame(button.arg),
+                self.clear_canvas(),
+                self.overview_canvas.unbind("<ButtonRelease-1>")
+            ]
+        )
 
 
 class AchievementsFrame(tk.Frame):
@@ -1210,12 +1820,12 @@ class AchievementsFrame(tk.Frame):
     The user can then check off if they have already completed the achievement
     or if they're planning to complete it via the checkboxes.
 
-    There will be two instances of this class. One will be for uncompleted
-    achievements, the other for completed. These two instances will pass
-    achievements to each other. ie. When the user checks the 'completed'
-    button, this achievements will be passed to the 'Completed instance'
-    and initialized as a frame there. Passing achievements will be done
-    through the Appcontroller.
+    There is a single instance of this class, holding one row for every
+    achievement. A status filter (see sort_filter.STATUSES) chooses whether
+    uncompleted, completed, planned or all achievements are shown. The
+    instance subscribes to changes in the achievement model. ie. When the
+    user checks the 'completed' button, the achievement's row is updated in
+    place and hidden if it no longer passes the status filter.
 
     For a leveled achievement, it is considered completed when all levels
     are completed.
@@ -1223,7 +1833,7 @@ class AchievementsFrame(tk.Frame):
 
     # a list containing a reference to every achievement
     achievement_list = None
-    # The parent and controller will be the same for both instances
+    # The parent and controller of the frame
     parent = None
     controller = None
     # a dictionary for storing achievements that need to be updated in file
@@ -1231,17 +1841,10 @@ class AchievementsFrame(tk.Frame):
 
     # images shared between each instance
 
-    # These contain the background image but with a specific
-    # button turned red to indicate it has been selected.
-    tk_back_clicked = None
-    tk_save_clicked = None
-    tk_GM_clicked = None
-    tk_matches_clicked = None
-    tk_honor_clicked = None
-    tk_progress_clicked = None
-    tk_items_clicked = None
-    tk_social_clicked = None
-    tk_general_clicked = None
+    # Background and buttons of the frame, see layout.py. The pressed
+    # images contain the background image but with a specific button
+    # turned red to indicate it has been selected.
+    layout = None
     # exit button for info frame
     exit_x = None
 
@@ -1254,11 +1857,8 @@ class AchievementsFrame(tk.Frame):
     def static_init(parent, controller, achievement_list, write_achievements):
         """Initializes static variables used in class.
 
-        THe program is set up so that both instances of this class (completed
-        and uncompleted achievements) share the same parent and controller.
-
         Args:
-            parent (Frame): the frame onto all instances of this class
+            parent (Frame): the frame onto which the instance of this class
                 will be placed
             controller (Frame): The controller frame is a way for other frames
                 to interact with each other.
@@ -1283,129 +1883,13 @@ class AchievementsFrame(tk.Frame):
     def init_images():
         """Initializes images and buttons for use in this class
 
-        Refer to init_images() in MainMenuFrame for a more detailed
-        description on red button use.
-        """
-
-        # Initializing background and button images
-        path = APP_PATH + "images\\\\buttons\\\\"
-        background_blur_img = Image.open(
-            APP_PATH + "images\\\\background_blurred.png")
-        back_btn_img = Image.open(path + "back.png")
-        save_btn_img = Image.open(path + "save.png")
-        GM_img = Image.open(path + "glorious_moments.png")
-        matches_img = Image.open(path + "matches.png")
-        honor_img = Image.open(path + "honor.png")
-        progress_img = Image.open(path + "progress.png")
-        items_img = Image.open(path + "items.png")
-        social_img = Image.open(path + "social.png")
-        general_img = Image.open(path + "general.png")
-        # Red buttons will be used to indicate when the user
-        # has clicked a button.
-        back_btn_red_img = Image.open(path + "back_red.png")
-        save_btn_red_img = Image.open(path + "save_red.png")
-        G_M_red_img = Image.open(path + "glorious_moments_red.png")
-        matches_red_img = Image.open(path + "matches_red.png")
-        honor_red_img = Image.open(path + "honor_red.png")
-        progress_red_img = Image.open(path + "progress_red.png")
-        items_red_img = Image.open(path + "items_red.png")
-        social_red_img = Image.open(path + "social_red.png")
-        general_red_img = Image.open(path + "general_red.png")
-
-        # shrinking back button
-        back_btn_img.thumbnail(BUTTON_SIZE, Image.BICUBIC)
-        back_btn_red_img.thumbnail(BUTTON_SIZE, Image.BICUBIC)
-
-        for img in (back_btn_img, back_btn_red_img, save_btn_img,
-                    save_btn_red_img):
-            img.thumbnail(BUTTON_SIZE, Image.BICUBIC)
-
-        # Shrinking category images
-        for img in (GM_img, G_M_red_img, matches_img, matches_red_img,
-                    honor_img, honor_red_img, progress_img,
-                    progress_red_img, items_img, items_red_img,
-                    social_img, social_red_img, general_img,
-                    general_red_img):
-            img.thumbnail((277, 30), Image.BICUBIC)
-
-        # Paste button onto background image
-        background_blur_img.paste(back_btn_img, (150, 40),
-                                  back_btn_img)
-        background_blur_img.paste(save_btn_img, (1200, 40),
-                                  save_btn_img)
-        background_blur_img.paste(GM_img, (980, 90),
-                                  GM_img)
-        background_blur_img.paste(matches_img, (980, 155),
-                                  matches_img)
-        background_blur_img.paste(honor_img, (980, 225),
-                                  honor_img)
-        background_blur_img.paste(progress_img, (980, 295),
-                                  progress_img)
-        background_blur_img.paste(items_img, (980, 365),
-                                  items_img)
-        background_blur_img.paste(social_img, (980, 435),
-                                  social_img)
-        background_blur_img.paste(general_img, (980, 505),
-                                  general_img)
-
-        # add text at bottom right of category frame
-        text = Image.open(APP_PATH + "images\\\\click_on_achievement_txt.png")
-        text.thumbnail((200, 30), Image.BICUBIC)
-        background_blur_img.paste(text, (760, 565), text)
-
-        # Pasting red buttons over original buttons
-
-        # Create copies of background image so button images
-        # aren't pasted over the same image
-        back_clicked = copy.deepcopy(background_blur_img)
-        save_clicked = copy.deepcopy(background_blur_img)
-        GM_clicked = copy.deepcopy(background_blur_img)
-        matches_clicked = copy.deepcopy(background_blur_img)
-        honor_clicked = copy.deepcopy(background_blur_img)
-        progress_clicked = copy.deepcopy(background_blur_img)
-        items_clicked = copy.deepcopy(background_blur_img)
-        social_clicked = copy.deepcopy(background_blur_img)
-        general_clicked = copy.deepcopy(background_blur_img)
-
-        # Pasting button images over original buttons
-        back_clicked.paste(back_btn_red_img, (150, 40), back_btn_red_img)
-        AchievementsFrame.tk_back_clicked = \
-            ImageTk.PhotoImage(back_clicked)
-
-        save_clicked.paste(save_btn_red_img, (1200, 40), save_btn_red_img)
-        AchievementsFrame.tk_save_clicked = \
-            ImageTk.PhotoImage(save_clicked)
-
-        GM_clicked.paste(G_M_red_img, (980, 90), G_M_red_img)
-        AchievementsFrame.tk_GM_clicked = \
-            ImageTk.PhotoImage(GM_clicked)
-
-        matches_clicked.paste(matches_red_img, (980, 155), matches_red_img)
-        AchievementsFrame.tk_matches_clicked = \
-            ImageTk.PhotoImage(matches_clicked)
-
-        honor_clicked.paste(honor_red_img, (980, 225), honor_red_img)
-        AchievementsFrame.tk_honor_clicked = \
-            ImageTk.PhotoImage(honor_clicked)
-
-        progress_clicked.paste(progress_red_img, (980, 295), progress_red_img)
-        AchievementsFrame.tk_progress_clicked = \
-            ImageTk.PhotoImage(progress_clicked)
-
-        items_clicked.paste(items_red_img, (980, 365), items_red_img)
-        AchievementsFrame.tk_items_clicked = \
-            ImageTk.PhotoImage(items_clicked)
-
-        social_clicked.paste(social_red_img, (980, 435), social_red_img)
-        AchievementsFrame.tk_social_clicked = \
-            ImageTk.PhotoImage(social_clicked)
-
-        general_clicked.paste(general_red_img, (980, 505), general_red_img)
-        AchievementsFrame.tk_general_clicked = \
-            ImageTk.PhotoImage(general_clicked)
+        Refer to compose_layout() for a more detailed description on red
+        button use.
+        """
+        AchievementsFrame.layout = compose_layout(ACHIEVEMENTS_LAYOUT)
 
         # exit button for achievement info frame
-        exit_x_img = Image.open(path + "x.png")
+        exit_x_img = Image.open(APP_PATH + "images\\\\buttons\\\\x.png")
         exit_x_img.thumbnail((30, 30))
         AchievementsFrame.exit_x = ImageTk.PhotoImage(exit_x_img)
 
@@ -1418,7 +1902,7 @@ class AchievementsFrame(tk.Frame):
         # Place background image onto frame using label.
         # 'GM' is clicked by default.
         self.bg_image_label = tk.Label(
-            self, image=AchievementsFrame.tk_GM_clicked)
+            self, image=AchievementsFrame.layout.pressed["GM"])
         self.bg_image_label.place(height=WINDOW_H,
                                   width=WINDOW_W)
 
@@ -1426,11 +1910,21 @@ class AchievementsFrame(tk.Frame):
         self.bg_image_label.bind('<Button-1>', self.on_click)
 
         # categories{} contains a reference to each category frame
-        # category_row{} keeps track of which row to place next achievement
         # Initialized in init_categories()
         self.categories = {}
 
-        self.category_row = {}
+        # The achievements shown in each category in their sort order,
+        # by category
+        self.views = {category: SortedView() for category in CATEGORIES}
+        # The achievements whose rows are visible in each category, in the
+        # order they are drawn. Row i is drawn at y = i * ROW_HEIGHT, so a
+        # click is mapped to it's row with a single division.
+        self.layouts = {category: [] for category in CATEGORIES}
+        # Rows of achievements that don't pass the filter are hidden.
+        # Uncompleted achievements are shown until a status is chosen.
+        self.view_filter = ViewFilter(status="uncompleted")
+        # the status menu's variable, set again by set_status()
+        self.status_var = None
 
         # initialize category frames
         self.init_categories()
@@ -1443,173 +1937,527 @@ class AchievementsFrame(tk.Frame):
         self.big_title_font = font.Font(family='Helvetica',
                                         size=20, weight='bold')
 
+        # Maps every achievement to it's AchievementRow. Rows are created
+        # once and hidden by the filters, so a status change never creates
+        # or destroys a row. Leveled achievements are stored under their
+        # LeveledAttributes, since only one level is shown at a time.
+        self.rows = {}
+
+        # Achievements selected with Ctrl+click. Bulk actions only apply to
+        # the selected achievements of the current category if there are
+        # any. Stored the same way as in rows, values are unused.
+        self.selected = {}
+
+        # (achievement, planned_var, completed_var) for every pair of
+        # checkboxes in the open info frame. The checkboxes are set from
+        # the model after every change, since checking one box can
+        # cascade to other levels.
+        self.panel_vars = []
+
+        # Maps achievements to their (info frame, panel_vars), least
+        # recently opened first. Leveled achievements are stored the same
+        # way as in rows. An info frame is removed when it's achievement
+        # changes while it's hidden.
+        self.info_frames = collections.OrderedDict()
+        # the achievement whose info frame is shown, or None
+        self.open_info = None
+
+        # rows and info frames are updated once per idle callback
+        AchievementsFrame.controller.bus.subscribe(
+            ACHIEVEMENTS_CHANGED, self.on_achievements_changed,
+            deferred=True
+        )
+        # labels that apply a bulk action when clicked, by action
+        self.bulk_labels = {}
+        self.init_bulk_labels()
+
+        # Achievements matching the search box, or None if it's empty.
+        # Rows of other achievements are hidden in every category.
+        self.search_matches = None
+        self.search_var = tk.StringVar()
+        self.search_count = None
+        self.init_search_box()
+        self.init_view_menus()
+
         # cur_category will reference the currently shown category
         # Glorious Moments will always be the starting category
         self.cur_category = self.categories['GM']
+        self.cur_category_name = 'GM'
         # cur_category_img holds a referene to the current displayed bg image
-        self.cur_category_img = self.tk_GM_clicked
+        self.cur_category_img = AchievementsFrame.layout.pressed["GM"]
         self.show_category("GM")
 
+    def init_bulk_labels(self):
+        """Initializes the labels under the category frame that apply a
+        bulk action to the current category.
+        """
+        x = 180
+        for action in BULK_ACTIONS:
+            label = tk.Label(self, fg='#DEDF00', bg='#121111',
+                             font=AchievementsFrame.title_font,
+                             cursor='hand2')
+            label.place(x=x, y=572)
+            label.bind('<Button-1>', lambda event, action=action:
+                       self.bulk_action(action))
+            self.bulk_labels[action] = label
+            x += 140
+        self.update_bulk_labels()
+
+    def update_bulk_labels(self):
+        """Sets the text of the bulk action labels to say whether they
+        apply to the whole category or only the selected achievements.
+        """
+        if self.selected:
+            target = f"selected ({len(self.selected)})"
+        else:
+            target = "all"
+        for action, label in self.bulk_labels.items():
+            label.configure(text=f"{action.capitalize()} {target}")
+
+    def init_search_box(self):
+        """Initializes the search box under the category frame. Rows are
+        filtered as the user types, and the number of matches in each
+        category is shown under it.
+        """
+        search_box = tk.Entry(self, textvariable=self.search_var, width=22,
+                              font=AchievementsFrame.desc_font)
+        search_box.place(x=640, y=572)
+        # Escape clears the search
+        search_box.bind('<Escape>', lambda event: self.search_var.set(""))
+        self.search_var.trace_add("write", lambda *args: self.on_search())
+
+        self.search_count = tk.Label(self, fg='white', bg='#121111',
+                                     font=AchievementsFrame.desc_font)
+        self.search_count.place(x=640, y=598)
+
+    def on_search(self):
+        """Hides the rows that don't match the search box, and shows the
+        number of matches in each category.
+        """
+        AchievementsFrame.controller.trace("search")
+        query = self.search_var.get()
+        if query.strip():
+            self.search_matches = set(
+                AchievementsFrame.controller.search_index.search(query))
+        else:
+            self.search_matches = None
+        self.apply_filters()
+
+    def init_view_menus(self):
+        """Initializes the menus above the category frame that choose the
+        sort order and the filters of every category.
+        """
+        # display text of each menu option mapped to it's value
+        sort_options = {text: order for order, text in SORT_ORDERS.items()}
+        reward_options = {"Any reward": None}
+        for code in REWARD_DISPLAY_ORDER:
+            reward_options[reward_registry[code].label.capitalize()] = code
+        points_options = {"Any points": None}
+        for points in POINT_VALUES:
+            points_options[f"{points} points"] = points
+        status_options = {text: status for status, text in STATUSES.items()}
+
+        # menus are placed from left to right, starting at x
+        x = 180
+        for options, on_select in (
+            (status_options, self.set_status),
+            (sort_options, self.set_sort_order),
+            (reward_options, lambda code: self.set_view_filter(
+                reward_type=code)),
+            (points_options, lambda points: self.set_view_filter(
+                points=points))
+        ):
+            var = tk.StringVar(value=next(iter(options)))
+            if options is status_options:
+                self.status_var = var
+            menu = tk.OptionMenu(
+                self, var, *options,
+                command=lambda text, options=options, on_select=on_select:
+                    on_select(options[text])
+            )
+            menu.configure(fg='white', bg='#121111', activebackground='#333',
+                           highlightthickness=0,
+                           font=AchievementsFrame.desc_font)
+            menu.place(x=x, y=22)
+            x += 180
+
+    def set_status(self, status):
+        """Shows the achievements with a different status. Only the
+        visibility and the placement of rows change.
+
+        Args:
+            status (string): one of STATUSES
+        """
+        self.status_var.set(STATUSES[status])
+        if status != self.view_filter.status:
+            self.clear_selection()
+            self.set_view_filter(status=status)
+
+    def set_sort_order(self, order):
+        """Sorts every category in a different order.
+
+        Args:
+            order (string): one of SORT_ORDERS
+        """
+        for category, view in self.views.items():
+            view.set_order(order)
+            self.layout_category(category)
+
+    def set_view_filter(self, **changes):
+        """Changes the filter rows are shown by.
+
+        Args:
+            changes: new values of ViewFilter fields
+        """
+        self.view_filter = self.view_filter._replace(**changes)
+        self.apply_filters()
+
+    def is_filtered(self):
+        """Returns True if the search box or the view filter could be
+        hiding any rows of the chosen status.
+        """
+        return (self.search_matches is not None
+                or self.view_filter != ViewFilter(self.view_filter.status))
+
+    def is_visible(self, unit):
+        """Returns True if the achievement's row passes the search box and
+        the view filter.
+        """
+        return ((self.search_matches is None or unit in self.search_matches)
+                and self.view_filter.matches(unit))
+
+    def apply_filters(self):
+        """Shows the rows that pass the search box and the view filter and
+        hides the rest.
+        """
+        for unit, row in self.rows.items():
+            row.set_visible(self.is_visible(unit))
+        for category in CATEGORIES:
+            self.layout_category(category)
+        self.update_match_count()
+
+    def update_match_count(self):
+        """Shows the number of rows shown in each category while the search
+        box or the view filter are in use.
+        """
+        if not self.is_filtered():
+            self.search_count.configure(text="")
+            return
+
+        counts = dict.fromkeys(CATEGORIES, 0)
+        for unit, row in self.rows.items():
+            if row.visible:
+                counts[unit.category] += 1
+        found = ", ".join(CATEGORY_TITLES[category] + " " + str(count)
+                          for category, count in counts.items() if count)
+        text = f"{sum(counts.values())} found"
+        if found:
+            text += ": " + found
+        self.search_count.configure(text=text)
+
     def init_categories(self):
         """Initializes achievement categories, each as a scrollable frame.
         This method loops through the category names and creates a scrollable
-        frame for each. Two dictionaries are initialized here:
-        self.categories:
-            stores a reference to each category frame under the category name.
-            Any achievements will need to be placed onto the scrolled_frame
-            attribute, which is accessed as
-            self.categories[category].scrolled_frame
-        self.category_row:
-            keeps track of which row to place the next achievement
-        """
-
-        for category in ('GM', 'matches', 'honor', 'progress',
-                         'items', 'social', 'general'):
+        frame for each. self.categories stores a reference to each category
+        frame under the category name.
+
+        Rows are drawn straight onto the canvas attribute of the category
+        frame, which is accessed as self.categories[category].canvas, so a
+        category only needs a single click handler instead of one per
+        widget of every row.
+        """
+
+        for category in CATEGORIES:
             category_frame = ScrollableFrame(self, height=500, width=702,
                                              bg='#121111')
             category_frame.place(x=527, y=WINDOW_H/2, anchor='center')
-            # First achievement will be placed on row 0
-            self.category_row[category] = 0
+            # Create info frame when a row is clicked. Ctrl+click selects
+            # the achievement for bulk actions.
+            category_frame.canvas.bind(
+                '<Button-1>', lambda event, category=category:
+                    self.on_row_click(category, event, False))
+            category_frame.canvas.bind(
+                '<Control-Button-1>', lambda event, category=category:
+                    self.on_row_click(category, event, True))
             # Store a reference to this category's frame in a dictionary
             self.categories[category] = category_frame
 
     def init_achievement_frame(self, achievement):
-        """Initiates an achievement frame in it's corresponding category
+        """Initiates an achievement's row in it's corresponding category
 
         Args:
             achievement (LeveledAchievement or ListAchievement): a ref to
                 an achievement class instance.
         """
+        unit = get_unit(achievement)
+        category = unit.category
+        view = self.views[category]
+        layout = self.layouts[category]
+
+        row = AchievementRow(self.categories[category].canvas)
+        row.update(achievement)
+        row.set_visible(self.is_visible(unit))
+        self.rows[unit] = row
+
+        # Rows are drawn in the category's sort order. When loading, rows
+        # are added in catalog order, so only the new row is placed.
+        position = view.add(unit)
+        if position == len(view) - 1:
+            if row.visible:
+                row.move(len(layout) * ROW_HEIGHT)
+                layout.append(unit)
+                self.update_scrollregion(category)
+        else:
+            self.layout_category(category, position)
 
-        is_leveled = isinstance(achievement, LeveledAchievement)
-        # shorten code by extracting attributes first
-        if is_leveled:
-            category = achievement.shared_attrs.category
-            title = achievement.shared_attrs.title
-            desc = achievement.shared_attrs.desc
-            # input number of tasks needed in level into description string
-            desc = desc.format(num_tasks=achievement.num_tasks)
+    def layout_category(self, category, start=0):
+        """Places the visible rows of a category one under the other, from
+        position start of it's view onwards. Only rows that moved are
+        placed again.
+        """
+        view = self.views[category]
+        layout = self.layouts[category]
+        # rows before start stay where they are
+        kept = sum(1 for unit in view.units[:start] if self.rows[unit].visible)
+        del layout[kept:]
+        for unit in view.units[start:]:
+            row = self.rows[unit]
+            if row.visible:
+                row.move(len(layout) * ROW_HEIGHT)
+                layout.append(unit)
+        self.update_scrollregion(category)
+
+    def update_scrollregion(self, category):
+        """Sets the scrollable area of a category to fit it's visible
+        rows.
+        """
+        height = len(self.layouts[category]) * ROW_HEIGHT
+        self.categories[category].canvas.configure(
+            scrollregion=(0, 0, ROW_WIDTH, height))
+
+    def on_row_click(self, category, event, ctrl):
+        """Finds the row under the pointer and opens it's info frame, or
+        selects it if Ctrl was held.
+        """
+        y = self.categories[category].canvas.canvasy(event.y)
+        index = int(y // ROW_HEIGHT)
+        layout = self.layouts[category]
+        if not 0 <= index < len(layout):
+            return
+        unit = layout[index]
+        if ctrl:
+            self.toggle_selected(unit)
         else:
-            category = achievement.category
-            title = achievement.title
-            desc = achievement.desc
-
-        # Get a reference to the corresponding category frame
-        category_frame = self.categories[category].scrolled_frame
-
-        # initiate achievement onto category_frame
-        achievement_frame = tk.Frame(category_frame, bd=2,
-                                     relief='solid', bg='#121111')
-        achievement_frame.grid(row=self.category_row[category],
-                               column=0, sticky='NW')
-        self.category_row[category] += 1
-        # add frame reference to achievement
-        if is_leveled:
-            achievement.shared_attrs.frame = achievement_frame
+            self.init_info_frame(self.rows[unit].achievement)
+
+    def toggle_selected(self, unit):
+        """Selects or deselects an achievement for bulk actions. Selected
+        achievements are outlined in yellow.
+
+        Args:
+            unit (LeveledAttributes or ListAchievement): the achievement
+        """
+        if unit in self.selected:
+            del self.selected[unit]
+            self.rows[unit].set_selected(False)
         else:
-            achievement.frame = achievement_frame
+            self.selected[unit] = None
+            self.rows[unit].set_selected(True)
+        self.update_bulk_labels()
+
+    def clear_selection(self):
+        """Deselects every selected achievement."""
+        for unit in self.selected:
+            if unit in self.rows:
+                self.rows[unit].set_selected(False)
+        self.selected.clear()
+        self.update_bulk_labels()
+
+    def category_units(self, category):
+        """Returns every achievement in the given category, in the
+        category's sort order.
+
+        Ret:
+            (list): LeveledAttributes for leveled achievements and
+                ListAchievement for list achievements
+        """
+        return list(self.views[category])
+
+    def bulk_action(self, action):
+        """Applies a bulk action to the selected achievements of the current
+        category, or to every achievement shown in it if none are selected.
+
+        Args:
+            action (string): one of BULK_ACTIONS
+        """
+        AchievementsFrame.controller.trace("bulk_" + action)
+        # rows hidden by the status, the search or the filter aren't
+        # affected
+        units = [unit for unit in self.category_units(self.cur_category_name)
+                 if self.is_visible(unit)]
+        if self.selected:
+            units = [unit for unit in units if unit in self.selected]
+        self.clear_selection()
+        AchievementsFrame.controller.bulk_update(units, action)
+
+    def on_achievements_changed(self, changes):
+        """Updates the rows and the open info frame after achievements have
+        changed. Called once per idle callback with every change since the
+        last call, so each changed row is only updated once.
 
-        # Create info frame when clicked
-        achievement_frame.bind('<Button-1>', lambda event:
-                               self.init_info_frame(achievement))
+        Args:
+            changes (list of Changes): see command_log.py
+        """
+        units = {}
+        for change in changes:
+            for index in change.indices:
+                units[get_unit(AchievementsFrame.achievement_list[index])] = \
+                    None
+
+        for unit in units:
+            self.refresh_row(unit)
+            # hidden info frames are rebuilt the next time they're opened
+            if unit in self.info_frames and unit is not self.open_info:
+                self.info_frames.pop(unit)[0].destroy()
+
+        # the number of matches changes as rows are shown or hidden
+        if self.is_filtered():
+            self.update_match_count()
+        self.update_panel_vars()
+
+    def refresh_row(self, unit):
+        """Updates the row of an achievement in place, and shows or hides it
+        if it's status changed. A row that moved in the sort order or was
+        shown or hidden is placed again along with the rows it moved past.
 
-        # Leveled achievement needs to concatenate it's level with it's title
-        if is_leveled:
-            text = title + " " + achievement.level_rom_num
+        Args:
+            unit (LeveledAttributes or ListAchievement): the achievement
+        """
+        row = self.rows.get(unit)
+        if row is None:
+            # the row hasn't been built yet, it's built from the model
+            return
+        if isinstance(unit, LeveledAttributes):
+            row.update(unit.shown_lvl)
         else:
-            text = title
-        frame_title = tk.Label(achievement_frame, text=text, anchor='w',
-                               fg='white', font=AchievementsFrame.title_font,
-                               bg='#121111')
-        frame_title.grid(row=0, column=0, sticky='nw')
-        frame_title.bind('<Button-1>', lambda event:
-                         self.init_info_frame(achievement))
+            row.update(unit)
+        was_visible = row.visible
+        row.set_visible(self.is_visible(unit))
+        if not row.visible and unit in self.selected:
+            # hidden rows can't be bulk updated
+            self.toggle_selected(unit)
+        old_position, new_position = self.views[unit.category].update(unit)
+        if old_position != new_position or row.visible != was_visible:
+            self.layout_category(unit.category,
+                                 min(old_position, new_position))
+
+    def update_panel_vars(self):
+        """Sets every checkbox in the open info frame from the model."""
+        for achievement, planned_var, completed_var in self.panel_vars:
+            planned_var.set(achievement.is_planned)
+            completed_var.set(achievement.is_completed)
+
+    def on_planned_checkbox(self, achievement, var):
+        """Checks or unchecks planned in the model when a checkbox is
+        clicked. The checkbox is reset right away if the model refused the
+        change, ie. planning a completed achievement.
+        """
+        AchievementsFrame.controller.trace("planned_checkbox")
+        achievement.set_planned(var.get())
+        var.set(achievement.is_planned)
 
-        # in-frame achievement description
-        # max line length is 72 characters
-        text = textwrap.fill(desc, width=72)
-        frame_desc = tk.Label(achievement_frame, text=text, justify='left',
-                              anchor='w', height=2, width=56, fg='white',
-                              font=AchievementsFrame.desc_font, bg='#121111')
-        frame_desc.grid(row=1, column=0, sticky='nw')
-        frame_desc.bind('<Button-1>', lambda event:
-                        self.init_info_frame(achievement))
-
-        img = achievement.points_img
-        frame_points = tk.Label(achievement_frame, image=img, anchor='w',
-                                borderwidth=0, highlightthickness=0)
-        # rowspan=2 is a way of centering a label between two other rows
-        frame_points.grid(row=0, rowspan=2, column=2, sticky='w')
-        frame_points.bind('<Button-1>', lambda event:
-                          self.init_info_frame(achievement))
+    def on_completed_checkbox(self, achievement, var):
+        """Checks or unchecks completed in the model when a checkbox is
+        clicked.
+        """
+        AchievementsFrame.controller.trace("completed_checkbox")
+        achievement.set_completed(var.get())
+        var.set(achievement.is_completed)
 
-        # reward amount
-        text = str(achievement.reward_amount) + " x "
-        frame_amount = tk.Label(achievement_frame, text=text, anchor='e',
-                                fg='white', height=1, width=10,
-                                font=AchievementsFrame.desc_font, bg='#121111')
-        frame_amount.grid(row=1, column=3, sticky='nw')
-        frame_amount.bind('<Button-1>', lambda event:
-                          self.init_info_frame(achievement))
-
-        img = achievement.reward_img
-        frame_reward = tk.Label(achievement_frame, image=img, anchor='w',
-                                borderwidth=0, highlightthickness=0)
-        frame_reward.grid(row=0, rowspan=2, column=4, sticky='w')
-        frame_reward.bind('<Button-1>', lambda event:
-                          self.init_info_frame(achievement))
+    def init_checkbox_vars(self, achievement):
+        """Creates the variables of an achievement's planned and completed
+        checkboxes in the info frame.
+
+        Ret:
+            (tuple of IntVars): (planned_var, completed_var)
+        """
+        planned_var = tk.IntVar(value=achievement.is_planned)
+        completed_var = tk.IntVar(value=achievement.is_completed)
+        self.panel_vars.append((achievement, planned_var, completed_var))
+        return planned_var, completed_var
 
     def init_info_frame(self, achievement):
-        """Calls init_leveled_info_frame() or init_list_info_frame() depending
-        on type of achievement.
+        """Shows the info frame of an achievement. A hidden info frame of
+        the achievement is shown again if there is one, otherwise
+        init_leveled_info_frame() or init_list_info_frame() is called
+        depending on type of achievement.
         This simplifies code in init_achievement_frame().
         Args:
             achievement (LeveledAchievement or ListAchievement): a reference
             to an instance of a LeveledAchievement or ListAchievement
         """
+        AchievementsFrame.controller.trace("info_frame")
+        self.hide_info_frame()
 
-        if isinstance(achievement, LeveledAchievement):
-            self.init_leveled_info_frame(achievement)
+        unit = get_unit(achievement)
+        if unit in self.info_frames:
+            achievement_sbf, self.panel_vars = self.info_frames.pop(unit)
+            achievement_sbf.canvas.yview_moveto(0)
         else:
-            self.init_list_info_frame(achievement)
+            self.panel_vars = []
+            # Initiating achievement info frame
+            achievement_sbf = ScrollableFrame(self, height=500, width=702,
+                                              bg='#121111')
+            # the scroll region is computed once, after every widget has
+            # been added
+            with achievement_sbf.batch():
+                if isinstance(achievement, LeveledAchievement):
+                    self.init_leveled_info_frame(achievement,
+                                                 achievement_sbf)
+                else:
+                    self.init_list_info_frame(achievement, achievement_sbf)
+
+        achievement_sbf.place(x=527, y=WINDOW_H/2, anchor='center')
+        achievement_sbf.tkraise()
+        # the most recently opened info frame goes last
+        self.info_frames[unit] = (achievement_sbf, self.panel_vars)
+        self.open_info = unit
+        while len(self.info_frames) > INFO_FRAME_CACHE_SIZE:
+            self.info_frames.popitem(last=False)[1][0].destroy()
 
-    def init_leveled_info_frame(self, achievement):
+    def init_leveled_info_frame(self, achievement, leveled_achievement_sbf):
         """Creates an info frame for the passed in leveled achievement.
 
         This method works by passing in an achievement, getting
-        a reference to the first and last levels of the achievement,
+        the levels of the achievement from it's shared attributes,
         and then progressing through each level to create the
-        achievement info frame. This frame is then placed over
-        top of the current category frame, with AchievementFrame
-        as the parent. The info frame is deleted upon clicking 'X'.
+        achievement info frame. This frame is placed over top of
+        the current category frame by init_info_frame(), with
+        AchievementFrame as the parent. The info frame is hidden upon
+        clicking 'X'.
         Args:
             achievement (LeveledAchievement): a reference to an instance of
             LeveledAchievement
+            leveled_achievement_sbf (ScrollableFrame): the info frame
         """
 
         # shorten code by extracting attributes first
-        category = achievement.shared_attrs.category
         title = achievement.shared_attrs.title
-        desc = achievement.shared_attrs.desc
-        info = achievement.shared_attrs.info
-        # reference to first and last level
-        first_lvl = achievement.shared_attrs.first_lvl
+        # every level of the achievement and a reference to the last level
+        levels = achievement.shared_attrs.levels
         last_lvl = achievement.shared_attrs.last_lvl
+        # checkbox variables of each level
+        level_vars = {lvl: self.init_checkbox_vars(lvl) for lvl in levels}
 
-        # Initiating achievement info frame
-        leveled_achievement_sbf = ScrollableFrame(self, height=500,
-                                                  width=702, bg='#121111')
         # use info_frame as the parent
         info_frame = leveled_achievement_sbf.scrolled_frame
-        leveled_achievement_sbf.place(x=527, y=WINDOW_H/2,
-                                      anchor='center')
 
         # total columns used in creating the info frame. Used for columnspan
         total_columns = 6
 
         # initiating information at top for all levels
 
-        # the exit button removes the frame from view and destroys it
+        # the exit button removes the frame from view
         img = AchievementsFrame.exit_x
         exit_button = tk.Label(info_frame, image=img, anchor='e',
                                borderwidth=0, highlightthickness=0)
@@ -1629,10 +2477,13 @@ class AchievementsFrame(tk.Frame):
         # same variables as the last level of the achievement. If the last
         # level of the achievement is completed, the entire achievement is
         # completed.
-        var = last_lvl.planned_var
-        planned_btn = tk.Checkbutton(info_frame, variable=var,
-                                     activebackground='#121111', bg='#121111',
-                                     command=last_lvl.on_planned_checkbox)
+        planned_var, completed_var = level_vars[last_lvl]
+        planned_btn = tk.Checkbutton(
+            info_frame, variable=planned_var,
+            activebackground='#121111', bg='#121111',
+            command=lambda var=planned_var:
+                self.on_planned_checkbox(last_lvl, var)
+        )
         planned_btn.grid(row=1, column=2, sticky='e')
 
         text = "Planned"
@@ -1640,12 +2491,11 @@ class AchievementsFrame(tk.Frame):
                                  bg='#121111')
         checkbox_text.grid(row=1, column=3, sticky='w')
 
-        var = last_lvl.completed_var
-
         completed_btn = tk.Checkbutton(
-            info_frame, variable=var,
+            info_frame, variable=completed_var,
             activebackground='#121111', bg='#121111',
-            command=last_lvl.on_completed_checkbox
+            command=lambda var=completed_var:
+                self.on_completed_checkbox(last_lvl, var)
         )
         completed_btn.grid(row=1, column=4, sticky='e')
 
@@ -1668,33 +2518,21 @@ class AchievementsFrame(tk.Frame):
         next_row = 3
 
         # Adding a frame for each level, starting with the first level
-
-        cur_lvl_index = first_lvl.list_index
-        achievement = AchievementsFrame.achievement_list[cur_lvl_index]
-        # set this to True once all levels have been initialized
-        last_level_initialized = False
-        while (not last_level_initialized):
-            # if reached the last level, exit the loop after this iteration
-            if achievement == last_lvl:
-                last_level_initialized = True
-
+        for achievement in levels:
             achievement_frame = tk.Frame(info_frame, bd=2,
                                          relief='solid', bg='#121111')
             achievement_frame.grid(row=next_row, column=0, columnspan=2,
                                    sticky='nw')
 
-            text = title + " " + achievement.level_rom_num
+            text = achievement.text.title
             frame_title = tk.Label(achievement_frame, text=text, anchor='w',
                                    fg='white', height=1,
                                    font=AchievementsFrame.title_font,
                                    bg='#121111')
             frame_title.grid(row=0, column=0, sticky='nw')
 
-            desc_copy = copy.copy(desc)
-            desc_copy = desc_copy.format(num_tasks=achievement.num_tasks)
-            text = textwrap.fill(desc_copy, width=42)
-            # input number of tasks needed in level into description string
-
+            # description with the number of tasks needed in level
+            text = achievement.text.panel_desc
             frame_desc = tk.Label(
                 achievement_frame, text=text, justify='left', anchor='w',
                 height=3, width=35, fg='white',
@@ -1702,7 +2540,7 @@ class AchievementsFrame(tk.Frame):
             )
             frame_desc.grid(row=1, column=0, sticky='nw')
 
-            img = achievement.points_img
+            img = AchievementImages.points_images[str(achievement.points)]
             frame_points = tk.Label(achievement_frame, image=img,
                                     anchor='w', borderwidth=0,
                                     highlightthickness=0)
@@ -1717,17 +2555,19 @@ class AchievementsFrame(tk.Frame):
             )
             frame_amount.grid(row=1, column=3, sticky='nw')
 
-            img = achievement.reward_img
+            img = AchievementImages.reward_images[achievement.reward]
             frame_reward = tk.Label(achievement_frame, image=img,
                                     anchor='w', borderwidth=0,
                                     highlightthickness=0)
             frame_reward.grid(row=0, rowspan=3, column=4, sticky='w')
 
-            var = achievement.planned_var
+            planned_var, completed_var = level_vars[achievement]
 
             planned_btn = tk.Checkbutton(
-                info_frame, variable=var, activebackground='#121111',
-                bg='#121111', command=achievement.on_planned_checkbox
+                info_frame, variable=planned_var, activebackground='#121111',
+                bg='#121111',
+                command=lambda lvl=achievement, var=planned_var:
+                    self.on_planned_checkbox(lvl, var)
             )
             planned_btn.grid(row=next_row, column=2, sticky='e')
 
@@ -1736,11 +2576,11 @@ class AchievementsFrame(tk.Frame):
                                      fg='white', bg='#121111')
             checkbox_text.grid(row=next_row, column=3, sticky='w')
 
-            var = achievement.completed_var
-
             completed_btn = tk.Checkbutton(
-                info_frame, variable=var, activebackground='#121111',
-                bg='#121111', command=achievement.on_completed_checkbox
+                info_frame, variable=completed_var,
+                activebackground='#121111', bg='#121111',
+                command=lambda lvl=achievement, var=completed_var:
+                    self.on_completed_checkbox(lvl, var)
             )
             completed_btn.grid(row=next_row, column=4, sticky='e')
 
@@ -1754,14 +2594,6 @@ class AchievementsFrame(tk.Frame):
             # the next achievement will be added to the row below
             next_row += 1
 
-            # move pointer to next achievement
-            cur_lvl_index += 1
-            # prevents an index error if at the end of the list
-            try:
-                achievement = AchievementsFrame.achievement_list[cur_lvl_index]
-            except IndexError:
-                pass
-
         # draws a line under the achievement frames
 
         text = "     ___________________________________________________" \
@@ -1773,29 +2605,25 @@ class AchievementsFrame(tk.Frame):
         next_row += 1
 
         # information on how to get the achievement
-        text = textwrap.fill(info, width=99)
+        text = last_lvl.text.info
         info = tk.Label(info_frame, text=text, justify='left', fg='white',
                         font=AchievementsFrame.desc_font, bg='#121111')
         info.grid(
             row=next_row, column=0, columnspan=total_columns, sticky='nw'
         )
 
-    def init_list_info_frame(self, achievement):
+    def init_list_info_frame(self, achievement, list_achievement_sbf):
         """Creates the info frame for the passed in list achievement.
 
         Args:
             achievement (ListAchievement): a reference an instance of
             LeveledAchievement
+            list_achievement_sbf (ScrollableFrame): the info frame
         """
 
-        # Initiating achievement info frame
-        list_achievement_sbf = ScrollableFrame(self, height=500,
-                                               width=702, bg='#121111')
         # use info_frame as the parent
         info_frame = list_achievement_sbf.scrolled_frame
 
-        list_achievement_sbf.place(x=527, y=WINDOW_H/2, anchor='center')
-
         # The total columns used in creating the info frame.
         # Used for columnspan
         total_columns = 6
@@ -1821,11 +2649,12 @@ class AchievementsFrame(tk.Frame):
                        bg='#121111')
         pad.grid(row=1, column=1, sticky='nw')
 
-        var = achievement.planned_var
-        planned_btn = tk.Checkbutton(info_frame, variable=var,
-                                     activebackground='#121111',
-                                     bg='#121111',
-                                     command=achievement.on_planned_checkbox)
+        planned_var, completed_var = self.init_checkbox_vars(achievement)
+        planned_btn = tk.Checkbutton(
+            info_frame, variable=planned_var,
+            activebackground='#121111', bg='#121111',
+            command=lambda: self.on_planned_checkbox(achievement, planned_var)
+        )
         planned_btn.grid(row=1, column=2, sticky='e')
 
         text = "Planned"
@@ -1836,10 +2665,11 @@ class AchievementsFrame(tk.Frame):
         )
         checkbox_text.grid(row=1, column=3, sticky='w')
 
-        var = achievement.completed_var
         completed_btn = tk.Checkbutton(
-            info_frame, variable=var, activebackground='#121111',
-            bg='#121111', command=achievement.on_completed_checkbox
+            info_frame, variable=completed_var, activebackground='#121111',
+            bg='#121111',
+            command=lambda: self.on_completed_checkbox(achievement,
+                                                       completed_var)
         )
         completed_btn.grid(row=1, column=4, sticky='e')
 
@@ -1861,10 +2691,7 @@ class AchievementsFrame(tk.Frame):
         # keeps track of which row to place next widget
         next_row = 3
 
-        for task in achievement.task_list:
-            text = textwrap.fill("- " + task, width=84)
-            text = text.replace("\n", "\n   ")
-
+        for text in achievement.text.tasks:
             line = tk.Label(
                 info_frame, text=text, anchor='w', fg='white', justify='left',
                 font=AchievementsFrame.desc_font, bg='#121111'
@@ -1884,13 +2711,27 @@ class AchievementsFrame(tk.Frame):
                   columnspan=total_columns, sticky='nw')
         next_row += 1
 
-        text = textwrap.fill(achievement.info, width=99)
+        text = achievement.text.info
         desc = tk.Label(info_frame, text=text, justify='left', fg='white',
                         font=AchievementsFrame.desc_font, bg='#121111')
         desc.grid(
             row=next_row, column=0, columnspan=total_columns, sticky='nw'
         )
 
+    def hide_info_frame(self):
+        """Hides the open info frame, if any. It's kept in info_frames so
+        it can be shown again without being rebuilt.
+
+        open_info is only set while an info frame is shown, so this is
+        called wherever the category view replaces the info frame.
+        """
+        if self.open_info is None:
+            return
+        achievement_sbf = self.info_frames[self.open_info][0]
+        achievement_sbf.place_forget()
+        self.panel_vars = []
+        self.open_info = None
+
     def exit_achievement(self, achievement_sbf):
         """Exits achievement info and returns to the current category frame
 
@@ -1898,10 +2739,7 @@ class AchievementsFrame(tk.Frame):
             achievement_sbf (ScrollableFrame): the scrollable frame that
                 is being exited
         """
-        achievement_sbf.unbind_mousewheel()
-        achievement_sbf.place_forget()
-        achievement_sbf.destroy()
-        self.cur_category.bind_mousewheel()
+        self.hide_info_frame()
         self.cur_category.tkraise()
 
     def show_category(self, category):
@@ -1910,127 +2748,192 @@ class AchievementsFrame(tk.Frame):
             category: a string containing the name of the category
                 to be shown.
         """
+        AchievementsFrame.controller.trace("category")
+        # the category is raised over the open info frame, which would
+        # otherwise still receive wheel events as the active frame
+        self.hide_info_frame()
         category_to_be_shown = self.categories[category]
-        # The current category needs to be unbound to the mousewheel
-        # so that category_to_be_shown can bind to it instead
-        self.cur_category.unbind_mousewheel()
-        category_to_be_shown.bind_mousewheel()
+        # rows of the shown category are built first while loading
+        AchievementsFrame.controller.prioritize_category(category)
+        # a selection only applies to the category it was made in
+        self.clear_selection()
         self.cur_category = category_to_be_shown
+        self.cur_category_name = category
         category_to_be_shown.tkraise()
+        # the shown category's button is red
+        self.cur_category_img = AchievementsFrame.layout.pressed[category]
+        self.bg_image_label.configure(image=self.cur_category_img)
 
     def on_click(self, event):
         """Turns the clicked on button to red and raises the corresponding
         frame.
         """
-        x = event.x
-        y = event.y
-
-        # if "Back" was clicked
-        if 80 <= x <= 155 and 40 <= y <= 85:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_back_clicked)
-            # Go to Main Menu frame and return back-button to yellow
-            # 'GM' is turned back to red since it's the default category
-            self.bg_image_label.bind('<ButtonRelease-1>', lambda event:
-                                     [AchievementsFrame.controller.show_frame(
-                                         "MainMenuFrame"),
-                                      self.bg_image_label.configure(
-                                          image=self.tk_GM_clicked),
-                                      self.bg_image_label.unbind(
-                                          '<ButtonRelease-1>')])
-        # if "Save" was clicked
-        elif 1120 <= x <= 1200 and 40 <= y <= 85:
-
-            self.bg_image_label.configure(image=self.tk_save_clicked)
-            self.bg_image_label.bind(
-                "<ButtonRelease-1>", lambda event: [
-                    AchievementsFrame.controller.save_achievement_data(),
-                    self.bg_image_label.configure(
-                        image=self.cur_category_img)
-                ]
-            )
-        # if "Glorious Moments" was clicked
-        elif 900 <= x <= 1100 and 90 <= y <= 120:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_GM_clicked)
-            self.cur_category_img = AchievementsFrame.tk_GM_clicked
-            self.show_category("GM")
-        # if "Matches" was clicked
-        elif 900 <= x <= 1000 and 155 <= y <= 185:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_matches_clicked)
-            self.cur_category_img = AchievementsFrame.tk_matches_clicked
-            self.show_category("matches")
-        # if "Honor" was clicked
-        elif 900 <= x <= 975 and 225 <= y <= 255:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_honor_clicked)
-            self.cur_category_img = AchievementsFrame.tk_honor_clicked
-            self.show_category("honor")
-        # if "Progress" was clicked
-        elif 900 <= x <= 1010 and 295 <= y <= 325:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_progress_clicked)
-            self.cur_category_img = AchievementsFrame.tk_progress_clicked
-            self.show_category("progress")
-        # if "Items" was clicked
-        elif 900 <= x <= 965 and 365 <= y <= 395:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_items_clicked)
-            self.cur_category_img = AchievementsFrame.tk_items_clicked
-            self.show_category("items")
-        # if "Social" was clicked
-        elif 900 <= x <= 975 and 435 <= y <= 465:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_social_clicked)
-            self.cur_category_img = AchievementsFrame.tk_social_clicked
-            self.show_category("social")
-        # if "General" was clicked
-        elif 900 <= x <= 995 and 505 <= y <= 535:
-            self.bg_image_label.configure(
-                image=AchievementsFrame.tk_general_clicked)
-            self.cur_category_img = AchievementsFrame.tk_general_clicked
-            self.show_category("general")
-
-
-class Achievement():
-    """Contains static dictionaries and lists which both LeveledAchievement
-    and ListAchievement can access.
+        button = AchievementsFrame.layout.hit_grid.find(event.x, event.y)
+        if button is None:
+            return
+        action = "achievements." + button.name
+        AchievementsFrame.controller.trace(action)
+
+        # category buttons stay red while their category is shown
+        if button.action == "show_category":
+            self.show_category(button.arg)
+            return
+
+        self.bg_image_label.configure(
+            image=AchievementsFrame.layout.pressed[button.name])
+        # carry out the action and turn the button back to yellow
+        self.bg_image_label.bind(
+            "<ButtonRelease-1>", lambda event: [
+                AchievementsFrame.controller.trace(action + " release"),
+                self.bg_image_label.configure(image=self.cur_category_img),
+                self.bg_image_label.unbind("<ButtonRelease-1>"),
+                self.on_button(button)
+            ]
+        )
+
+    def on_button(self, button):
+        """Carries out the action of a clicked "Back" or "Save" button.
+
+        Args:
+            button (Button): see ACHIEVEMENTS_LAYOUT
+        """
+        if button.action == "show_page":
+            # the category is shown again when the frame is next raised
+            self.hide_info_frame()
+            AchievementsFrame.controller.show_frame(button.arg)
+        elif button.action == "save":
+            AchievementsFrame.controller.save_achievement_data()
+
+
+class AchievementRow():
+    """An achievement's row, drawn as items on the canvas of a category
+    frame. Clicks are handled by the category (see on_row_click()).
+
+    A row is created once and updated in place when the level shown for
+    the achievement changes, ie. after completing a level. It is hidden
+    while the achievement doesn't pass the status filter.
+
+    Args:
+        canvas (Canvas): the canvas of the category frame
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        # the achievement (or level) shown, assigned in update()
+        self.achievement = None
+        # False while the row is hidden by the search or the filter
+        self.visible = True
+        # y coordinate of the top of the row, rows start at the top
+        self.y = 0
+
+        # every item of the row is tagged with the row's tag, so they can
+        # be moved, hidden and deleted together
+        self.tag = "row" + str(id(self))
+        tags = ("row", self.tag)
+
+        # border of the row, outlined in yellow while it is selected
+        self.border = canvas.create_rectangle(
+            1, 1, ROW_WIDTH, ROW_HEIGHT - 1, outline='black', width=2,
+            fill='#121111', tags=tags)
+
+        self.title = canvas.create_text(
+            6, 4, anchor='nw', fill='white',
+            font=AchievementsFrame.title_font, tags=tags)
+
+        # in-frame achievement description
+        self.desc = canvas.create_text(
+            6, 24, anchor='nw', fill='white',
+            font=AchievementsFrame.desc_font, tags=tags)
+
+        self.points = canvas.create_image(490, ROW_HEIGHT // 2,
+                                          anchor='center', tags=tags)
+
+        # reward amount
+        self.amount = canvas.create_text(
+            595, ROW_HEIGHT // 2 + 8, anchor='e', fill='white',
+            font=AchievementsFrame.desc_font, tags=tags)
+
+        self.reward = canvas.create_image(635, ROW_HEIGHT // 2,
+                                          anchor='center', tags=tags)
+
+    def update(self, achievement):
+        """Shows the given achievement (or level) in the row.
+
+        Args:
+            achievement (LeveledAchievement or ListAchievement): a ref to
+                an achievement class instance.
+        """
+        if achievement is self.achievement:
+            return
+        self.achievement = achievement
+
+        # text is formatted and wrapped when the achievement is loaded
+        canvas = self.canvas
+        canvas.itemconfigure(self.title, text=achievement.text.title)
+        canvas.itemconfigure(self.desc, text=achievement.text.row_desc)
+        canvas.itemconfigure(
+            self.points,
+            image=AchievementImages.points_images[str(achievement.points)])
+        canvas.itemconfigure(self.amount,
+                             text=str(achievement.reward_amount) + " x ")
+        canvas.itemconfigure(
+            self.reward,
+            image=AchievementImages.reward_images[achievement.reward])
+
+    def set_selected(self, is_selected):
+        """Outlines the row in yellow while it is selected."""
+        if is_selected:
+            self.canvas.itemconfigure(self.border, outline='#DEDF00')
+        else:
+            self.canvas.itemconfigure(self.border, outline='black')
+
+    def set_visible(self, visible):
+        """Shows or hides the row. The category places the visible rows
+        again afterwards, see AchievementsFrame.layout_category().
+        """
+        if visible == self.visible:
+            return
+        self.visible = visible
+        if visible:
+            self.canvas.itemconfigure(self.tag, state='normal')
+        else:
+            self.canvas.itemconfigure(self.tag, state='hidden')
+
+    def move(self, y):
+        """Moves the top of the row to y."""
+        if y == self.y:
+            return
+        self.canvas.move(self.tag, 0, y - self.y)
+        self.y = y
+
+    def destroy(self):
+        """Deletes every item of the row."""
+        self.canvas.delete(self.tag)
+
+
+class AchievementImages():
+    """Contains static dictionaries of the images shown for each
+    achievement's points and reward. The achievement model doesn't depend
+    on Tk, so frames look up the images of an achievement here.
     """
     # a dictionary mapping point amount to an image
     points_images = {}
     # a dictionary mapping reward type to a reward image
     reward_images = {}
-    # a list containing a reference to every achievement
-    achievement_list = []
-    # a reference to the AppController
-    controller = None
-    # a dictionary for storing achievements that need to be updated in file
-    write_achievements = {}
-
-    @staticmethod
-    def static_init(achievement_list, controller, write_achievements):
-        Achievement.achievement_list = achievement_list
-        Achievement.controller = controller
-        Achievement.write_achievements = write_achievements
-        Achievement.init_reward_images()
 
     @staticmethod
-    def init_reward_images():
+    def init_images():
         """Initializes images for reward and reward points and places
         into a static dictionary.
-        Each instance of an Achievement will contains an image for the reward
-        and reward points. Each instance will be passed in a string specifying
-        the associated reward and reward points. An image is assigned to the
-        instance by passing in the string value into the dictionary
-        and getting a reference to the corresponding image.
+        The images of an achievement are found by passing in it's points
+        (as a string) or reward name into the corresponding dictionary.
         """
         path = APP_PATH + "images\\\\points\\\\"
-        for points in ('5', '10', '15', '20', '30', '40', '50', '60'):
+        for points in map(str, POINT_VALUES):
             img = Image.open(path+points+'_points.png')
             img.thumbnail((40, 40), Image.BICUBIC)
             img = ImageTk.PhotoImage(img)
-            Achievement.points_images[points] = img
+            AchievementImages.points_images[points] = img
 
         path = APP_PATH + "images\\\\rewards\\\\"
         # last word in each image name is the reward category it belongs to
@@ -2075,528 +2978,11 @@ class Achievement():
             img = Image.open(path+reward+'.png')
             img.thumbnail((50, 50), Image.BICUBIC)
             img = ImageTk.PhotoImage(img)
-            Achievement.reward_images[reward] = img
-
-
-class LeveledAttributes():
-    """A class for storing shared attributes between every level of
-    an achievement.
-
-    These shared attributes include the category, title, description,
-    info, frame, if it's overall completed, and a reference to the
-    first and last levels. Achievements levels will be able to access
-    these attributes by storing a reference to the instance of this class.
-
-    Args:
-        category (string): achievement category
-        title (string): achievement title
-        desc (string): achievement description
-        info (string): contains tips and tricks about the achievement. Only
-            stored in the first level of each achievement.
-        overall_completed (string): 1 if all levels are completed, 0 if not
-        first_level (LeveledAchievement): a reference to the first level
-            of the achievement. This is needed when initializing the
-            achievements info frame.
-        last_level (LeveledAchievement): a reference to the last level. Needed
-            for checking if the achievement has been completed and for
-            initializing the info frame.
-        frame (Frame): a reference to the frame displaying the achievement.
-            This frame can either be in the completed or uncompleted
-            AchievementsFrame. frame is given a value once a frame for
-            the achievement has been initialized.
-    """
-
-    def __init__(self, category, title, desc, info, overall_completed,
-                 first_lvl, last_lvl, frame=None):
-        self.category = category
-        self.title = title
-        self.desc = desc
-        self.info = info
-        self.overall_completed = overall_completed
-        self.first_lvl = first_lvl
-        self.last_lvl = last_lvl
-        self.frame = frame
-
-
-class LeveledAchievement(Achievement):
-    """Contains information and methods needed for each level of
-    an achievement.
-
-    A leveled achievement is any achievement that has multiple levels to it.
-    Each level has the player complete an increased amount of tasks from the
-    last level (ie. winning once, then 10 times, then 20, and then 50).
-    Therefore each level has an associated number of tasks, a roman numeral
-    representing the level, variables for planned and completed checkboxes,
-    and the associated reward and achievement points for completing that
-    level.
-
-    To save RAM, there is a seperate class storing shared attributes between
-    the levels. A reference to this class is stored in each level.
-
-    Args:
-        level_rom_num (string): a roman numeral representing the level of
-            the achievement
-        is_planned (int): 1 for planned, 0 for not planned
-        is_completed (int): 1 for completed, 0 for not completed
-        num_tasks (str): the number of tasks required to complete
-            the the level of the achievement. The task is described in
-            achievement description.
-        points (int): amount of points awarded upon level completion.
-        reward_amount (int): amount of reward awarded upon level completion
-        reward (str): name of reward.
-        list_index (int): the index at which this level will be placed in
-            achievement_list.
-        shared_attrs (LeveledAttributes): a reference to the achievements
-        LeveledAttributes, which stores the attributes shared between every
-        level.
-
-    """
-
-    def __init__(self, level_rom_num, is_planned, is_completed, num_tasks,
-                 points, reward_amount, reward, list_index, shared_attrs):
-        self.level_rom_num = level_rom_num
-        # variables for checkboxes
-        self.planned_var = tk.IntVar(value=is_planned)
-        self.completed_var = tk.IntVar(value=is_completed)
-        self.num_tasks = num_tasks
-        self.points = points
-        self.reward = reward
-        # initiate points_img and reward_img using static dictionaries
-        self.points_img = Achievement.points_images[str(points)]
-        self.reward_img = Achievement.reward_images[reward]
-        self.reward_amount = reward_amount
-        self.list_index = list_index
-        # a reference to LeveledAttributes
-        self.shared_attrs = shared_attrs
-
-    def on_completed_checkbox(self):
-        """Checks to see if the user is checking or unchecking the completed
-        checkbox.
-        """
-        # achievement checkbox values will be updated in file
-        Achievement.write_achievements[self.shared_attrs.title] = \
-            self.shared_attrs.first_lvl
-
-        if self.completed_var.get() == 1:
-            self.check_completed_checkbox()
-        else:
-            self.uncheck_completed_checkbox()
-
-    def check_completed_checkbox(self):
-        """Automatically checks "completed" checkboxes in lower levels
-        of achievement.
-
-        Called when checking a "completed" checkbox. This method will
-        automatically check every level lower than the current level.
-        Ex. If lvl III is checked, this method will check off "completed"
-        for lvl II and lvl I.
-
-        The achievement frame is reinitialized to reflect the
-        next achievement level to be completed. If the last level was just
-        completed by the user, a frame will be initialized in
-        CompletedAchievements.
-        """
-
-        try:
-            cur_lvl_index = self.list_index
-            cur_lvl = self
-            # iterate through lower levels of achievement
-            while (cur_lvl.shared_attrs == self.shared_attrs):
-                # check checkboxes
-                cur_lvl.completed_var.set(1)
-
-                Achievement.controller.update_stat(
-                    "completed_achievements", '+', 1
-                )
-                Achievement.controller.update_stat(
-                    "completed_points", '+', cur_lvl.points)
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_completed_achievements",
-                    '+', 1
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_completed_points",
-                    '+', cur_lvl.points
-                )
-                reward_type = cur_lvl.reward.split("_")[-1]
-                Achievement.controller.update_stat(
-                    "completed_" + reward_type, '+', cur_lvl.reward_amount
-                )
-                if cur_lvl.planned_var.get() == 1:
-                    # achievement can't be planned if it's completed
-                    cur_lvl.planned_var.set(0)
-                    Achievement.controller.update_stat(
-                        "planned_achievements", '-', 1
-                    )
-                    Achievement.controller.update_stat(
-                        "planned_points", '-', cur_lvl.points
-                    )
-                    Achievement.controller.update_stat(
-                        self.shared_attrs.category + "_planned_achievements",
-                        '-', 1
-                    )
-                    Achievement.controller.update_stat(
-                        self.shared_attrs.category + "_planned_points",
-                        '-', cur_lvl.points
-                    )
-                    Achievement.controller.update_stat(
-                        "planned_" + reward_type, '-', cur_lvl.reward_amount
-                    )
-
-                cur_lvl_index -= 1
-                cur_lvl = Achievement.achievement_list[cur_lvl_index]
-                if cur_lvl.completed_var.get() == 1:
-                    break
-        # list may go out of bounds if at the end or beginning of list
-        # it may also reach a ListAchievement, which would throw
-        # an AttributeError
-        except (IndexError, AttributeError):
-            pass
-
-        # if completing the last level
-        if (self == self.shared_attrs.last_lvl):
-            self.on_completion()
-        # else reinitialize achievement frame as next level to complete
-        else:
-            self.shared_attrs.frame.grid_forget()
-            next_lvl = Achievement.achievement_list[self.list_index+1]
-            Achievement.controller.update_achievement(next_lvl)
-
-    def uncheck_completed_checkbox(self):
-        """Automatically unchecks "completed" checkboxes in higher levels
-        of achievement.
-
-        Called when unchecking a "completed" checkbox. This method will
-        automatically uncheck every higher level than the current level.
-
-        The achievement frame is reinitialized to reflect the
-        next achievement level to be completed. The achievement frame is
-        moved back to UncompletedAchievements if the user is unchecking from
-        CompletedAchievements.
-        """
-        if (self.shared_attrs.overall_completed == '1'):
-            self.shared_attrs.overall_completed = '0'
-
-        try:
-            cur_lvl_index = self.list_index
-            cur_lvl = self
-            # iterate through higher levels of achievement
-            while (cur_lvl.shared_attrs == self.shared_attrs):
-                # check checkboxes
-                cur_lvl.completed_var.set(0)
-
-                Achievement.controller.update_stat(
-                    "completed_achievements", '-', 1
-                )
-                Achievement.controller.update_stat(
-                    "completed_points", '-', cur_lvl.points
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_completed_achievements",
-                    '-', 1
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_completed_points",
-                    '-', cur_lvl.points
-                )
-                reward_type = cur_lvl.reward.split("_")[-1]
-                Achievement.controller.update_stat(
-                    "completed_" + reward_type, '-', cur_lvl.reward_amount
-                )
-                cur_lvl_index += 1
-                cur_lvl = Achievement.achievement_list[cur_lvl_index]
-                if cur_lvl.completed_var.get() == 0:
-                    break
-        # list may go out of bounds if at the end or beginning of list
-        # it may also reach a ListAchievement, which would throw
-        # an AttributeError
-        except (IndexError, AttributeError):
-            pass
-
-        # Update achievement frame so that it shows info for next level
-        # to be completed. This is done both when unchecking from
-        # CompletedAchievements and UncompletedAchievements. The frame will
-        # be reinitialized onto UncompletedAchievements if the user is
-        # unchecking from CompletedAchievements.
-
-        # remove the currently shown frame
-        self.shared_attrs.frame.grid_forget()
-        # Reinitialize frame with updated level information
-        Achievement.controller.update_achievement(self)
-
-    def on_completion(self):
-        """Moves achievement to CompletedAchievements"""
-        self.shared_attrs.overall_completed = '1'
-        # remove from UncompletedAchievements
-        self.shared_attrs.frame.grid_forget()
-        # regrid in CompletedAchievements
-        Achievement.controller.complete_achievement(self)
-
-    def on_planned_checkbox(self):
-        """Checks to see if the user is checking or unchecking the planned
-        checkbox.
-        """
-        # achievement checkbox values will be updated in file
-        Achievement.write_achievements[self.shared_attrs.title] = \
-            self.shared_attrs.first_lvl
-        if self.planned_var.get() == 1:
-            self.check_planned_checkbox()
-        else:
-            self.uncheck_planned_checkbox()
-
-    def check_planned_checkbox(self):
-        """Automatically checks "planned" checkboxes in lower
-        levels of achievement.
-
-        See check_completed_checkbox() for a more similar, more detailed
-        description of method behaviour.
-        """
-        try:
-            cur_lvl_index = self.list_index
-            cur_lvl = self
-            # iterate through lower levels of achievement
-            while (cur_lvl.shared_attrs == self.shared_attrs):
-                # achievement can't be planned if it's already completed
-                if cur_lvl.completed_var.get() == 1:
-                    cur_lvl.planned_var.set(0)
-                    break
-                # check checkboxes
-                cur_lvl.planned_var.set(1)
-
-                Achievement.controller.update_stat(
-                    "planned_achievements", '+', 1
-                )
-                Achievement.controller.update_stat(
-                    "planned_points", '+', cur_lvl.points
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_planned_achievements",
-                    '+', 1
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_planned_points",
-                    '+', cur_lvl.points
-                )
-                reward_type = cur_lvl.reward.split("_")[-1]
-                Achievement.controller.update_stat(
-                    "planned_" + reward_type, '+', cur_lvl.reward_amount
-                )
-                cur_lvl_index -= 1
-                cur_lvl = Achievement.achievement_list[cur_lvl_index]
-                if cur_lvl.planned_var.get() == 1:
-                    break
-        # list may go out of bounds if at the end or beginning of list
-        # it may also reach a ListAchievement, which would throw
-        # an AttributeError
-        except (IndexError, AttributeError):
-            pass
-
-    def uncheck_planned_checkbox(self):
-        """Automatically unchecks "planned" checkboxes in higher
-        levels of achievement.
-
-        See uncheck_completed_checkbox() for a more similar, more detailed
-        description of method behaviour.
-        """
-        # skip checking if first lvl
-        try:
-            cur_lvl_index = self.list_index
-            cur_lvl = self
-            # iterate through higher levels of achievement
-            while (cur_lvl.shared_attrs == self.shared_attrs):
-                # check checkboxes
-                cur_lvl.planned_var.set(0)
-
-                Achievement.controller.update_stat(
-                    "planned_achievements", '-', 1
-                )
-                Achievement.controller.update_stat(
-                    "planned_points", '-', cur_lvl.points
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_planned_achievements",
-                    '-', 1
-                )
-                Achievement.controller.update_stat(
-                    self.shared_attrs.category + "_planned_points",
-                    '-', cur_lvl.points
-                )
-                reward_type = cur_lvl.reward.split("_")[-1]
-                Achievement.controller.update_stat(
-                    "planned_" + reward_type, '-', cur_lvl.reward_amount
-                )
-                cur_lvl_index += 1
-                cur_lvl = Achievement.achievement_list[cur_lvl_index]
-                if cur_lvl.planned_var.get() == 0:
-                    break
-        # list may go out of bounds if at the end or beginning of list
-        # it may also reach a ListAchievement, which would throw
-        # an AttributeError
-        except (IndexError, AttributeError):
-            pass
-
-
-class ListAchievement(Achievement):
-    """Contains information and methods related to any achivement
-    that requires the user to complete a list of tasks.
-    Args:
-        category (string): achievement category
-        title (string): achievement title
-        desc (string): achievement description
-        task_list (List of strings): The list of tasks
-            to complete the achievement.
-        is_planned (int): 1 for planned, 0 for not planned
-        is_completed (int): 1 for completed, 0 for not completed
-        points (int): amount of points awarded upon level completion
-        reward_amount (int): amount of reward awarded upon level completion
-        reward (string): name of reward
-        list_index (int): the index at which this level will be placed in
-            achievement_list.
-        info (string): contains tips and tricks about the achievement. Only
-            stored in the first level of each achievement.
-        frame (Frame): a reference to the frame displaying the achievement.
-            This frame can either be in the completed or uncompleted
-            AchievementsFrame.
-    """
-
-    def __init__(self, category, title, desc, task_list, is_planned,
-                 is_completed, points, reward_amount, reward, list_index,
-                 info, frame):
-
-        self.category = category
-        self.title = title
-        self.desc = desc
-        self.task_list = task_list
-        # variables for checkboxes
-        self.planned_var = tk.IntVar(value=is_planned)
-        self.completed_var = tk.IntVar(value=is_completed)
-        self.points = points
-        self.reward = reward
-        # initiate points_img and reward_img using static dictionaries
-        self.points_img = Achievement.points_images[str(points)]
-        self.reward_img = Achievement.reward_images[reward]
-        self.reward_amount = reward_amount
-        self.list_index = list_index
-        self.info = info
-        self.frame = frame
-
-    def on_completed_checkbox(self):
-        # achievement checkbox values will be updated in file
-        Achievement.write_achievements[self.title] = self
-        # if checkbox has been checked
-        if self.completed_var.get() == 1:
-
-            Achievement.controller.update_stat(
-                "completed_achievements", '+', 1
-            )
-            Achievement.controller.update_stat(
-                "completed_points", '+', self.points
-            )
-            Achievement.controller.update_stat(
-                self.category + "_completed_achievements",
-                '+', 1
-            )
-            Achievement.controller.update_stat(
-                self.category + "_completed_points",
-                '+', self.points
-            )
-            reward_type = self.reward.split("_")[-1]
-            Achievement.controller.update_stat(
-                "completed_" + reward_type, '+', self.reward_amount
-            )
-            # achievement can't be planned if it's completed
-            if self.planned_var.get() == 1:
-                self.planned_var.set(0)
-                Achievement.controller.update_stat(
-                    "planned_achievements", '-', 1
-                )
-                Achievement.controller.update_stat(
-                    "planned_points", '-', self.points
-                )
-                Achievement.controller.update_stat(
-                    self.category + "_planned_achievements", '-', 1
-                )
-                Achievement.controller.update_stat(
-                    self.category + "_planned_points", '-', self.points
-                )
-                reward_type = self.reward.split("_")[-1]
-                Achievement.controller.update_stat(
-                    "planned_" + reward_type, '-', self.reward_amount
-                )
-            # remove from UncompletedAchievements
-            self.frame.grid_forget()
-            # regrid in CompletedAchievements
-            Achievement.controller.complete_achievement(self)
-        # else remove from CompletedAchievements
-        else:
-
-            Achievement.controller.update_stat(
-                "completed_achievements", '-', 1
-            )
-            Achievement.controller.update_stat(
-                "completed_points", '-', self.points
-            )
-            Achievement.controller.update_stat(
-                self.category + "_completed_achievements", '-', 1
-            )
-            Achievement.controller.update_stat(
-                self.category + "_completed_points", '-', self.points
-            )
-            reward_type = self.reward.split("_")[-1]
-            Achievement.controller.update_stat(
-                "completed_" + reward_type, '-', self.reward_amount
-            )
-            self.frame.grid_forget()
-            Achievement.controller.update_achievement(self)
-
-    def on_planned_checkbox(self):
-        # achievement checkbox values will be updated in file
-        Achievement.write_achievements[self.title] = self
-        # if checkbox has been checked
-        if self.planned_var.get() == 1:
-            # if the achievement has been completed, then it makes
-            # no sense to have it planned. Therefore prevent user
-            # from checking planned when it is already completed
-            if self.completed_var.get() == 1:
-                self.planned_var.set(0)
-                return
-
-            Achievement.controller.update_stat(
-                "planned_achievements", '+', 1
-            )
-            Achievement.controller.update_stat(
-                "planned_points", '+', self.points
-            )
-            Achievement.controller.update_stat(
-                self.category + "_planned_achievements", '+', 1
-            )
-            Achievement.controller.update_stat(
-                self.category + "_planned_points", '+', self.points
-            )
-            reward_type = self.reward.split("_")[-1]
-            Achievement.controller.update_stat(
-                "planned_" + reward_type, '+', self.reward_amount
-            )
-        else:
-            Achievement.controller.update_stat(
-                "planned_achievements", '-', 1
-            )
-            Achievement.controller.update_stat(
-                "planned_points", '-', self.points
-            )
-            Achievement.controller.update_stat(
-                self.category + "_planned_achievements", '-', 1
-            )
-            Achievement.controller.update_stat(
-                self.category + "_planned_points", '-', self.points
-            )
-            reward_type = self.reward.split("_")[-1]
-            Achievement.controller.update_stat(
-                "planned_" + reward_type, '-', self.reward_amount
-            )
-            pass
+            AchievementImages.reward_images[reward] = img
 
 
 if __name__ == "__main__":
     root = AppController()
     root.mainloop()
+    # only prints anything if tracing was turned on, see latency.py
+    root.print_latency()
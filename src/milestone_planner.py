@@ -0,0 +1,326 @@
+import argparse
+import collections
+import itertools
+import json
+import math
+import re
+import sys
+
+import catalog
+
+
+# **********************************************************************
+# Finds the cheapest set of uncompleted achievements that reaches a
+# milestone (or any other amount of points).
+
+# Levels of an achievement can't be completed out of order, so the
+# uncompleted levels of each achievement form a chain. Picking level III
+# also means picking levels I and II. Each chain is a group of options
+# (its first 1, 2, ... levels) of which at most one is picked, which is
+# solved as a grouped knapsack over the points needed. Point values are
+# all multiples of 5, so the points are divided by their greatest common
+# divisor to keep the table small, and after each chain the table only
+# covers the points that can still lead to the target.
+
+# Usage:
+#   python milestone_planner.py                   plan the next milestone
+#   python milestone_planner.py -t 3000 -c tasks  plan 3000 points by tasks
+# **********************************************************************
+
+# The ways the cost of a level can be measured
+COST_TYPES = ("levels", "tasks", "weights")
+
+# A single uncompleted level, or an uncompleted list achievement.
+#   title: achievement title
+#   level: roman numeral of the level, None for list achievements
+#   points: points awarded for completing it
+#   tasks: number of tasks still needed for it after the previous level
+#   ref: the object this item was built from, if any
+PlanItem = collections.namedtuple(
+    "PlanItem", ("title", "level", "points", "tasks", "ref"))
+
+# The result of plan_milestone(). items are in chain order.
+Plan = collections.namedtuple("Plan", ("items", "points", "cost"))
+
+
+def task_count(num_tasks):
+    """Returns the first number in a num_tasks string, ie. 1000 for
+    "1,000" or 5 for "Get a rating of S or above 5 times". Returns None if
+    the string doesn't contain a number.
+    """
+    match = re.search(r"\d[\d,]*", num_tasks)
+    if match is None:
+        return None
+    return int(match.group().replace(",", ""))
+
+
+def leveled_chain(title, levels):
+    """Creates the chain for a leveled achievement.
+
+    Args:
+        title (string): achievement title
+        levels (list of tuples): (rom_num, num_tasks, points, is_completed,
+            ref) for every level, starting at level I
+
+    Ret:
+        (list of PlanItems): the levels after the last completed level
+    """
+    chain = []
+    prev_tasks = 0
+    for rom_num, num_tasks, points, is_completed, ref in levels:
+        tasks = task_count(num_tasks)
+        if is_completed == 1:
+            chain = []
+            prev_tasks = tasks or 0
+            continue
+        if tasks is None:
+            # non-numeric tasks such as "Diamond I" count as one task
+            level_tasks = 1
+        else:
+            level_tasks = max(tasks - prev_tasks, 1)
+            prev_tasks = tasks
+        chain.append(PlanItem(title, rom_num, points, level_tasks, ref))
+    return chain
+
+
+def chains_from_catalog(leveled_data, list_data, progress=None):
+    """Creates a chain for every uncompleted achievement in the catalog.
+
+    Args:
+        leveled_data (dict): leveled achievements as read by load_catalog()
+        list_data (dict): list achievements as read by load_catalog()
+        progress (dict): optional progress as read by load_progress()
+    """
+    states = catalog.iter_achievements(leveled_data, list_data, progress)
+    chains = []
+    for achievement in leveled_data["leveled_achievements"]:
+        levels = []
+        for lvl in achievement["levels"]:
+            is_completed = next(states)[7]
+            levels.append((lvl["rom_num"], lvl["num_tasks"],
+                           int(lvl["points"]), is_completed, None))
+        chain = leveled_chain(achievement["title"], levels)
+        if chain:
+            chains.append(chain)
+    for achievement in list_data["list_achievements"]:
+        if next(states)[7] == 1:
+            continue
+        chains.append([PlanItem(achievement["title"], None,
+                                int(achievement["points"]),
+                                len(achievement["task_list"]), None)])
+    return chains
+
+
+def item_cost(item, cost_type, weights):
+    """Returns the cost of picking a single item."""
+    if cost_type == "levels":
+        return 1
+    elif cost_type == "tasks":
+        return item.tasks
+    # weights can be given per level or per achievement, default 1
+    weight = weights.get(f"{item.title} {item.level}")
+    if weight is None:
+        weight = weights.get(item.title, 1)
+    return weight
+
+
+def lookup(table, p):
+    """Returns the cost of awarding at least p units from a dp window of
+    plan_milestone(), inf if p is above the window.
+    """
+    lo, costs = table
+    index = max(p, 0) - lo
+    return costs[index] if index < len(costs) else float("inf")
+
+
+def window(table, start, count):
+    """Returns an iterator over the costs of count consecutive p, from
+    start, of a dp window of plan_milestone(). p below 0 cost the same as
+    0, and p above the window cost inf. start must not be below the
+    window unless it's below 0, in which case the window starts at 0.
+    """
+    lo, costs = table
+    below = min(max(-start, 0), count)
+    first = max(start, 0) - lo
+    inside = max(min(len(costs) - first, count - below), 0)
+    return itertools.chain(
+        itertools.repeat(costs[0], below),
+        itertools.islice(costs, first, first + inside),
+        itertools.repeat(float("inf"), count - below - inside))
+
+
+def plan_milestone(chains, points_needed, cost_type="levels", weights=None):
+    """Picks the items with the lowest total cost that award at least
+    points_needed points.
+
+    Args:
+        chains (list of lists of PlanItems): uncompleted levels of each
+            achievement, lowest level first
+        points_needed (int): points that have to be awarded
+        cost_type (string): one of COST_TYPES
+        weights (dict): cost of each "title rom_num" or "title" when
+            cost_type is "weights". Anything not in it costs 1.
+
+    Ret:
+        plan (Plan): the picked items, or None if all chains combined
+            can't award enough points
+    """
+    if cost_type not in COST_TYPES:
+        raise ValueError(f"unknown cost type: {cost_type}")
+    weights = weights or {}
+    if points_needed <= 0:
+        return Plan([], 0, 0)
+
+    # scale points down so that the table has one entry per possible step
+    unit = 0
+    for chain in chains:
+        for item in chain:
+            unit = math.gcd(unit, item.points)
+    if unit == 0:
+        return None
+    cap = -(-points_needed // unit)
+
+    # options[g] lists (units, cost, count) of picking the first count
+    # items of chain g. An option is left out if a longer one costs no
+    # more, since it awards more points as well.
+    options = []
+    for chain in chains:
+        chain_options = []
+        units = 0
+        cost = 0
+        for count, item in enumerate(chain, start=1):
+            units += item.points // unit
+            cost += item_cost(item, cost_type, weights)
+            while chain_options and chain_options[-1][1] >= cost:
+                chain_options.pop()
+            chain_options.append((units, cost, count))
+        options.append(chain_options)
+
+    # dp[p] is the lowest cost of awarding at least p units. After a
+    # chain only the p that can still matter are kept: no more than the
+    # units of the chains so far (more costs inf) and no less than cap
+    # minus the units of the chains left (fewer can't reach cap). The
+    # window is kept per chain as (lowest p, costs) so that the picked
+    # options can be found afterwards.
+    # Costs are kept as floats so that float(cost).__add__ works with inf,
+    # which lets the inner loops run in map() instead of python code.
+    inf = float("inf")
+    remaining = sum(chain_options[-1][0] for chain_options in options
+                    if chain_options)
+    if remaining < cap:
+        return None
+    dp = (0, [0.0])
+    tables = []
+    for chain_options in options:
+        tables.append(dp)
+        if chain_options:
+            remaining -= chain_options[-1][0]
+        lo = max(cap - remaining, 0)
+        hi = min(dp[0] + len(dp[1]) - 1
+                 + (chain_options[-1][0] if chain_options else 0), cap)
+        # new_dp[p] = min(dp[p], dp[max(p - units, 0)] + cost, ...) over
+        # every option, in a single pass
+        count = hi - lo + 1
+        columns = [window(dp, lo, count)]
+        for units, cost, _ in chain_options:
+            columns.append(map(float(cost).__add__,
+                               window(dp, lo - units, count)))
+        if len(columns) == 1:
+            dp = (lo, list(columns[0]))
+        else:
+            dp = (lo, list(map(min, *columns)))
+
+    if lookup(dp, cap) == inf:
+        return None
+
+    # walk back through the chains to find which option was picked
+    picked = []
+    p = cap
+    for g in range(len(chains) - 1, -1, -1):
+        before = tables[g]
+        after = tables[g + 1] if g + 1 < len(tables) else dp
+        best = lookup(after, p)
+        if lookup(before, p) == best:
+            continue
+        for units, cost, count in options[g]:
+            if lookup(before, p - units) + float(cost) == best:
+                picked.append(chains[g][:count])
+                p = max(p - units, 0)
+                break
+
+    items = [item for chain in reversed(picked) for item in chain]
+    total_cost = sum(item_cost(item, cost_type, weights) for item in items)
+    return Plan(items, sum(item.points for item in items), total_cost)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Suggest the cheapest achievements to reach the next "
+                    "milestone."
+    )
+    parser.add_argument("--leveled", default=catalog.LEVELED_FILE,
+                        help="path to leveled_achievements.json")
+    parser.add_argument("--list", default=catalog.LIST_FILE,
+                        help="path to list_achievements.json")
+    parser.add_argument("-p", "--progress",
+                        help="read planned/completed values from a "
+                             "progress file instead of the json files")
+    parser.add_argument("-t", "--target", type=int,
+                        help="total points to reach (default: next "
+                             "milestone)")
+    parser.add_argument("-c", "--cost", choices=COST_TYPES,
+                        default="levels", help="what to minimize")
+    parser.add_argument("-w", "--weights",
+                        help="json file mapping \"title\" or \"title "
+                             "rom_num\" to a cost, used with -c weights")
+    parser.add_argument("--json", action="store_true",
+                        help="print the plan as json")
+    args = parser.parse_args(argv)
+
+    leveled_data, list_data = catalog.load_catalog(args.leveled, args.list)
+    progress = None
+    if args.progress:
+        progress = catalog.load_progress(args.progress)
+    weights = None
+    if args.weights:
+        with open(args.weights, 'r') as json_file:
+            weights = json.load(json_file)
+
+    stat_dict = catalog.compute_stats(leveled_data, list_data, progress)
+    points = stat_dict["completed_points"]
+    target = args.target
+    if target is None:
+        milestone = catalog.next_milestone_info(stat_dict)
+        if milestone is None:
+            print("All milestones completed")
+            return 0
+        target = milestone[0]
+
+    chains = chains_from_catalog(leveled_data, list_data, progress)
+    plan = plan_milestone(chains, target - points, args.cost, weights)
+
+    if args.json:
+        result = None
+        if plan is not None:
+            result = {
+                "target": target, "points": plan.points, "cost": plan.cost,
+                "items": [{"title": item.title, "level": item.level,
+                           "points": item.points} for item in plan.items]
+            }
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif plan is None:
+        print(f"{target} points can't be reached")
+    else:
+        print(f"Plan for {target} points: {plan.points} points "
+              + f"for a cost of {plan.cost} {args.cost}")
+        for item in plan.items:
+            title = item.title
+            if item.level is not None:
+                title += " " + item.level
+            print(f"  {title:<40}{item.points} points")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,587 @@
+from command_log import Change, PLANNED, COMPLETED, make_state
+from display_text import leveled_text, list_text
+from rewards import get_reward_type
+
+
+# **********************************************************************
+# Achievement model.
+
+# These classes hold the planned/completed values of every achievement
+# and the logic of checking and unchecking them. They don't depend on Tk:
+# every change is published on an EventBus as a single Change (see
+# command_log.py), and the frames subscribe to it to update what they
+# display.
+# **********************************************************************
+
+# Published with a Change every time the checkbox values of any
+# achievements change
+ACHIEVEMENTS_CHANGED = "achievements_changed"
+
+# Actions that can be applied to every achievement in a category at once.
+#   complete: every level is checked as completed
+#   plan: every uncompleted level is checked as planned
+#   clear: every planned and completed checkbox is unchecked
+BULK_ACTIONS = ("complete", "plan", "clear")
+
+
+class Achievement():
+    """Contains static dictionaries and lists which both LeveledAchievement
+    and ListAchievement can access.
+    """
+    # a list containing a reference to every achievement
+    achievement_list = []
+    # the EventBus that changes are published on
+    bus = None
+    # a dictionary for storing achievements that need to be updated in file
+    write_achievements = {}
+
+    @staticmethod
+    def static_init(achievement_list, bus, write_achievements):
+        Achievement.achievement_list = achievement_list
+        Achievement.bus = bus
+        Achievement.write_achievements = write_achievements
+
+    def get_state(self):
+        """Returns the checkbox values as a state, see command_log.py."""
+        return make_state(self.is_planned, self.is_completed)
+
+    def load_state(self, state):
+        """Sets the checkbox values from a state without cascading. Used for
+        undo and redo.
+        """
+        self.is_planned = 1 if state & PLANNED else 0
+        self.is_completed = 1 if state & COMPLETED else 0
+
+    def add_state_stats(self, stat_delta, is_planned, is_completed, sign):
+        """Adds the stats that an achievement (or level) with the given
+        checkbox values counts towards to stat_delta.
+
+        Args:
+            stat_delta (dict): maps stats to the amount they changed by
+            is_planned (int): 1 for planned, 0 for not planned
+            is_completed (int): 1 for completed, 0 for not completed
+            sign (int): 1 to add the stats, -1 to remove them
+        """
+        if is_completed:
+            adj = "completed_"
+            reward_key = self.reward_type.completed_key
+        elif is_planned:
+            adj = "planned_"
+            reward_key = self.reward_type.planned_key
+        else:
+            return
+
+        for stat, amount in (
+            (adj + "achievements", 1),
+            (adj + "points", self.points),
+            (self.category + "_" + adj + "achievements", 1),
+            (self.category + "_" + adj + "points", self.points),
+            (reward_key, self.reward_amount)
+        ):
+            stat_delta[stat] = stat_delta.get(stat, 0) + sign * amount
+
+    def set_state(self, is_planned, is_completed):
+        """Sets both checkbox values without cascading to other levels.
+
+        Ret:
+            (bool): False if the checkbox values were already set
+        """
+        if (self.is_planned, self.is_completed) == (is_planned, is_completed):
+            return False
+        self.is_planned = is_planned
+        self.is_completed = is_completed
+        return True
+
+
+def make_change(achievements, old_states):
+    """Returns the Change from old_states to the current checkbox values.
+
+    Args:
+        achievements (list): every achievement (or level) that could have
+            changed
+        old_states (list of ints): the state of each achievement before
+            the change
+
+    Ret:
+        (Change): the change, or None if nothing changed
+    """
+    indices = []
+    old = []
+    new = []
+    stat_delta = {}
+    for achievement, old_state in zip(achievements, old_states):
+        new_state = achievement.get_state()
+        if new_state == old_state:
+            continue
+        indices.append(achievement.list_index)
+        old.append(old_state)
+        new.append(new_state)
+        achievement.add_state_stats(stat_delta, old_state & PLANNED,
+                                    old_state & COMPLETED, -1)
+        achievement.add_state_stats(stat_delta, new_state & PLANNED,
+                                    new_state & COMPLETED, 1)
+    if not indices:
+        return None
+
+    return Change(
+        tuple(indices), bytes(old), bytes(new),
+        {stat: amount for stat, amount in stat_delta.items() if amount}
+    )
+
+
+def publish_change(achievements, old_states):
+    """Publishes the change from old_states to the current checkbox values,
+    if anything changed.
+    """
+    change = make_change(achievements, old_states)
+    if change is not None:
+        Achievement.bus.publish(ACHIEVEMENTS_CHANGED, change)
+
+
+def get_unit(achievement):
+    """Returns the LeveledAttributes of a level, or the achievement itself
+    for list achievements. Used wherever a leveled achievement should only
+    be handled once instead of once per level.
+    """
+    if isinstance(achievement, LeveledAchievement):
+        return achievement.shared_attrs
+    return achievement
+
+
+def bulk_action(units, action):
+    """Applies a bulk action to several achievements at once and publishes
+    a single change.
+
+    Args:
+        units (list): LeveledAttributes for leveled achievements and
+            ListAchievement for list achievements
+        action (string): one of BULK_ACTIONS
+    """
+    # every level of every achievement, to find what changed
+    achievements = []
+    for unit in units:
+        if isinstance(unit, LeveledAttributes):
+            achievements.extend(unit.levels)
+        else:
+            achievements.append(unit)
+    old_states = [achievement.get_state() for achievement in achievements]
+
+    for unit in units:
+        unit.apply_bulk_action(action)
+
+    publish_change(achievements, old_states)
+
+
+def apply_change(change):
+    """Sets the checkbox values of every achievement in a change to their
+    new state and publishes it. Only the achievements in the change are
+    visited, the cascade logic isn't run again.
+
+    Args:
+        change (Change): a change returned by CommandLog.undo() or
+            CommandLog.redo()
+    """
+    # the unit of every changed achievement, each once
+    units = {}
+    for index, state in zip(change.indices, change.new):
+        achievement = Achievement.achievement_list[index]
+        achievement.load_state(state)
+        units[get_unit(achievement)] = None
+
+    for unit in units:
+        if isinstance(unit, LeveledAttributes):
+            unit.overall_completed = str(unit.last_lvl.is_completed)
+            # achievement checkbox values will be updated in file
+            Achievement.write_achievements[unit.title] = unit.first_lvl
+        else:
+            Achievement.write_achievements[unit.title] = unit
+
+    Achievement.bus.publish(ACHIEVEMENTS_CHANGED, change)
+
+
+class LeveledAttributes():
+    """A class for storing shared attributes between every level of
+    an achievement.
+
+    These shared attributes include the category, title, description,
+    info, if it's overall completed, and the levels of the achievement in
+    order. Achievements levels will be able to access these attributes by
+    storing a reference to the instance of this class.
+
+    Args:
+        category (string): achievement category
+        title (string): achievement title
+        desc (string): achievement description
+        info (string): contains tips and tricks about the achievement. Only
+            stored in the first level of each achievement.
+        overall_completed (string): 1 if all levels are completed, 0 if not
+
+    Attributes:
+        levels (list of LeveledAchievement): every level of the achievement,
+            starting with level I. Levels are added with add_level(), which
+            also gives each level it's position in this list.
+    """
+
+    def __init__(self, category, title, desc, info, overall_completed):
+        self.category = category
+        self.title = title
+        self.desc = desc
+        self.info = info
+        self.overall_completed = overall_completed
+        self.levels = []
+
+    def add_level(self, level):
+        """Adds the next level of the achievement.
+
+        Args:
+            level (LeveledAchievement): the level after the last added level
+        """
+        level.level_index = len(self.levels)
+        self.levels.append(level)
+
+    @property
+    def shown_lvl(self):
+        """The level shown in the achievement's frame: the last level if the
+        achievement is completed, else the first level to not be completed.
+        """
+        if self.overall_completed != '1':
+            for lvl in self.levels:
+                if lvl.is_completed == 0:
+                    return lvl
+        return self.last_lvl
+
+    @property
+    def is_overall_completed(self):
+        """True if every level of the achievement is completed."""
+        return self.overall_completed == '1'
+
+    @property
+    def list_index(self):
+        """The index of the first level in achievement_list."""
+        return self.levels[0].list_index
+
+    def apply_bulk_action(self, action):
+        """Applies a bulk action to every level of the achievement. See
+        bulk_action().
+
+        Args:
+            action (string): one of BULK_ACTIONS
+
+        Ret:
+            (bool): True if any checkbox value changed
+        """
+        changed = False
+        for lvl in self.levels:
+            if action == "complete":
+                changed |= lvl.set_state(0, 1)
+            elif action == "plan":
+                # completed levels can't be planned
+                if lvl.is_completed == 0:
+                    changed |= lvl.set_state(1, 0)
+            else:
+                changed |= lvl.set_state(0, 0)
+
+        if changed:
+            self.overall_completed = str(self.last_lvl.is_completed)
+            # achievement checkbox values will be updated in file
+            Achievement.write_achievements[self.title] = self.first_lvl
+        return changed
+
+    @property
+    def first_lvl(self):
+        """The first level of the achievement. Needed when initializing
+        the achievement's info frame and when saving.
+        """
+        return self.levels[0]
+
+    @property
+    def last_lvl(self):
+        """The last level of the achievement. Needed for checking if the
+        achievement has been completed and for initializing the info frame.
+        """
+        return self.levels[-1]
+
+
+class LeveledAchievement(Achievement):
+    """Contains information and methods needed for each level of
+    an achievement.
+
+    A leveled achievement is any achievement that has multiple levels to it.
+    Each level has the player complete an increased amount of tasks from the
+    last level (ie. winning once, then 10 times, then 20, and then 50).
+    Therefore each level has an associated number of tasks, a roman numeral
+    representing the level, planned and completed values, and the
+    associated reward and achievement points for completing that level.
+
+    To save RAM, there is a seperate class storing shared attributes between
+    the levels. A reference to this class is stored in each level.
+
+    Args:
+        level_rom_num (string): a roman numeral representing the level of
+            the achievement
+        is_planned (int): 1 for planned, 0 for not planned
+        is_completed (int): 1 for completed, 0 for not completed
+        num_tasks (str): the number of tasks required to complete
+            the the level of the achievement. The task is described in
+            achievement description.
+        points (int): amount of points awarded upon level completion.
+        reward_amount (int): amount of reward awarded upon level completion
+        reward (str): name of reward.
+        list_index (int): the index at which this level will be placed in
+            achievement_list.
+        shared_attrs (LeveledAttributes): a reference to the achievements
+        LeveledAttributes, which stores the attributes shared between every
+        level. The level's position in shared_attrs.levels is stored as
+        level_index once it is added with LeveledAttributes.add_level().
+
+    """
+
+    def __init__(self, level_rom_num, is_planned, is_completed, num_tasks,
+                 points, reward_amount, reward, list_index, shared_attrs):
+        self.level_rom_num = level_rom_num
+        # checkbox values
+        self.is_planned = is_planned
+        self.is_completed = is_completed
+        self.num_tasks = num_tasks
+        self.points = points
+        self.reward = reward
+        # RewardType of the reward, used for updating statistics
+        self.reward_type = get_reward_type(reward)
+        self.reward_amount = reward_amount
+        self.list_index = list_index
+        # a reference to LeveledAttributes
+        self.shared_attrs = shared_attrs
+        # position in shared_attrs.levels, assigned in add_level()
+        self.level_index = None
+        # formatted and wrapped text, see display_text.py
+        self.text = leveled_text(self)
+
+    @property
+    def category(self):
+        """The achievement's category, stored in shared_attrs."""
+        return self.shared_attrs.category
+
+    def set_completed(self, is_completed):
+        """Checks or unchecks the completed checkbox of this level, along
+        with the levels it cascades to.
+
+        Args:
+            is_completed (int): 1 to check, 0 to uncheck
+        """
+        # achievement checkbox values will be updated in file
+        Achievement.write_achievements[self.shared_attrs.title] = \
+            self.shared_attrs.first_lvl
+
+        levels = self.shared_attrs.levels
+        old_states = [lvl.get_state() for lvl in levels]
+
+        if is_completed == 1:
+            self.check_completed()
+        else:
+            self.uncheck_completed()
+
+        publish_change(levels, old_states)
+
+    def check_completed(self):
+        """Automatically checks "completed" checkboxes in lower levels
+        of achievement.
+
+        Called when checking a "completed" checkbox. This method will
+        automatically check every level lower than the current level.
+        Ex. If lvl III is checked, this method will check off "completed"
+        for lvl II and lvl I.
+
+        If the last level was just completed by the user, the achievement
+        is marked as overall completed.
+        """
+        levels = self.shared_attrs.levels
+
+        # iterate from this level down through lower levels of achievement,
+        # stopping at the first level that is already completed
+        for cur_lvl in levels[self.level_index::-1]:
+            if cur_lvl is not self and cur_lvl.is_completed == 1:
+                break
+            cur_lvl.is_completed = 1
+            # achievement can't be planned if it's completed
+            cur_lvl.is_planned = 0
+
+        # if completing the last level
+        if self is self.shared_attrs.last_lvl:
+            self.shared_attrs.overall_completed = '1'
+
+    def uncheck_completed(self):
+        """Automatically unchecks "completed" checkboxes in higher levels
+        of achievement.
+
+        Called when unchecking a "completed" checkbox. This method will
+        automatically uncheck every higher level than the current level,
+        after which the achievement is no longer overall completed.
+        """
+        self.shared_attrs.overall_completed = '0'
+
+        # iterate from this level up through higher levels of achievement,
+        # stopping at the first level that isn't completed
+        for cur_lvl in self.shared_attrs.levels[self.level_index:]:
+            if cur_lvl is not self and cur_lvl.is_completed == 0:
+                break
+            cur_lvl.is_completed = 0
+
+    def set_planned(self, is_planned):
+        """Checks or unchecks the planned checkbox of this level, along
+        with the levels it cascades to.
+
+        Args:
+            is_planned (int): 1 to check, 0 to uncheck
+        """
+        # achievement checkbox values will be updated in file
+        Achievement.write_achievements[self.shared_attrs.title] = \
+            self.shared_attrs.first_lvl
+
+        levels = self.shared_attrs.levels
+        old_states = [lvl.get_state() for lvl in levels]
+
+        if is_planned == 1:
+            self.check_planned()
+        else:
+            self.uncheck_planned()
+
+        publish_change(levels, old_states)
+
+    def check_planned(self):
+        """Automatically checks "planned" checkboxes in lower
+        levels of achievement.
+
+        See check_completed() for a more similar, more detailed
+        description of method behaviour.
+        """
+        # iterate from this level down through lower levels of achievement,
+        # stopping at the first level that is already planned
+        for cur_lvl in self.shared_attrs.levels[self.level_index::-1]:
+            if cur_lvl is not self and cur_lvl.is_planned == 1:
+                break
+            # achievement can't be planned if it's already completed
+            if cur_lvl.is_completed == 1:
+                break
+            cur_lvl.is_planned = 1
+
+    def uncheck_planned(self):
+        """Automatically unchecks "planned" checkboxes in higher
+        levels of achievement.
+
+        See uncheck_completed() for a more similar, more detailed
+        description of method behaviour.
+        """
+        # iterate from this level up through higher levels of achievement,
+        # stopping at the first level that isn't planned
+        for cur_lvl in self.shared_attrs.levels[self.level_index:]:
+            if cur_lvl is not self and cur_lvl.is_planned == 0:
+                break
+            cur_lvl.is_planned = 0
+
+
+class ListAchievement(Achievement):
+    """Contains information and methods related to any achivement
+    that requires the user to complete a list of tasks.
+    Args:
+        category (string): achievement category
+        title (string): achievement title
+        desc (string): achievement description
+        task_list (List of strings): The list of tasks
+            to complete the achievement.
+        is_planned (int): 1 for planned, 0 for not planned
+        is_completed (int): 1 for completed, 0 for not completed
+        points (int): amount of points awarded upon level completion
+        reward_amount (int): amount of reward awarded upon level completion
+        reward (string): name of reward
+        list_index (int): the index at which this level will be placed in
+            achievement_list.
+        info (string): contains tips and tricks about the achievement. Only
+            stored in the first level of each achievement.
+    """
+
+    def __init__(self, category, title, desc, task_list, is_planned,
+                 is_completed, points, reward_amount, reward, list_index,
+                 info):
+
+        self.category = category
+        self.title = title
+        self.desc = desc
+        self.task_list = task_list
+        # checkbox values
+        self.is_planned = is_planned
+        self.is_completed = is_completed
+        self.points = points
+        self.reward = reward
+        # RewardType of the reward, used for updating statistics
+        self.reward_type = get_reward_type(reward)
+        self.reward_amount = reward_amount
+        self.list_index = list_index
+        self.info = info
+        # formatted and wrapped text, see display_text.py
+        self.text = list_text(self)
+
+    @property
+    def is_overall_completed(self):
+        """True if the achievement is completed."""
+        return self.is_completed == 1
+
+    def apply_bulk_action(self, action):
+        """Applies a bulk action to the achievement. See bulk_action().
+
+        Args:
+            action (string): one of BULK_ACTIONS
+
+        Ret:
+            (bool): True if any checkbox value changed
+        """
+        if action == "complete":
+            changed = self.set_state(0, 1)
+        elif action == "plan":
+            # a completed achievement can't be planned
+            if self.is_completed == 1:
+                return False
+            changed = self.set_state(1, 0)
+        else:
+            changed = self.set_state(0, 0)
+
+        if changed:
+            # achievement checkbox values will be updated in file
+            Achievement.write_achievements[self.title] = self
+        return changed
+
+    def set_completed(self, is_completed):
+        """Checks or unchecks the completed checkbox.
+
+        Args:
+            is_completed (int): 1 to check, 0 to uncheck
+        """
+        # achievement checkbox values will be updated in file
+        Achievement.write_achievements[self.title] = self
+        old_states = [self.get_state()]
+
+        self.is_completed = is_completed
+        # achievement can't be planned if it's completed
+        if is_completed == 1:
+            self.is_planned = 0
+
+        publish_change([self], old_states)
+
+    def set_planned(self, is_planned):
+        """Checks or unchecks the planned checkbox.
+
+        Args:
+            is_planned (int): 1 to check, 0 to uncheck
+        """
+        # if the achievement has been completed, then it makes
+        # no sense to have it planned. Therefore prevent user
+        # from checking planned when it is already completed
+        if is_planned == 1 and self.is_completed == 1:
+            return
+
+        # achievement checkbox values will be updated in file
+        Achievement.write_achievements[self.title] = self
+        old_states = [self.get_state()]
+
+        self.is_planned = is_planned
+
+        publish_change([self], old_states)
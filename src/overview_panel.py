@@ -0,0 +1,247 @@
+import collections
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from catalog import CATEGORIES, CATEGORY_TITLES, FINAL_MILESTONE, MILESTONES
+from rewards import REWARD_DISPLAY_ORDER, registry as reward_registry
+
+
+# **********************************************************************
+# Renders the statistics shown in the Overview into a single image.
+
+# OverviewFrame.draw_canvas() draws over a hundred texts, lines and
+# images onto the canvas. PanelRenderer draws the same statistics with
+# PIL onto one transparent image instead, which doesn't need Tk and so
+# can be rendered on a worker thread. The frame caches the images by
+# PanelSnapshot, so showing statistics that haven't changed is a single
+# canvas image.
+
+# Clickable parts of the panel (rewards, "Plan" and "History") are
+# returned as hotspots, which the frame looks up when the panel is
+# clicked.
+
+# The fonts don't match the canvas text yet, and the canvas items are
+# drawn before the image is swapped in, so the panel is off unless the
+# PUBGM_PANEL environment variable is set:
+#   PUBGM_PANEL=1 python main.py
+# **********************************************************************
+
+# Environment variable that turns the rendered panel on
+PANEL_ENV = "PUBGM_PANEL"
+
+# Tk font sizes are in points, PIL's are in pixels
+POINTS_TO_PIXELS = 96 / 72
+
+# Font files tried in order, by whether they're bold. Helvetica isn't
+# shipped as a font file, these look the closest.
+FONT_FILES = {
+    False: ("arial.ttf", "DejaVuSans.ttf"),
+    True: ("arialbd.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+# Tk text anchors used by draw_canvas() and the matching PIL anchors
+ANCHORS = {"nw": "la", "center": "mm", "w": "lm", "se": "rd"}
+
+WHITE = "white"
+YELLOW = "#DEDF00"
+
+# Everything the statistics panel shows, used as the key of the cache.
+#   stats (tuple): sorted (statistic, value) pairs of stat_dict
+#   next_milestone (int): the next milestone's points
+#   plan_message (string): shown instead of "Plan", or None
+PanelSnapshot = collections.namedtuple(
+    "PanelSnapshot", ("stats", "next_milestone", "plan_message"))
+
+
+def panel_enabled(environ=os.environ):
+    """Returns True if the rendered panel was turned on with PANEL_ENV."""
+    return environ.get(PANEL_ENV, "") not in ("", "0")
+
+
+def panel_snapshot(stat_dict, next_milestone, plan_message):
+    """Returns the PanelSnapshot of the current statistics."""
+    return PanelSnapshot(tuple(sorted(stat_dict.items())), next_milestone,
+                         plan_message)
+
+
+class PanelRenderer():
+    """Draws the statistics panel of the Overview with PIL.
+
+    Images and fonts are loaded the first time they're needed, on the
+    thread rendering the panel.
+
+    Args:
+        size (tuple): (width, height) of the panel, the size of the window
+        icons_path (string): folder of the reward type icons
+        rewards_path (string): folder of the reward images
+    """
+
+    def __init__(self, size, icons_path, rewards_path):
+        self.size = size
+        self.icons_path = icons_path
+        self.rewards_path = rewards_path
+        # loaded images and fonts, by file name and by (size, bold)
+        self.images = {}
+        self.fonts = {}
+
+    def font(self, size, bold=False):
+        """Returns the font of a Tk font size in points."""
+        key = (size, bold)
+        loaded = self.fonts.get(key)
+        if loaded is None:
+            pixels = round(size * POINTS_TO_PIXELS)
+            for file in FONT_FILES[bold]:
+                try:
+                    loaded = ImageFont.truetype(file, pixels)
+                    break
+                except OSError:
+                    continue
+            else:
+                loaded = ImageFont.load_default()
+            self.fonts[key] = loaded
+        return loaded
+
+    def image(self, file, size):
+        """Returns an image shrunk to fit in size."""
+        loaded = self.images.get(file)
+        if loaded is None:
+            loaded = Image.open(file).convert("RGBA")
+            loaded.thumbnail(size, Image.BICUBIC)
+            self.images[file] = loaded
+        return loaded
+
+    def render(self, snapshot):
+        """Draws the statistics of a snapshot.
+
+        Args:
+            snapshot (PanelSnapshot): see panel_snapshot()
+
+        Ret:
+            (tuple): (image, hotspots). image is a transparent RGBA image
+                the size of the window. hotspots is a list of
+                (tag, (left, top, right, bottom)) for every clickable part,
+                tagged the same way as in draw_canvas().
+        """
+        stats = dict(snapshot.stats)
+        panel = Image.new("RGBA", self.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(panel)
+        hotspots = []
+
+        def text(coord, string, size, anchor, fill=WHITE, tag=None,
+                 bold=True):
+            font = self.font(size, bold)
+            draw.text(coord, string, fill=fill, font=font,
+                      anchor=ANCHORS[anchor])
+            if tag is not None:
+                hotspots.append((tag, draw.textbbox(
+                    coord, string, font=font, anchor=ANCHORS[anchor])))
+
+        def paste(coord, file, size, tag):
+            img = self.image(file, size)
+            # Tk centres canvas images on their coordinates
+            left = coord[0] - img.width // 2
+            top = coord[1] - img.height // 2
+            panel.alpha_composite(img, (left, top))
+            hotspots.append((tag, (left, top, left + img.width - 1,
+                                   top + img.height - 1)))
+
+        text((1335, 615), "History", 14, 'se', YELLOW, "toggle_history")
+
+        # overall achievement stats
+        completed = stats["completed_achievements"]
+        possible = stats["possible_achievements"]
+        planned = stats["planned_achievements"]
+        text((195, 25), f"Achievements Completed: {completed}/{possible}",
+             20, 'nw')
+        text((195, 65), f"Planned: {planned}", 20, 'nw')
+        text((195, 105), f"Combined Total: {completed + planned}/{possible}",
+             20, 'nw')
+
+        # overall points stats
+        completed = stats["completed_points"]
+        possible = stats["possible_points"]
+        planned = stats["planned_points"]
+        text((740, 25), f"Points Completed: {completed}/{possible}", 20,
+             'nw')
+        text((740, 65), f"Planned: {planned}", 20, 'nw')
+        text((740, 105), f"Combined Total: {completed + planned}/{possible}",
+             20, 'nw')
+
+        # vertical line between achievements and points
+        draw.line(((700, 15), (700, 135)), fill=WHITE)
+
+        # next milestone
+        if stats["completed_points"] < FINAL_MILESTONE:
+            amount, reward = MILESTONES[str(snapshot.next_milestone)]
+            text((685, 165),
+                 f"Next Milestone: {snapshot.next_milestone} points     "
+                 + f"Reward:  {amount} x                ", 13, 'center')
+            paste((855, 165), self.rewards_path + reward + ".png", (50, 50),
+                  "milestone_reward")
+            if snapshot.plan_message is None:
+                text((905, 165), "Plan", 13, 'w', YELLOW, "plan_milestone")
+            else:
+                text((905, 165), snapshot.plan_message, 13, 'w', WHITE,
+                     "plan_milestone")
+        else:
+            text((700, 165), "All milestones completed", 13, 'center')
+
+        # horizontal line under achievements and points
+        draw.line(((155, 195), (1250, 195)), fill=WHITE)
+        text((310, 215), "By Category", 20, 'center')
+        text((868, 215), "Rewards", 20, 'center')
+        # vertical line between categories and rewards
+        draw.line(((485, 210), (485, 615)), fill=WHITE)
+
+        # table headings under "By Category"
+        text((215, 250), "Achievements", 14, 'center')
+        text((395, 250), "Points", 14, 'center')
+
+        # category titles and their achievements and points
+        y = 295
+        for category in CATEGORIES:
+            text((30, y - 10), CATEGORY_TITLES[category], 14, 'nw')
+            key = category + "_"
+            text((215, y),
+                 f"{stats[key + 'completed_achievements']} + "
+                 f"({stats[key + 'planned_achievements']}) /"
+                 f"{stats[key + 'possible_achievements']}", 14, 'center')
+            text((395, y),
+                 f"{stats[key + 'completed_points']} + "
+                 f"({stats[key + 'planned_points']}) / "
+                 f"{stats[key + 'possible_points']}", 14, 'center')
+            y += 46
+
+        # vertical line between category achievements and points
+        draw.line(((310, 285), (310, 582)), fill=WHITE)
+
+        # rewards, split into two columns
+        y = 240
+        for count, reward in enumerate(REWARD_DISPLAY_ORDER):
+            reward_type = reward_registry[reward]
+            if count % 2 == 0:
+                x1, x2 = 745 - 235, 976 - 235
+            else:
+                x1, x2 = 900 + 25, 1130 + 25
+
+            string = f"{stats[reward_type.completed_key]} + " \
+                f"({stats[reward_type.planned_key]}) / " \
+                f"{stats[reward_type.possible_key]}"
+            # adjustments for smaller text
+            if reward == "bp":
+                text((x1, y + 10), string, 12, 'w')
+            else:
+                text((x1, y), string, 14, 'nw')
+            text((x2 - 35, y + 10), "x", 14, 'center')
+            paste((x2, y + 10), self.icons_path + reward_type.icon, (45, 45),
+                  "reward_" + reward)
+            text((x2 + 35, y), reward_type.label, 12, 'nw')
+            if count % 2 == 1:
+                y += 50
+
+        # description at bottom
+        text((10, 605), "Values in brackets are what you plan to complete. "
+             + "Click a reward to see where to earn it", 10, 'nw',
+             bold=False)
+        return panel, hotspots
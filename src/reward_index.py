@@ -0,0 +1,87 @@
+import collections
+
+from catalog import MILESTONES
+from rewards import get_reward_type
+
+
+# **********************************************************************
+# Index of where every reward can be earned.
+
+# Maps each reward name (ie. "mechanic_shirt_outfit") and each reward
+# type (ie. "outfit") to it's sources: the achievements and levels that
+# award it, and the achievement point milestones that award it. Used to
+# answer "what gives me X" without opening every achievement.
+# **********************************************************************
+
+# A milestone as a source of a reward
+MilestoneSource = collections.namedtuple(
+    "MilestoneSource", ("points", "reward_amount", "reward"))
+
+
+def source_title(source):
+    """Returns the text shown for a source of a reward."""
+    if isinstance(source, MilestoneSource):
+        return f"Milestone: {source.points} points"
+    return source.text.title
+
+
+def source_status(source, completed_points):
+    """Returns whether a source's reward has been earned or planned.
+
+    Args:
+        source (LeveledAchievement, ListAchievement or MilestoneSource)
+        completed_points (int): the user's completed achievement points,
+            used for milestones
+
+    Ret:
+        (string): "Completed", "Planned" or ""
+    """
+    if isinstance(source, MilestoneSource):
+        return "Completed" if completed_points >= source.points else ""
+    if source.is_completed:
+        return "Completed"
+    if source.is_planned:
+        return "Planned"
+    return ""
+
+
+class RewardIndex():
+    """Finds the sources of a reward or of every reward of a type.
+
+    Args:
+        achievements (list): every achievement and level, ie.
+            achievement_list
+        milestones (dict): achievement point milestones, see
+            catalog.MILESTONES
+    """
+
+    def __init__(self, achievements, milestones=MILESTONES):
+        # maps each reward name to it's sources, in the order added
+        self.by_reward = {}
+        # maps each reward type code to the sources of every reward of
+        # that type
+        self.by_type = {}
+
+        for achievement in achievements:
+            self.add(achievement)
+        for points in sorted(milestones, key=int):
+            amount, reward = milestones[points]
+            # the 0 point milestone doesn't award anything
+            if amount:
+                self.add(MilestoneSource(int(points), amount, reward))
+
+    def add(self, source):
+        """Adds a source of the reward in source.reward."""
+        self.by_reward.setdefault(source.reward, []).append(source)
+        self.by_type.setdefault(get_reward_type(source.reward).code,
+                                []).append(source)
+
+    def sources(self, reward):
+        """Returns every source of a reward name, ie.
+        "mechanic_shirt_outfit".
+        """
+        return list(self.by_reward.get(reward, ()))
+
+    def sources_of_type(self, code):
+        """Returns every source of every reward of a type, ie. "outfit"."""
+        return list(self.by_type.get(code, ()))
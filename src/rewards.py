@@ -0,0 +1,91 @@
+import sys
+
+
+# **********************************************************************
+# Registry of reward types.
+
+# A reward's type is the last word of it's name, ie.
+# "mechanic_shirt_outfit" is an "outfit" and "premium-crate" is a
+# "premium-crate". Each reward name is parsed once and mapped to a shared
+# RewardType, which also holds the stat_dict keys and display text of the
+# type, so that code updating statistics never has to split or join
+# strings.
+# **********************************************************************
+
+# Every reward type that statistics are kept for
+REWARD_TYPES = (
+    "bp", "silver", "ag", "supply-scrap", "supply-crate",
+    "classic-scrap", "classic-crate", "premium-scrap",
+    "premium-crate", "title", "outfit", "finish", "parachute",
+    "gear", "paint", "misc"
+)
+
+# Order in which rewards are listed in the overview
+REWARD_DISPLAY_ORDER = (
+    "bp", "silver", "supply-scrap", "supply-crate",
+    "classic-scrap", "classic-crate", "premium-scrap",
+    "premium-crate", "ag", "title", "outfit", "finish",
+    "parachute", "gear", "paint", "misc"
+)
+
+# Text shown in the overview for types whose code doesn't read well
+REWARD_LABELS = {
+    "misc": "miscellaneous",
+    "finish": "weapon finishes",
+    "outfit": "outfits"
+}
+
+
+class RewardType():
+    """A reward type and everything needed to display it and keep
+    statistics for it.
+
+    Args:
+        code (string): the type as it appears at the end of reward names,
+            ie. "outfit"
+    """
+
+    __slots__ = ("code", "label", "icon", "completed_key", "planned_key",
+                 "possible_key")
+
+    def __init__(self, code):
+        self.code = sys.intern(code)
+        self.label = REWARD_LABELS.get(code, code.replace("_", " "))
+        # file name of the icon in images/rewards/icons
+        self.icon = code + ".png"
+        # keys of this type's statistics in stat_dict
+        self.completed_key = sys.intern("completed_" + code)
+        self.planned_key = sys.intern("planned_" + code)
+        self.possible_key = sys.intern("possible_" + code)
+
+    def __repr__(self):
+        return f"RewardType({self.code!r})"
+
+
+# Maps each type code to it's RewardType, in display order
+registry = {code: RewardType(code) for code in REWARD_DISPLAY_ORDER}
+
+# Maps each reward name that has been parsed to it's RewardType
+reward_types = {}
+
+
+def get_reward_type(reward):
+    """Returns the RewardType of a reward name, parsing the name the first
+    time it is seen.
+
+    Raises:
+        ValueError: if the reward's type isn't in REWARD_TYPES
+    """
+    try:
+        return reward_types[reward]
+    except KeyError:
+        pass
+    code = reward.split("_")[-1]
+    try:
+        reward_type = registry[code]
+    except KeyError:
+        raise ValueError(
+            f"reward {reward!r} has unknown reward type {code!r}"
+        ) from None
+    reward_types[sys.intern(reward)] = reward_type
+    return reward_type
@@ -1,8 +1,22 @@
+import contextlib
 import tkinter as tk
 
 # Desired sizes for the button images
 BUTTON_SIZE = 277, 45
 
+# Mouse wheel events that scroll a ScrollableFrame
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+# Pixels scrolled per notch of the mouse wheel
+SCROLL_PIXELS = 60
+# Windows reports a delta of 120 per notch, macOS reports 1 per step
+WHEEL_DELTA = {"win32": 120, "aqua": 1}
+# Milliseconds between two frames of a scroll animation
+FRAME_MS = 16
+# Fraction of the remaining distance scrolled in each frame, so scrolling
+# eases out instead of jumping
+SCROLL_EASING = 0.35
+
 
 class ScrollableFrame(tk.Frame):
     """Extends class tk.Frame to support a scrollable Frame
@@ -43,10 +57,23 @@ class ScrollableFrame(tk.Frame):
         self.canvas.configure(yscrollcommand=self.v_scrollbar.set)
         self.v_scrollbar.configure(command=self.canvas.yview)
 
+        # Scroll one pixel per unit, so the mouse wheel scrolls by pixels
+        self.canvas.configure(yscrollincrement=1)
+        # Pixels left to scroll, positive is down. Wheel events add to it
+        # and every frame scrolls part of it, so many events arriving at
+        # once are drawn once per frame.
+        self.pending_scroll = 0.0
+        # the after() id of the next frame, or None if not scrolling
+        self.scroll_job = None
+        self.wheel_delta = WHEEL_DELTA.get(
+            self.tk.call("tk", "windowingsystem"), 120)
+
         # Allow canvas to be scrolled using mousewheel while hovering
-        # over the canvas region. bind_all is used because just bind
-        # doesn't seem to work for scrolling on the canvas
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+        # over the canvas region. Wheel events are bound once for the
+        # whole window by a ScrollDispatcher, which passes them on to the
+        # ScrollableFrame under the pointer.
+        self.dispatcher = ScrollDispatcher.get(self.winfo_toplevel())
+        self.dispatcher.register(self)
 
         # Place a frame on the canvas, this frame will hold the child widgets
         # All widgets to be scrolled have to use this frame as parent
@@ -56,42 +83,186 @@ class ScrollableFrame(tk.Frame):
         self.canvas.create_window((0, 0), window=self.scrolled_frame,
                                   anchor="nw")
 
-        # Configures the scrollregion of the Canvas dynamically
-        self.scrolled_frame.bind("<Configure>", self.on_configure)
+        # Greater than 0 while widgets are being added inside batch()
+        self.batch_depth = 0
+        # True while a scroll region update is waiting for an idle callback
+        self.scrollregion_pending = False
 
         # Reset the scroll region to encompass the inner frame
         self.scrolled_frame.bind("<Configure>", self.on_frame_configure)
 
-    def on_configure(self, event):
+    @contextlib.contextmanager
+    def batch(self):
+        """Suspends scroll region updates while many widgets are added to
+        scrolled_frame inside the with block. The scroll region is computed
+        once after the block, instead of after every widget.
+        """
+        self.batch_depth += 1
+        try:
+            yield self.scrolled_frame
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                self.update_scrollregion()
+
+    def update_scrollregion(self):
+        """Resets the scroll region in the next idle callback. Any number of
+        calls before then only compute it once.
+        """
+        if self.batch_depth or self.scrollregion_pending:
+            return
+        self.scrollregion_pending = True
+        self.after_idle(self.set_scrollregion)
+
+    def set_scrollregion(self):
         """Set the scroll region to encompass the scrolled frame"""
+        self.scrollregion_pending = False
+        if not self.winfo_exists():
+            return
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def on_mousewheel(self, event):
         """Allows canvas to be scrolled using mousewheel while hovering
-        over canvas. Copied from:
-        https://preview.tinyurl.com/stackoverflow162
+        over canvas. Scrolls SCROLL_PIXELS per notch, no matter how long
+        the content is.
+
+        X11 sends Button-4 and Button-5 instead of <MouseWheel>, Windows
+        and macOS send a delta that is positive when scrolling up.
+        """
+        if event.num == 4:
+            notches = -1
+        elif event.num == 5:
+            notches = 1
+        elif event.delta:
+            notches = -event.delta / self.wheel_delta
+        else:
+            return
+        self.scroll_by(notches * SCROLL_PIXELS)
+
+    def scroll_by(self, pixels):
+        """Scrolls the canvas smoothly by a number of pixels, positive is
+        down. Scrolling happens over the next few frames.
+        """
+        # Scrolling the other way cancels what's left
+        if pixels * self.pending_scroll < 0:
+            self.pending_scroll = 0.0
+        self.pending_scroll += pixels
+        if self.scroll_job is None:
+            self.scroll_job = self.after(FRAME_MS, self.scroll_frame)
+
+    def scroll_frame(self):
+        """Scrolls part of the pending distance, and schedules the next
+        frame until nothing is left to scroll.
+        """
+        self.scroll_job = None
+        step = int(self.pending_scroll * SCROLL_EASING)
+        if step == 0:
+            # less than a pixel per frame left, finish the scroll
+            step = int(round(self.pending_scroll))
+        if step == 0:
+            self.pending_scroll = 0.0
+            return
+
+        top = self.canvas.yview()
+        self.canvas.yview_scroll(step, "units")
+        if self.canvas.yview() == top:
+            # reached the top or bottom of the content
+            self.pending_scroll = 0.0
+            return
+        self.pending_scroll -= step
+        self.scroll_job = self.after(FRAME_MS, self.scroll_frame)
+
+    def destroy(self):
+        """Stops any scroll animation and stops receiving wheel events
+        before destroying the frame.
         """
-        scroll_speed = 0.1
-        # n is either 1 or -1 and must be inverted
-        n = -event.delta / abs(event.delta)
-        # Return scrollbar position and adjust it by a fraction
-        p = self.v_scrollbar.get()[0] + (n*scroll_speed)
-        # Apply new position
-        self.canvas.yview_moveto(p)
+        if self.scroll_job is not None:
+            self.after_cancel(self.scroll_job)
+            self.scroll_job = None
+        self.dispatcher.unregister(self)
+        super().destroy()
 
     def on_frame_configure(self, event):
         """Reset the scroll region to encompass the inner frame"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.update_scrollregion()
+
+
+class ScrollDispatcher():
+    """Routes the mouse wheel events of a window to the ScrollableFrame
+    under the pointer.
+
+    The wheel events are bound once with bind_all, so showing or hiding a
+    ScrollableFrame never needs to rebind them, and frames hidden under
+    another frame never receive them. If the pointer isn't over any
+    ScrollableFrame, the events go to the one returned by get_active.
+
+    Args:
+        root (Tk): the window
+    """
 
-    def unbind_mousewheel(self):
-        """Unbinds the mouse-wheel to this instance. This needs to be called
-        every time another scrolled frame is raised.
+    @staticmethod
+    def get(root):
+        """Returns the dispatcher of a window, creating it the first time.
+
+        The dispatcher is kept on the window itself, so a new window
+        created after destroying the old one gets a new dispatcher bound
+        to it.
         """
-        self.canvas.unbind_all('<MouseWheel>')
+        dispatcher = getattr(root, "scroll_dispatcher", None)
+        if dispatcher is None:
+            dispatcher = ScrollDispatcher(root)
+            root.scroll_dispatcher = dispatcher
+        return dispatcher
+
+    def __init__(self, root):
+        self.root = root
+        # maps the path of each registered ScrollableFrame to it
+        self.scrollables = {}
+        # called without arguments when the pointer isn't over a
+        # ScrollableFrame, returns the one to scroll or None
+        self.get_active = lambda: None
+        for event in WHEEL_EVENTS:
+            root.bind_all(event, self.on_mousewheel)
+
+    def register(self, scrollable):
+        """Passes wheel events over scrollable on to it."""
+        self.scrollables[str(scrollable)] = scrollable
+
+    def unregister(self, scrollable):
+        """Stops passing wheel events on to scrollable."""
+        self.scrollables.pop(str(scrollable), None)
 
-    def bind_mousewheel(self):
-        """Re-binds this instance to the mouse-wheel. After unbinding the
-        current scrollable frame shown, this needs to be called on the scrollable
-        frame to be shown next.
+    def find(self, x_root, y_root):
+        """Returns the ScrollableFrame under a point on the screen, or None.
+        """
+        try:
+            widget = self.root.winfo_containing(x_root, y_root)
+        except KeyError:
+            # the point is over a window Tkinter doesn't know, ie. a menu
+            return None
+        # rows and info frames are children of a ScrollableFrame
+        while widget is not None:
+            scrollable = self.scrollables.get(str(widget))
+            if scrollable is not None:
+                # frames destroyed without unregistering, ie. along with
+                # a parent, are forgotten once they're found
+                if not scrollable.winfo_exists():
+                    self.unregister(scrollable)
+                    return None
+                return scrollable
+            widget = widget.master
+        return None
+
+    def on_mousewheel(self, event):
+        """Passes a wheel event on to the ScrollableFrame under the pointer,
+        or to the active one.
         """
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+        scrollable = self.find(event.x_root, event.y_root)
+        if scrollable is None:
+            scrollable = self.get_active()
+        if scrollable is None:
+            return
+        if not scrollable.winfo_exists():
+            self.unregister(scrollable)
+        elif scrollable.winfo_ismapped():
+            scrollable.on_mousewheel(event)
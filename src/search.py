@@ -0,0 +1,147 @@
+import bisect
+import re
+
+from model import LeveledAttributes
+
+
+# **********************************************************************
+# Full-text search over the achievement catalog.
+
+# An inverted index maps every word in an achievement's title,
+# description, tasks and info to the achievements containing it. The
+# words are also kept sorted, so every word starting with a prefix is
+# found with a binary search, which lets results update while the user is
+# still typing a word.
+
+# Leveled achievements are indexed once under their LeveledAttributes,
+# with the description of every level, since the number of tasks differs
+# between levels.
+# **********************************************************************
+
+# Number of prefixes whose matches are kept. Typing a word queries every
+# prefix of it, and deleting characters queries them again.
+PREFIX_CACHE_SIZE = 256
+
+# Number of achievements added to the index per callback while the GUI
+# builds it, so that building never blocks for longer than a frame
+INDEX_CHUNK_SIZE = 100
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Returns the lowercase words of text."""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def searchable_text(unit):
+    """Returns every piece of text of an achievement that is searched.
+
+    Args:
+        unit (LeveledAttributes or ListAchievement): the achievement
+    """
+    # levels have no task_list, they're searched by their descriptions
+    if isinstance(unit, LeveledAttributes):
+        texts = [unit.title, unit.info]
+        texts.extend(level.text.desc for level in unit.levels)
+    else:
+        texts = [unit.title, unit.desc, unit.info]
+        texts.extend(unit.task_list)
+    return texts
+
+
+class SearchIndex():
+    """An inverted index over the text of every achievement.
+
+    Achievements can be added a few at a time with add(), so that indexing
+    a large catalog doesn't block the GUI. Searches only find the
+    achievements added so far.
+    """
+
+    def __init__(self):
+        # LeveledAttributes for leveled achievements and ListAchievement
+        # for list achievements, in the order results are returned
+        self.units = []
+        # maps each word to the positions in units containing it, in
+        # increasing order
+        self.postings = {}
+        # every word, sorted so that words sharing a prefix are adjacent.
+        # Sorted again on the next search after words are added.
+        self.words = []
+        self.words_sorted = True
+        # maps prefixes to the frozenset of positions matching them
+        self.prefix_cache = {}
+
+    def add(self, units):
+        """Adds achievements to the index, after the ones already added.
+
+        Args:
+            units (list): LeveledAttributes for leveled achievements and
+                ListAchievement for list achievements
+        """
+        for unit in units:
+            doc = len(self.units)
+            self.units.append(unit)
+            # each word is only added once per achievement
+            text = " ".join(searchable_text(unit))
+            for word in set(tokenize(text)):
+                docs = self.postings.get(word)
+                if docs is None:
+                    self.postings[word] = [doc]
+                    self.words.append(word)
+                    self.words_sorted = False
+                else:
+                    docs.append(doc)
+        self.prefix_cache.clear()
+
+    def prefix_matches(self, prefix):
+        """Returns the positions of every achievement containing a word
+        that starts with prefix.
+        """
+        docs = self.prefix_cache.get(prefix)
+        if docs is not None:
+            return docs
+
+        # A longer prefix can only match a subset of a shorter one, so
+        # once every match of the previous prefix has been found the rest
+        # of the words can be skipped
+        parent = self.prefix_cache.get(prefix[:-1]) if prefix else None
+        if not self.words_sorted:
+            self.words.sort()
+            self.words_sorted = True
+        start = bisect.bisect_left(self.words, prefix)
+        # "\uffff" sorts after every character that is in a word
+        end = bisect.bisect_right(self.words, prefix + "\uffff", lo=start)
+        matched = set()
+        for word in self.words[start:end]:
+            matched.update(self.postings[word])
+            if parent is not None and len(matched) == len(parent):
+                break
+        docs = frozenset(matched)
+
+        if len(self.prefix_cache) >= PREFIX_CACHE_SIZE:
+            # drop the oldest prefix, dicts keep insertion order
+            del self.prefix_cache[next(iter(self.prefix_cache))]
+        self.prefix_cache[prefix] = docs
+        return docs
+
+    def search(self, query):
+        """Returns the achievements matching every word of query. Each word
+        matches as a prefix, so "gren" finds "grenade".
+
+        Ret:
+            (list): matching achievements in the order of units. Every
+                achievement if query has no words.
+        """
+        words = tokenize(query)
+        if not words:
+            return list(self.units)
+        # the rarest word is looked up first to keep the intersection small
+        matches = sorted((self.prefix_matches(word) for word in words),
+                         key=len)
+        docs = set(matches[0])
+        for other in matches[1:]:
+            docs &= other
+            if not docs:
+                break
+        return [self.units[doc] for doc in sorted(docs)]
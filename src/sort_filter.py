@@ -0,0 +1,203 @@
+import bisect
+import collections
+
+from model import LeveledAttributes
+from rewards import REWARD_DISPLAY_ORDER
+
+
+# **********************************************************************
+# Sort orders and filters for the achievements of a category.
+
+# A SortedView keeps the achievements of a category in a sort order. When
+# an achievement changes (ie. it's shown level is completed), only that
+# achievement is moved, and the positions that moved are returned so that
+# only the rows between them need to be placed again.
+
+# Leveled achievements are sorted and filtered by the level shown in
+# their row.
+# **********************************************************************
+
+# Sort orders, in the order they're listed, mapped to their display text
+SORT_ORDERS = collections.OrderedDict((
+    ("catalog", "Default order"),
+    ("points", "Most points"),
+    ("reward", "Reward type"),
+    ("amount", "Reward amount"),
+    ("planned", "Planned first"),
+    ("remaining", "Fewest levels left"),
+))
+
+# Statuses achievements can be filtered by, in the order they're listed,
+# mapped to their display text
+STATUSES = collections.OrderedDict((
+    ("uncompleted", "Uncompleted"),
+    ("completed", "Completed"),
+    ("planned", "Planned"),
+    ("all", "All"),
+))
+
+# Position of each reward type when sorting by reward type
+REWARD_RANK = {code: rank for rank, code in enumerate(REWARD_DISPLAY_ORDER)}
+
+
+def shown_achievement(unit):
+    """Returns the level shown in a leveled achievement's row, or the
+    achievement itself for list achievements.
+    """
+    if isinstance(unit, LeveledAttributes):
+        return unit.shown_lvl
+    return unit
+
+
+def remaining_levels(unit):
+    """Returns the number of levels of an achievement that aren't
+    completed. List achievements have a single level.
+    """
+    if isinstance(unit, LeveledAttributes):
+        return sum(1 for lvl in unit.levels if not lvl.is_completed)
+    return 0 if unit.is_completed else 1
+
+
+def sort_key(unit, order):
+    """Returns the key that an achievement is sorted by.
+
+    Every key ends with the achievement's position in achievement_list, so
+    achievements that are otherwise equal keep the order they were read
+    in and no two keys are equal.
+
+    Args:
+        unit (LeveledAttributes or ListAchievement): the achievement
+        order (string): one of SORT_ORDERS
+    """
+    achievement = shown_achievement(unit)
+    if order == "catalog":
+        key = ()
+    elif order == "points":
+        key = (-achievement.points,)
+    elif order == "reward":
+        key = (REWARD_RANK[achievement.reward_type.code],
+               -achievement.reward_amount)
+    elif order == "amount":
+        key = (-achievement.reward_amount,)
+    elif order == "planned":
+        key = (0 if achievement.is_planned else 1,)
+    elif order == "remaining":
+        key = (remaining_levels(unit),)
+    else:
+        raise ValueError(f"unknown sort order {order!r}")
+    return key + (unit.list_index,)
+
+
+class ViewFilter(collections.namedtuple(
+        "ViewFilter", ("status", "reward_type", "points"))):
+    """Which achievements of a category are shown.
+
+    Args:
+        status (string): one of STATUSES. "uncompleted" and "completed"
+            show achievements by whether every level is completed,
+            "planned" shows achievements whose shown level is planned.
+        reward_type (string): only show achievements rewarding this reward
+            type, ie. "outfit". None for every reward type.
+        points (int): only show achievements worth this many points. None
+            for any amount of points.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, status="all", reward_type=None, points=None):
+        if status not in STATUSES:
+            raise ValueError(f"unknown status {status!r}")
+        return super().__new__(cls, status, reward_type, points)
+
+    def matches(self, unit):
+        """Returns True if the achievement passes every filter."""
+        achievement = shown_achievement(unit)
+        if self.status == "uncompleted" and unit.is_overall_completed:
+            return False
+        if self.status == "completed" and not unit.is_overall_completed:
+            return False
+        if self.status == "planned" and not achievement.is_planned:
+            return False
+        if (self.reward_type is not None
+                and achievement.reward_type.code != self.reward_type):
+            return False
+        if self.points is not None and achievement.points != self.points:
+            return False
+        return True
+
+
+class SortedView():
+    """The achievements of a category kept in a sort order.
+
+    Args:
+        order (string): one of SORT_ORDERS
+    """
+
+    def __init__(self, order="catalog"):
+        self.order = order
+        # sort key of every achievement, sorted
+        self.keys = []
+        # the achievement of each key in keys
+        self.units = []
+        # maps each achievement to it's current sort key
+        self.unit_keys = {}
+
+    def __len__(self):
+        return len(self.units)
+
+    def __iter__(self):
+        return iter(self.units)
+
+    def __contains__(self, unit):
+        return unit in self.unit_keys
+
+    def index(self, unit):
+        """Returns the position of an achievement in the sort order."""
+        return bisect.bisect_left(self.keys, self.unit_keys[unit])
+
+    def add(self, unit):
+        """Adds an achievement.
+
+        Ret:
+            (int): it's position. Every achievement after it moved down one.
+        """
+        key = sort_key(unit, self.order)
+        position = bisect.bisect_left(self.keys, key)
+        self.keys.insert(position, key)
+        self.units.insert(position, unit)
+        self.unit_keys[unit] = key
+        return position
+
+    def remove(self, unit):
+        """Removes an achievement.
+
+        Ret:
+            (int): the position it was at. Every achievement after it moved
+                up one.
+        """
+        position = self.index(unit)
+        del self.keys[position]
+        del self.units[position]
+        del self.unit_keys[unit]
+        return position
+
+    def update(self, unit):
+        """Moves an achievement whose sort key might have changed.
+
+        Ret:
+            (tuple of ints): (old position, new position). Every achievement
+                between the two moved by one.
+        """
+        if sort_key(unit, self.order) == self.unit_keys[unit]:
+            position = self.index(unit)
+            return position, position
+        old_position = self.remove(unit)
+        return old_position, self.add(unit)
+
+    def set_order(self, order):
+        """Sorts every achievement in a different order."""
+        self.order = order
+        self.unit_keys = {unit: sort_key(unit, order) for unit in self.units}
+        pairs = sorted((key, unit) for unit, key in self.unit_keys.items())
+        self.keys = [key for key, _ in pairs]
+        self.units = [unit for _, unit in pairs]
@@ -0,0 +1,150 @@
+import argparse
+import json
+import sys
+
+import catalog
+from rewards import REWARD_DISPLAY_ORDER
+
+
+# **********************************************************************
+# Prints the statistics shown in the Overview without starting the GUI.
+
+# Usage:
+#   python stats_cli.py                     stats of the saved json files
+#   python stats_cli.py -p progress.json    stats of an exported progress
+#   python stats_cli.py --json              machine readable output
+#   python stats_cli.py --export out.json   export progress of json files
+
+# Only json, the catalog and the reward types are imported so that the
+# script starts quickly enough to be run over many profiles.
+# **********************************************************************
+
+
+def stats_report(stat_dict):
+    """Returns the overview statistics as a dictionary that can be
+    written as json.
+
+    Args:
+        stat_dict (dict): statistics as returned by catalog.compute_stats()
+    """
+    def totals(prefix, noun):
+        completed = stat_dict[prefix + "completed_" + noun]
+        planned = stat_dict[prefix + "planned_" + noun]
+        return {
+            "completed": completed, "planned": planned,
+            "combined": completed + planned,
+            "possible": stat_dict[prefix + "possible_" + noun]
+        }
+
+    milestone = catalog.next_milestone_info(stat_dict)
+    if milestone is not None:
+        points, amount, reward = milestone
+        milestone = {"points": points, "reward_amount": amount,
+                     "reward": reward}
+
+    return {
+        "achievements": totals("", "achievements"),
+        "points": totals("", "points"),
+        "next_milestone": milestone,
+        "categories": {
+            category: {
+                "achievements": totals(category + "_", "achievements"),
+                "points": totals(category + "_", "points")
+            }
+            for category in catalog.CATEGORIES
+        },
+        "rewards": {
+            reward: totals("", reward)
+            for reward in REWARD_DISPLAY_ORDER
+        }
+    }
+
+
+def format_report(report):
+    """Formats a report from stats_report() the way the Overview
+    displays it.
+    """
+    lines = []
+    for noun in ("achievements", "points"):
+        stats = report[noun]
+        lines.append(f"{noun.capitalize()} Completed: "
+                     + f"{stats['completed']}/{stats['possible']}")
+        lines.append(f"Planned: {stats['planned']}")
+        lines.append(f"Combined Total: {stats['combined']}/"
+                     + f"{stats['possible']}")
+        lines.append("")
+
+    milestone = report["next_milestone"]
+    if milestone is not None:
+        lines.append(f"Next Milestone: {milestone['points']} points     "
+                     + f"Reward: {milestone['reward_amount']} x "
+                     + milestone["reward"])
+    else:
+        lines.append("All milestones completed")
+    lines.append("")
+
+    lines.append("By Category")
+    lines.append(f"{'':<10}{'Achievements':<20}Points")
+    for category, stats in report["categories"].items():
+        achievements = stats["achievements"]
+        points = stats["points"]
+        lines.append(
+            f"{catalog.CATEGORY_TITLES[category]:<10}"
+            + f"{achievements['completed']} + ({achievements['planned']}) / "
+            + f"{achievements['possible']:<8}"
+            + f"{points['completed']} + ({points['planned']}) / "
+            + f"{points['possible']}"
+        )
+    lines.append("")
+
+    lines.append("Rewards")
+    for reward, stats in report["rewards"].items():
+        lines.append(f"{reward:<16}{stats['completed']} + "
+                     + f"({stats['planned']}) / {stats['possible']}")
+    lines.append("")
+    lines.append("Values in brackets are what you plan to complete")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Print PUBGM achievement statistics without the GUI."
+    )
+    parser.add_argument("--leveled", default=catalog.LEVELED_FILE,
+                        help="path to leveled_achievements.json")
+    parser.add_argument("--list", default=catalog.LIST_FILE,
+                        help="path to list_achievements.json")
+    parser.add_argument("-p", "--progress",
+                        help="read planned/completed values from a "
+                             "progress file instead of the json files")
+    parser.add_argument("--json", action="store_true",
+                        help="print statistics as json")
+    parser.add_argument("--export", metavar="FILE",
+                        help="write the progress of the json files to FILE "
+                             "instead of printing statistics")
+    args = parser.parse_args(argv)
+
+    leveled_data, list_data = catalog.load_catalog(args.leveled, args.list)
+
+    if args.export:
+        with open(args.export, 'w') as json_file:
+            json.dump(catalog.export_progress(leveled_data, list_data),
+                      json_file)
+        return 0
+
+    progress = None
+    if args.progress:
+        progress = catalog.load_progress(args.progress)
+
+    stat_dict = catalog.compute_stats(leveled_data, list_data, progress)
+    report = stats_report(stat_dict)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
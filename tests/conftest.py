@@ -0,0 +1,15 @@
+import os
+import sys
+
+
+# **********************************************************************
+# The modules in src import each other by name, as they do when the app
+# is run from src, so src is put on the path for the tests.
+
+# Only modules that don't need a display are tested. Run with:
+#   python -m pytest
+# **********************************************************************
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        os.pardir, "src")
+sys.path.insert(0, os.path.abspath(SRC_PATH))
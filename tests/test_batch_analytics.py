@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+import batch_analytics
+import catalog
+
+
+@pytest.fixture(scope="module")
+def catalog_data():
+    return catalog.load_catalog()
+
+
+def progress_of(leveled_data, list_data, value):
+    """Returns a progress dict with every level completed (value 1) or
+    none of them (value 0).
+    """
+    progress = catalog.export_progress(leveled_data, list_data)
+    for levels in progress["leveled_achievements"].values():
+        for pair in levels:
+            pair[:] = [0, value]
+    for pair in progress["list_achievements"].values():
+        pair[:] = [0, value]
+    return progress
+
+
+def write_progress(path, progress):
+    with open(path, 'w') as json_file:
+        json.dump(progress, json_file)
+    return str(path)
+
+
+def test_analyze_file_matches_compute_stats(tmp_path, catalog_data):
+    leveled_data, list_data = catalog_data
+    progress = catalog.export_progress(leveled_data, list_data)
+    file = write_progress(tmp_path / "a.json", progress)
+
+    batch_analytics.init_worker(leveled_data, list_data)
+    _, error, completed, planned, stats = batch_analytics.analyze_file(file)
+
+    stat_dict = catalog.compute_stats(leveled_data, list_data, progress)
+    assert error is None
+    assert stats["completed_points"] == stat_dict["completed_points"]
+    assert sum(completed) == stat_dict["completed_achievements"]
+    assert sum(planned) == stat_dict["planned_achievements"]
+    for category, (achievements, points) in stats["categories"].items():
+        assert achievements == \
+            stat_dict[category + "_completed_achievements"]
+        assert points == stat_dict[category + "_completed_points"]
+
+
+def test_analyze_file_reports_unreadable_files(tmp_path, catalog_data):
+    file = tmp_path / "broken.json"
+    file.write_text("{not json")
+
+    batch_analytics.init_worker(*catalog_data)
+    result = batch_analytics.analyze_file(str(file))
+
+    assert result[0] == str(file)
+    assert result[1].startswith("JSONDecodeError")
+    assert result[2:] == (None, None, None)
+
+
+def test_report_rates(tmp_path, catalog_data):
+    leveled_data, list_data = catalog_data
+    write_progress(tmp_path / "all.json",
+                   progress_of(leveled_data, list_data, 1))
+    write_progress(tmp_path / "none.json",
+                   progress_of(leveled_data, list_data, 0))
+    (tmp_path / "broken.json").write_text("[")
+
+    report = batch_analytics.run_batch(
+        [str(tmp_path)], leveled_data, list_data, processes=1).report()
+
+    assert report["files"] == 2
+    assert [error["file"] for error in report["errors"]] == \
+        [str(tmp_path / "broken.json")]
+    assert {entry["completion_rate"]
+            for entry in report["achievements"]} == {0.5}
+    for rates in report["categories"].values():
+        assert rates["achievement_completion_rate"] == 0.5
+        assert rates["points_completion_rate"] == 0.5
+    assert report["milestones"][str(catalog.FINAL_MILESTONE)] == 1
+    assert report["milestones"]["0"] == 1
+
+
+def test_worker_pool_matches_single_process(tmp_path, catalog_data):
+    leveled_data, list_data = catalog_data
+    for index in range(5):
+        progress = progress_of(leveled_data, list_data, index % 2)
+        write_progress(tmp_path / f"{index}.json", progress)
+
+    single = batch_analytics.run_batch(
+        [str(tmp_path)], leveled_data, list_data, processes=1).report()
+    pooled = batch_analytics.run_batch(
+        [str(tmp_path)], leveled_data, list_data, processes=2,
+        chunksize=2).report()
+
+    assert pooled == single
+
+
+def test_percentile():
+    assert batch_analytics.percentile([], 0.5) == 0
+    assert batch_analytics.percentile([1, 2, 3, 4], 0.5) == 3
+    assert batch_analytics.percentile([1, 2, 3, 4], 1.0) == 4
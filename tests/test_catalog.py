@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+import catalog
+import stats_cli
+from rewards import REWARD_DISPLAY_ORDER
+
+
+@pytest.fixture(scope="module")
+def catalog_data():
+    return catalog.load_catalog()
+
+
+def every_level(leveled_data, list_data):
+    """Returns (category, points) of every level in the bundled catalog,
+    read straight from the json.
+    """
+    levels = []
+    for achievement in leveled_data["leveled_achievements"]:
+        for lvl in achievement["levels"]:
+            levels.append((achievement["category"], int(lvl["points"])))
+    for achievement in list_data["list_achievements"]:
+        levels.append((achievement["category"], int(achievement["points"])))
+    return levels
+
+
+def alternating_progress(leveled_data, list_data):
+    """Returns a progress that completes every other level and plans the
+    rest.
+    """
+    progress = catalog.export_progress(leveled_data, list_data)
+    count = 0
+    for levels in progress["leveled_achievements"].values():
+        for pair in levels:
+            pair[:] = [0, 1] if count % 2 == 0 else [1, 0]
+            count += 1
+    for pair in progress["list_achievements"].values():
+        pair[:] = [0, 1] if count % 2 == 0 else [1, 0]
+        count += 1
+    return progress
+
+
+def test_possible_counts_match_the_catalog(catalog_data):
+    levels = every_level(*catalog_data)
+    stat_dict = catalog.compute_stats(*catalog_data)
+
+    assert stat_dict["possible_achievements"] == len(levels)
+    assert stat_dict["possible_points"] == sum(points for _, points in levels)
+    for category in catalog.CATEGORIES:
+        in_category = [points for cat, points in levels if cat == category]
+        assert stat_dict[category + "_possible_achievements"] == \
+            len(in_category)
+        assert stat_dict[category + "_possible_points"] == sum(in_category)
+
+
+def test_completed_and_planned_counts(catalog_data):
+    levels = every_level(*catalog_data)
+    progress = alternating_progress(*catalog_data)
+    stat_dict = catalog.compute_stats(*catalog_data, progress)
+
+    completed = levels[0::2]
+    planned = levels[1::2]
+    assert stat_dict["completed_achievements"] == len(completed)
+    assert stat_dict["planned_achievements"] == len(planned)
+    assert stat_dict["completed_points"] == \
+        sum(points for _, points in completed)
+    assert stat_dict["planned_points"] == sum(points for _, points in planned)
+
+
+def test_milestone_rewards(catalog_data):
+    stat_dict = catalog.compute_stats(*catalog_data, {})
+    assert stat_dict["completed_points"] == 0
+    # every milestone reward can be earned, none is earned yet
+    assert stat_dict["possible_bp"] >= catalog.MILESTONES["50"][0]
+    assert stat_dict["completed_bp"] == 0
+    assert catalog.next_milestone_info(stat_dict) == (50, 300, "bp")
+
+
+def test_stats_report_totals_and_percentages(catalog_data):
+    progress = alternating_progress(*catalog_data)
+    stat_dict = catalog.compute_stats(*catalog_data, progress)
+    report = stats_cli.stats_report(stat_dict)
+
+    points = report["points"]
+    assert points["combined"] == points["completed"] + points["planned"]
+    # every level is either completed or planned
+    assert points["combined"] == points["possible"]
+    assert report["achievements"]["completed"] / \
+        report["achievements"]["possible"] == pytest.approx(0.5, abs=0.01)
+    assert list(report["rewards"]) == list(REWARD_DISPLAY_ORDER)
+    assert sum(category["points"]["completed"]
+               for category in report["categories"].values()) == \
+        points["completed"]
+
+    text = stats_cli.format_report(report)
+    assert f"Points Completed: {points['completed']}/{points['possible']}" \
+        in text.splitlines()
+
+
+def test_cli_json_output(tmp_path, catalog_data, capsys):
+    progress_file = tmp_path / "progress.json"
+    progress_file.write_text(json.dumps(alternating_progress(*catalog_data)))
+
+    assert stats_cli.main(["-p", str(progress_file), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["achievements"]["possible"] == \
+        len(every_level(*catalog_data))
@@ -0,0 +1,114 @@
+from command_log import (COMPLETED, PLANNED, Change, CommandLog,
+                         make_state, merge_changes)
+
+
+def change(states, index, new, points=0):
+    """Returns the change that sets states[index] to new, and applies it
+    to states.
+    """
+    old = states[index]
+    states[index] = new
+    return Change((index,), bytes([old]), bytes([new]),
+                  {"completed_points": points} if points else {})
+
+
+def apply(states, change):
+    for index, new in zip(change.indices, change.new):
+        states[index] = new
+
+
+def test_make_state():
+    assert make_state(0, 0) == 0
+    assert make_state(1, 0) == PLANNED
+    assert make_state(1, 1) == PLANNED | COMPLETED
+
+
+def test_merge_repeated_changes_to_the_same_index():
+    states = [0, 0, 0]
+    merged = merge_changes([
+        change(states, 0, PLANNED),
+        change(states, 1, COMPLETED, 10),
+        change(states, 0, COMPLETED, 5),
+    ])
+    # index 0 goes from it's first old state to it's last new state
+    assert merged == Change((0, 1), bytes([0, 0]),
+                            bytes([COMPLETED, COMPLETED]),
+                            {"completed_points": 15})
+
+
+def test_merged_changes_that_cancel_out():
+    states = [0]
+    assert merge_changes([change(states, 0, COMPLETED, 10),
+                          change(states, 0, 0, -10)]) is None
+    states = [0, 0]
+    merged = merge_changes([change(states, 0, PLANNED),
+                            change(states, 1, PLANNED),
+                            change(states, 0, 0)])
+    assert merged.indices == (1,)
+    assert merged.stat_delta == {}
+
+
+def test_batch_is_a_single_undo_step():
+    log = CommandLog()
+    states = [0, 0, 0]
+    with log.batch():
+        for index in range(3):
+            log.record(change(states, index, COMPLETED, 10))
+        # nested batches are part of the outer one
+        with log.batch():
+            log.record(change(states, 0, PLANNED | COMPLETED))
+    assert len(log) == 1
+
+    apply(states, log.undo())
+    assert states == [0, 0, 0]
+    assert log.undo() is None
+
+
+def test_empty_batch_records_nothing():
+    log = CommandLog()
+    states = [0]
+    with log.batch():
+        log.record(change(states, 0, PLANNED))
+        log.record(change(states, 0, 0))
+    assert len(log) == 0
+
+
+def test_undo_then_redo_returns_the_original_state():
+    log = CommandLog()
+    states = [0, 0]
+    log.record(change(states, 0, PLANNED))
+    log.record(change(states, 1, COMPLETED, 20))
+    after = list(states)
+
+    undone = log.undo()
+    assert undone.stat_delta == {"completed_points": -20}
+    apply(states, undone)
+    apply(states, log.undo())
+    assert states == [0, 0]
+
+    apply(states, log.redo())
+    apply(states, log.redo())
+    assert states == after
+    assert log.redo() is None
+
+
+def test_new_change_clears_redo():
+    log = CommandLog()
+    states = [0, 0]
+    log.record(change(states, 0, PLANNED))
+    apply(states, log.undo())
+
+    log.record(change(states, 1, COMPLETED))
+    assert log.redo() is None
+    assert len(log) == 1
+
+
+def test_oldest_changes_are_dropped():
+    log = CommandLog(max_size=2)
+    states = [0, 0, 0]
+    for index in range(3):
+        log.record(change(states, index, COMPLETED))
+    assert len(log) == 2
+    assert log.undo().indices == (2,)
+    assert log.undo().indices == (1,)
+    assert log.undo() is None
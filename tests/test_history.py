@@ -0,0 +1,131 @@
+import json
+import random
+
+from history import DAY, HistoryStore
+
+
+def snapshots(count, seed=0):
+    """Returns count statistics that change a little between each."""
+    rand = random.Random(seed)
+    state = {"completed_points": 0, "completed_achievements": 0,
+             "planned_points": 0}
+    result = []
+    for _ in range(count):
+        state = dict(state)
+        key = rand.choice(sorted(state))
+        state[key] += rand.choice((-5, 5, 10))
+        result.append(state)
+    return result
+
+
+def lines(path):
+    with open(path, 'r') as history_file:
+        return [json.loads(line) for line in history_file]
+
+
+def test_round_trip_through_deltas_and_checkpoints(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    store = HistoryStore(path, checkpoint_interval=3)
+    states = snapshots(12)
+    for index, state in enumerate(states):
+        assert store.append(state, timestamp=1000 + index)
+
+    written = lines(path)
+    assert ["c" in line for line in written] == \
+        [True, False, False, False] * 3
+    # deltas only hold what changed
+    assert all(len(line["d"]) == 1 for line in written if "d" in line)
+
+    reloaded = HistoryStore(path, checkpoint_interval=3)
+    assert len(reloaded) == len(states)
+    for index, state in enumerate(states):
+        assert reloaded.state_at(1000 + index) == state
+        assert store.state_at(1000 + index) == state
+
+
+def test_unchanged_statistics_are_not_written(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    store = HistoryStore(path)
+    state = snapshots(1)[0]
+    assert store.append(state, timestamp=1)
+    assert not store.append(dict(state), timestamp=2)
+    assert len(lines(path)) == 1
+
+
+def test_damaged_lines_are_skipped(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    store = HistoryStore(path)
+    first, second = snapshots(2)
+    store.append(first, timestamp=1)
+    store.append(second, timestamp=2)
+    with open(path, 'a') as history_file:
+        # a line cut off by a crash
+        history_file.write('{"t": 3, "d": {"completed_po')
+
+    reloaded = HistoryStore(path)
+    assert len(reloaded) == 2
+    assert reloaded.last_state == second
+
+
+def test_queries_before_and_between_saves(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.jsonl"))
+    store.append({"completed_points": 100}, timestamp=10 * DAY)
+    store.append({"completed_points": 150}, timestamp=12 * DAY)
+    store.append({"completed_points": 400}, timestamp=20 * DAY)
+
+    assert store.state_at(DAY) is None
+    # before the first save the first saved value is used
+    assert store.value_at(DAY, "completed_points") == 100
+    assert store.value_at(15 * DAY, "completed_points") == 150
+    assert store.gained_since(11 * DAY, "completed_points",
+                              now=30 * DAY) == 300
+    assert store.gained_per_period(2, period=10 * DAY,
+                                   key="completed_points",
+                                   now=30 * DAY) == \
+        [(10 * DAY, 300), (20 * DAY, 0)]
+
+
+def test_append_after_a_cut_off_line(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    store = HistoryStore(path)
+    store.append({"a": 1}, timestamp=1)
+    store.append({"a": 2}, timestamp=2)
+    with open(path, 'a') as history_file:
+        history_file.write('{"t": 3, "d": {"a')
+    store.append({"a": 5}, timestamp=4)
+    store.append({"a": 7}, timestamp=5)
+
+    # the next record starts on a line of it's own, as a checkpoint
+    with open(path, 'r') as history_file:
+        written = history_file.read().splitlines()
+    assert written[3] == '{"t":4,"c":{"a":5}}'
+
+    reloaded = HistoryStore(path)
+    assert len(reloaded) == 4
+    assert reloaded.state_at(2) == {"a": 2}
+    assert reloaded.state_at(4) == {"a": 5}
+    assert reloaded.state_at(5) == {"a": 7}
+
+
+def test_deltas_after_a_damaged_line_wait_for_a_checkpoint(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"t":1,"c":{"a":1}}\n'
+                    '{"t":2,"d":{"a"\n'
+                    '{"t":3,"d":{"a":1}}\n'
+                    '{"t":4,"c":{"a":10}}\n'
+                    '{"t":5,"d":{"a":1}}\n')
+
+    store = HistoryStore(str(path))
+    # the delta at 3 can't be applied without the one before it
+    assert store.state_at(3) == {"a": 1}
+    assert store.state_at(5) == {"a": 11}
+
+
+def test_first_append_after_loading_damage_is_a_checkpoint(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"t":1,"c":{"a":1}}\n{"t":2,"d":{"a"\n')
+
+    store = HistoryStore(str(path))
+    store.append({"a": 4}, timestamp=3)
+    assert path.read_text().splitlines()[-1] == '{"t":3,"c":{"a":4}}'
+    assert HistoryStore(str(path)).state_at(3) == {"a": 4}
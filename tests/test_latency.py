@@ -0,0 +1,71 @@
+import pytest
+
+from latency import TRACE_ENV, LatencyTrace, percentile, tracing_enabled
+
+
+class FakeClock():
+    """A clock that only moves when told to, in seconds."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def trace(latency, clock, action, ms):
+    token = latency.start(action)
+    clock.now += ms / 1000
+    return latency.finish(token)
+
+
+def test_ring_buffer_wraps():
+    clock = FakeClock()
+    latency = LatencyTrace(size=3, clock=clock)
+    for ms in (10, 20, 30, 40, 50):
+        trace(latency, clock, "click", ms)
+
+    # the two oldest were dropped
+    assert [sample.ms for sample in latency.samples] == \
+        pytest.approx([30, 40, 50])
+    summary = latency.summary()
+    assert summary["click"]["count"] == 3
+    assert summary["click"]["max"] == pytest.approx(50)
+
+
+def test_summary_percentiles_and_order():
+    clock = FakeClock()
+    latency = LatencyTrace(clock=clock)
+    for ms in range(1, 101):
+        trace(latency, clock, "category", ms)
+    trace(latency, clock, "save", 500)
+
+    summary = latency.summary()
+    # slowest action first
+    assert list(summary) == ["save", "category"]
+    assert summary["category"]["p50"] == pytest.approx(50)
+    assert summary["category"]["p90"] == pytest.approx(90)
+    assert summary["category"]["p99"] == pytest.approx(99)
+
+
+def test_format_summary():
+    clock = FakeClock()
+    latency = LatencyTrace(clock=clock)
+    assert "no interactions traced" in latency.format_summary()
+    trace(latency, clock, "main_menu.overview", 12.5)
+    lines = latency.format_summary().splitlines()
+    assert lines[1].startswith("main_menu.overview")
+    assert lines[1].rstrip().endswith("12.5")
+
+
+def test_percentile_uses_nearest_rank():
+    assert percentile([5], 99) == 5
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 51) == 3
+    assert percentile([1, 2, 3, 4], 0) == 1
+
+
+def test_tracing_enabled():
+    assert not tracing_enabled({})
+    assert not tracing_enabled({TRACE_ENV: "0"})
+    assert tracing_enabled({TRACE_ENV: "1"})
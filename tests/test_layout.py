@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from PIL import Image
+
+from layout import (ACHIEVEMENTS_LAYOUT, MAIN_MENU_LAYOUT, OVERVIEW_LAYOUT,
+                    HitGrid, button_box)
+
+BUTTONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            os.pardir, "images", "buttons")
+
+# Window size used by main.py
+WINDOW_W = 1366 - 16
+WINDOW_H = 625
+
+# The click ranges (left, top, right, bottom) that were written by hand
+# in each frame's on_click() before the layouts, by button name
+BASELINE_BOXES = {
+    "MAIN_MENU_LAYOUT": {
+        "overview": (75, 240, 245, 285),
+        "achievements": (75, 340, 305, 385),
+        "completed": (75, 440, 245, 485),
+        "save": (1120, 40, 1200, 85),
+        "exit": (1230, 40, 1290, 85),
+    },
+    "OVERVIEW_LAYOUT": {
+        "back": (75, 40, 150, 85),
+    },
+    "ACHIEVEMENTS_LAYOUT": {
+        "back": (80, 40, 155, 85),
+        "save": (1120, 40, 1200, 85),
+        "GM": (900, 90, 1100, 120),
+        "matches": (900, 155, 1000, 185),
+        "honor": (900, 225, 975, 255),
+        "progress": (900, 295, 1010, 325),
+        "items": (900, 365, 965, 395),
+        "social": (900, 435, 975, 465),
+        "general": (900, 505, 995, 535),
+    },
+}
+
+LAYOUTS = {
+    "MAIN_MENU_LAYOUT": MAIN_MENU_LAYOUT,
+    "OVERVIEW_LAYOUT": OVERVIEW_LAYOUT,
+    "ACHIEVEMENTS_LAYOUT": ACHIEVEMENTS_LAYOUT,
+}
+
+# Pixels a generated box may differ from the hand-written one by. The
+# hand-written ranges were estimated, the boxes are the sprites' sizes.
+TOLERANCE = 6
+
+
+def layout_boxes(layout):
+    """Returns (button, box) for every button of a layout, sized the way
+    compose_layout() sizes the sprites.
+    """
+    boxes = []
+    for button in layout.buttons:
+        img = Image.open(os.path.join(BUTTONS_PATH, button.sprite + ".png"))
+        img.thumbnail(button.size, Image.BICUBIC)
+        boxes.append((button, button_box(button, img.size)))
+    return boxes
+
+
+@pytest.mark.parametrize("name", sorted(LAYOUTS))
+def test_boxes_match_baseline(name):
+    boxes = layout_boxes(LAYOUTS[name])
+    grid = HitGrid(boxes, WINDOW_W, WINDOW_H)
+    baseline = BASELINE_BOXES[name]
+    assert sorted(button.name for button, _ in boxes) == sorted(baseline)
+
+    for button, box in boxes:
+        left, top, right, bottom = baseline[button.name]
+        # the middle of every hand-written range finds the same button
+        found = grid.find((left + right) // 2, (top + bottom) // 2)
+        assert found is button
+        for edge, expected in zip(box, baseline[button.name]):
+            assert abs(edge - expected) <= TOLERANCE, button.name
+
+
+@pytest.mark.parametrize("name", sorted(LAYOUTS))
+def test_edges(name):
+    boxes = layout_boxes(LAYOUTS[name])
+    grid = HitGrid(boxes, WINDOW_W, WINDOW_H)
+    for button, (left, top, right, bottom) in boxes:
+        # boxes are inclusive
+        for x, y in ((left, top), (right, top), (left, bottom),
+                     (right, bottom), ((left + right) // 2, top)):
+            assert grid.find(x, y) is button
+        # one pixel outside each edge is outside every box
+        for x, y in ((left - 1, top), (right + 1, top),
+                     (left, top - 1), (left, bottom + 1)):
+            assert grid.find(x, y) is None
+
+
+def test_outside_every_box():
+    grid = HitGrid(layout_boxes(MAIN_MENU_LAYOUT), WINDOW_W, WINDOW_H)
+    assert grid.find(0, 0) is None
+    assert grid.find(700, 600) is None
+    # points off the window
+    assert grid.find(-5, 250) is None
+    assert grid.find(WINDOW_W + 100, 50) is None
+    assert grid.find(100, WINDOW_H + 100) is None
+
+
+def test_boxes_partly_off_the_window():
+    grid = HitGrid([("a", (-20, -20, 10, 10)), ("b", (40, 0, 60, 10))],
+                   100, 50, cell_size=16)
+    assert grid.find(0, 0) == "a"
+    assert grid.find(10, 10) == "a"
+    assert grid.find(11, 10) is None
+    assert grid.find(40, 5) == "b"
@@ -0,0 +1,105 @@
+import itertools
+import random
+
+import pytest
+
+import catalog
+from milestone_planner import (PlanItem, chains_from_catalog, leveled_chain,
+                               plan_milestone, task_count)
+
+
+def brute_force(chains, points_needed, cost_type, weights):
+    """Returns the lowest cost of any picks that award points_needed, by
+    trying the first 0, 1, ... items of every chain. None if no picks do.
+    """
+    best = None
+    for counts in itertools.product(*(range(len(chain) + 1)
+                                      for chain in chains)):
+        items = [item for chain, count in zip(chains, counts)
+                 for item in chain[:count]]
+        if sum(item.points for item in items) < points_needed:
+            continue
+        if cost_type == "levels":
+            cost = len(items)
+        elif cost_type == "tasks":
+            cost = sum(item.tasks for item in items)
+        else:
+            cost = sum(weights.get(item.title, 1) for item in items)
+        if best is None or cost < best:
+            best = cost
+    return best
+
+
+def random_chains(rand):
+    chains = []
+    for g in range(rand.randint(0, 5)):
+        chains.append([
+            PlanItem(f"a{g}", str(level + 1),
+                     rand.choice(catalog.POINT_VALUES),
+                     rand.randint(1, 9), None)
+            for level in range(rand.randint(1, 4))
+        ])
+    return chains
+
+
+@pytest.mark.parametrize("cost_type", ("levels", "tasks", "weights"))
+def test_plan_matches_brute_force(cost_type):
+    rand = random.Random(cost_type)
+    for _ in range(300):
+        chains = random_chains(rand)
+        weights = {f"a{g}": rand.randint(0, 6) for g in range(5)}
+        points_needed = rand.randint(1, 250)
+
+        plan = plan_milestone(chains, points_needed, cost_type, weights)
+        expected = brute_force(chains, points_needed, cost_type, weights)
+
+        if expected is None:
+            assert plan is None
+            continue
+        assert plan.cost == expected
+        assert plan.points >= points_needed
+        assert plan.points == sum(item.points for item in plan.items)
+        # picked items are the first levels of their chains
+        for chain in chains:
+            picked = [item for item in plan.items if item in chain]
+            assert picked == chain[:len(picked)]
+
+
+def test_nothing_needed():
+    assert plan_milestone([], 0) == ([], 0, 0)
+
+
+def test_unknown_cost_type():
+    with pytest.raises(ValueError):
+        plan_milestone([], 10, "minutes")
+
+
+def test_full_catalog_is_reachable():
+    leveled_data, list_data = catalog.load_catalog()
+    progress = catalog.export_progress(leveled_data, list_data)
+    for levels in progress["leveled_achievements"].values():
+        for pair in levels:
+            pair[:] = [0, 0]
+    for pair in progress["list_achievements"].values():
+        pair[:] = [0, 0]
+    chains = chains_from_catalog(leveled_data, list_data, progress)
+    total = sum(item.points for chain in chains for item in chain)
+
+    plan = plan_milestone(chains, total)
+    assert plan.points == total
+    assert plan.cost == sum(len(chain) for chain in chains)
+    assert plan_milestone(chains, total + 5) is None
+
+
+def test_leveled_chain_starts_after_last_completed_level():
+    levels = [("I", "10", 5, 1, None), ("II", "30", 10, 1, None),
+              ("III", "100", 15, 0, None), ("IV", "Diamond I", 20, 0, None)]
+    chain = leveled_chain("Tasks", levels)
+    assert [(item.level, item.tasks) for item in chain] == \
+        [("III", 70), ("IV", 1)]
+
+
+def test_task_count():
+    assert task_count("1,000") == 1000
+    assert task_count("Get a rating of S or above 5 times") == 5
+    assert task_count("Diamond I") is None
@@ -0,0 +1,49 @@
+import sys
+
+import pytest
+
+import rewards
+from rewards import (REWARD_DISPLAY_ORDER, REWARD_TYPES, get_reward_type,
+                     registry)
+
+
+def test_unknown_reward_type():
+    with pytest.raises(ValueError, match="'hat'"):
+        get_reward_type("party_hat")
+    # unknown rewards aren't remembered
+    assert "party_hat" not in rewards.reward_types
+
+
+def test_reward_names_are_parsed_once():
+    outfit = get_reward_type("mechanic_shirt_outfit")
+    assert outfit is registry["outfit"]
+    assert get_reward_type("mechanic_shirt_outfit") is outfit
+    assert get_reward_type("premium-crate") is registry["premium-crate"]
+
+
+def test_registry_is_in_display_order():
+    assert tuple(registry) == REWARD_DISPLAY_ORDER
+    assert set(REWARD_TYPES) == set(REWARD_DISPLAY_ORDER)
+    assert [reward_type.code for reward_type in registry.values()] == \
+        list(REWARD_DISPLAY_ORDER)
+
+
+def test_keys_are_interned():
+    for code, reward_type in registry.items():
+        # built at runtime, so only the same object if it's interned
+        built = "".join(["completed_", code])
+        assert reward_type.completed_key is sys.intern(built)
+        assert reward_type.planned_key is sys.intern("planned_" + code)
+        assert reward_type.possible_key is sys.intern("possible_" + code)
+        assert reward_type.code is sys.intern("".join([code]))
+
+    get_reward_type("plague_carrier_outfit")
+    name = next(key for key in rewards.reward_types
+                if key == "plague_carrier_outfit")
+    assert name is sys.intern("_".join(["plague", "carrier", "outfit"]))
+
+
+def test_labels():
+    assert registry["misc"].label == "miscellaneous"
+    assert registry["bp"].label == "bp"
+    assert registry["outfit"].icon == "outfit.png"
@@ -0,0 +1,78 @@
+import collections
+import types
+
+from model import LeveledAttributes
+from search import PREFIX_CACHE_SIZE, SearchIndex, tokenize
+
+# stands in for a ListAchievement, with only the text that is searched
+ListUnit = collections.namedtuple(
+    "ListUnit", ("title", "desc", "info", "task_list"))
+
+
+def leveled_unit(title, info, descs):
+    unit = LeveledAttributes("matches", title, descs[0], info, 0)
+    for desc in descs:
+        unit.levels.append(
+            types.SimpleNamespace(text=types.SimpleNamespace(desc=desc)))
+    return unit
+
+
+def make_index():
+    units = [
+        leveled_unit("Grenadier", "Throw grenades",
+                     ["Kill 10 enemies with grenades",
+                      "Kill 100 enemies with grenades"]),
+        ListUnit("Unique Destiny", "Obtain every title",
+                 "Titles come from events", ["Ace", "Conqueror"]),
+        ListUnit("Green Thumb", "Plant a tree in Erangel", "",
+                 ["Erangel"]),
+    ]
+    index = SearchIndex()
+    # added a few at a time, the way the GUI builds the index
+    index.add(units[:1])
+    index.add(units[1:])
+    return index, units
+
+
+def test_tokenize():
+    assert tokenize("Kill 1,000 Enemies!") == ["kill", "1", "000",
+                                               "enemies"]
+
+
+def test_prefix_hits():
+    index, (grenadier, destiny, thumb) = make_index()
+    assert index.search("gre") == [grenadier, thumb]
+    assert index.search("gren") == [grenadier]
+    assert index.search("green") == [thumb]
+    # descriptions of later levels are searched too
+    assert index.search("100") == [grenadier]
+    # task lists of list achievements are searched
+    assert index.search("conq") == [destiny]
+
+
+def test_every_word_has_to_match():
+    index, (grenadier, destiny, thumb) = make_index()
+    assert index.search("erangel tree") == [thumb]
+    assert index.search("GRE  plant") == [thumb]
+    assert index.search("grenades ace") == []
+
+
+def test_empty_query_returns_everything():
+    index, units = make_index()
+    assert index.search("  !? ") == units
+
+
+def test_only_added_achievements_are_found():
+    index = SearchIndex()
+    assert index.search("ace") == []
+    unit = ListUnit("Ace", "", "", [])
+    index.add([unit])
+    # the cached result of the previous search is dropped
+    assert index.search("ace") == [unit]
+
+
+def test_prefix_cache_is_bounded():
+    index, _ = make_index()
+    for length in range(PREFIX_CACHE_SIZE + 10):
+        index.search("x" * (length + 1))
+    assert len(index.prefix_cache) == PREFIX_CACHE_SIZE
@@ -0,0 +1,128 @@
+import collections
+import random
+
+import pytest
+
+from sort_filter import SORT_ORDERS, STATUSES, SortedView, ViewFilter
+
+RewardType = collections.namedtuple("RewardType", ("code",))
+
+
+class Unit():
+    """Stands in for a ListAchievement, with only what is sorted and
+    filtered by.
+    """
+
+    def __init__(self, list_index, points, reward, reward_amount,
+                 is_planned=0, is_completed=0):
+        self.list_index = list_index
+        self.points = points
+        self.reward_type = RewardType(reward)
+        self.reward_amount = reward_amount
+        self.is_planned = is_planned
+        self.is_completed = is_completed
+
+    @property
+    def is_overall_completed(self):
+        return self.is_completed == 1
+
+    def __repr__(self):
+        return f"Unit({self.list_index})"
+
+
+def make_units():
+    return [
+        Unit(0, 10, "bp", 500),
+        Unit(1, 50, "outfit", 1, is_planned=1),
+        Unit(2, 10, "silver", 20, is_completed=1),
+        Unit(3, 30, "bp", 1000, is_planned=1),
+        Unit(4, 50, "title", 1, is_completed=1),
+    ]
+
+
+def shown(view_filter, units):
+    return [unit.list_index for unit in units if view_filter.matches(unit)]
+
+
+def test_status_membership():
+    units = make_units()
+    assert shown(ViewFilter("uncompleted"), units) == [0, 1, 3]
+    assert shown(ViewFilter("completed"), units) == [2, 4]
+    assert shown(ViewFilter("planned"), units) == [1, 3]
+    assert shown(ViewFilter("all"), units) == [0, 1, 2, 3, 4]
+
+
+def test_filters_combine():
+    units = make_units()
+    assert shown(ViewFilter("all", reward_type="bp"), units) == [0, 3]
+    assert shown(ViewFilter("all", points=50), units) == [1, 4]
+    assert shown(ViewFilter("uncompleted", points=50), units) == [1]
+    assert shown(ViewFilter("completed", "bp"), units) == []
+
+
+def test_unknown_status():
+    with pytest.raises(ValueError):
+        ViewFilter("hidden")
+    assert set(STATUSES) == {"uncompleted", "completed", "planned", "all"}
+
+
+@pytest.mark.parametrize("order, expected", (
+    ("catalog", [0, 1, 2, 3, 4]),
+    ("points", [1, 4, 3, 0, 2]),
+    ("reward", [3, 0, 2, 4, 1]),
+    ("amount", [3, 0, 2, 1, 4]),
+    ("planned", [1, 3, 0, 2, 4]),
+    ("remaining", [2, 4, 0, 1, 3]),
+))
+def test_sort_orders(order, expected):
+    view = SortedView(order)
+    units = make_units()
+    for unit in reversed(units):
+        view.add(unit)
+    assert [unit.list_index for unit in view] == expected
+    for position, unit in enumerate(view):
+        assert view.index(unit) == position
+
+
+def test_every_order_is_listed():
+    view = SortedView()
+    for unit in make_units():
+        view.add(unit)
+    for order in SORT_ORDERS:
+        view.set_order(order)
+        assert len(view) == 5
+
+
+def test_update_moves_one_achievement():
+    view = SortedView("points")
+    units = make_units()
+    for unit in units:
+        view.add(unit)
+
+    units[0].points = 60
+    assert view.update(units[0]) == (3, 0)
+    assert [unit.list_index for unit in view] == [0, 1, 4, 3, 2]
+    # nothing moves if the key didn't change
+    assert view.update(units[2]) == (4, 4)
+
+
+def test_membership_after_random_updates():
+    rand = random.Random(0)
+    units = [Unit(index, rand.choice((5, 10, 20)), "bp", 1)
+             for index in range(50)]
+    view = SortedView("points")
+    for unit in units:
+        view.add(unit)
+    for _ in range(200):
+        unit = rand.choice(units)
+        if unit in view and rand.random() < 0.2:
+            view.remove(unit)
+        elif unit in view:
+            unit.points = rand.choice((5, 10, 20))
+            view.update(unit)
+        else:
+            view.add(unit)
+
+    expected = sorted((unit for unit in units if unit in view),
+                      key=lambda unit: (-unit.points, unit.list_index))
+    assert list(view) == expected